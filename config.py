@@ -15,6 +15,9 @@ PARTS_PATH = APP_PATH / "parts"
 ZERO_PATH = APP_PATH / "zero" / "zero.xlsx"
 FINAL_OUTPUT_PATH = OUTPUT_PATH + "\\" + "final.csv"
 PH_FORM_TEMPLATE_PATH = APP_PATH / "ph_template.xlsx"
+# Μόνιμο αρχείο δειγμάτων (SQLite) όλων των εκτελέσεων· δίπλα στα δεδομένα εξόδου,
+# όχι μέσα στον φάκελο του κώδικα
+ARCHIVE_PATH = Path(OUTPUT_PATH) / "archive" / "samples.sqlite"
 
 ZERO_REMOTE_URL = (
     "https://qhlpulnlyvarhmckbelq.supabase.co/"
@@ -41,7 +44,21 @@ COLS_TO_DELETE = ["syal", "som cells", "water", "omx", "antibiotics"]
 # Αφαίρεση γραμμών με μηδενικά nutrients
 DROP_ZERO_NUTRIENTS = True
 
-# Μετονομασίες στηλών
+# Αποθήκευση nutrients ως ακέραιοι (Int32 εκατοστά / δεκάκις χιλιοστά) αντί για float
+FIXED_POINT_NUTRIENTS = False
+
+# Καταγραφή των QC παρατηρήσεων (εκτός ορίων τιμές) στη στήλη Remark
+QC_WRITE_REMARKS = False
+
+# Καταχώρηση κάθε εκτέλεσης στο αρχείο δειγμάτων (ARCHIVE_PATH)
+ARCHIVE_SAMPLES = True
+
+# Προφίλ μνήμης ανά στάδιο (tracemalloc + peak RSS) με αναφορά στο gui/memory_profiles·
+# επιβραδύνει την επεξεργασία, μόνο για διάγνωση
+MEMORY_PROFILE = False
+
+# Μετονομασίες στηλών (επιπλέον aliases· χωρίς διάκριση πεζών/κεφαλαίων και κενών,
+# οι βασικές παραλλαγές υπάρχουν ήδη στο modules/columns.py)
 COLUMN_RENAMES = {
     'proteine': 'Protein',
     'fat': 'Fat',
@@ -54,7 +71,7 @@ COLUMN_RENAMES = {
 # ΠΑΡΑΜΕΤΡΟΙ ΧΡΟΝΙΣΜΟΥ
 # ============================================================
 
-BATCH_SIZE = 87
+BATCH_SIZE = 87  # Γραμμές ανά batch μαζί με την επικεφαλίδα (BATCH_SIZE - 1 δείγματα)
 T_SAMPLE_INCREMENT = 45
 T_ZERO_INCREMENT = 20
 ZERO_BLOCK_ROWS = 8  # Γραμμές ανά zero block
@@ -67,6 +84,10 @@ ZERO_ROW_INDEX = [1, 2, 3, 4, 5, 6, 7, 9]  # Indices για update timestamps
 DEFAULT_PRODUCT = "AIG NEWXX"
 DEFAULT_TIME = "11:00"
 DEFAULT_REP = 1
+# Ημερομηνία ανάλυσης για εκτελέσεις χωρίς χρήστη (watcher, batch, υπηρεσία) όταν δεν
+# δίνεται --date: "DD-MM", "today", "protocol" (τα ψηφία DDMM του πρωτοκόλλου) ή ""
+# (καμία προεπιλογή: η ημερομηνία πρέπει να δίνεται ρητά)
+DEFAULT_DATE = ""
 
 # ============================================================
 # ΣΕΙΡΑ ΣΤΗΛΩΝ ΓΙΑ ΤΕΛΙΚΟ OUTPUT
@@ -77,6 +98,22 @@ TARGET_COLUMN_ORDER = [
     'Lactose', 'FPD', 'TS', 'SNF', 'Date', 'Time', 'Remark'
 ]
 
+# Διάλεκτος τελικού CSV ανά όργανο-στόχο (modules/dialect.py):
+# "default" (η ιστορική μορφή), "dot" (παντού "." και CRLF), "comma" (";" και "," και CRLF)
+OUTPUT_DIALECT = "default"
+
+# Εγγραφή και .xlsx (ίδιες γραμμές με το CSV, αριθμητικά κελιά) δίπλα στο τελικό CSV
+OUTPUT_XLSX = False
+
+# Απόδοση του τελικού CSV στη μνήμη με ένα πέρασμα ανά στήλη (ίδια bytes με τη ροή
+# των part files, χωρίς τα ενδιάμεσα αρχεία)· False: parts στο PARTS_PATH και συναρμολόγηση
+OUTPUT_IN_MEMORY = True
+
+# Processes για την απόδοση του τελικού CSV στη μνήμη (OUTPUT_IN_MEMORY). 1: σειριακά.
+# Με > 1 κάθε process αποδίδει ένα συνεχές εύρος batches, μόνο σε αρχεία με
+# τουλάχιστον 20.000 γραμμές· δεν έχει μετρηθεί ακόμη σε μηχάνημα με πολλούς πυρήνες
+RENDER_WORKERS = 1
+
 # ============================================================
 # ΠΑΡΑΜΕΤΡΟΙ GUI
 # ============================================================
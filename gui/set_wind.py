@@ -47,7 +47,7 @@ class SettingsWindow:
 
         tk.Label(
             header,
-            text="Επεξεργασία config.",
+            text="Επεξεργασία ρυθμίσεων (settings.json).",
             font=("Segoe UI", 9),
             bg='#3498db',
             fg='white'
@@ -139,8 +139,8 @@ class SettingsWindow:
 
         ttk.Button(
             button_frame,
-            text="💾 Αποθήκευση & Επανεκκίνηση",
-            command=self._save_and_restart
+            text="💾 Αποθήκευση",
+            command=self._save
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
@@ -187,8 +187,8 @@ class SettingsWindow:
 
         messagebox.showinfo("Επιτυχία", "Οι ρυθμίσεις επαναφορτώθηκαν!")
 
-    def _save_and_restart(self):
-        """Αποθήκευση και επανεκκίνηση"""
+    def _save(self):
+        """Αποθήκευση (εφαρμόζεται από την επόμενη εκτέλεση, χωρίς επανεκκίνηση)"""
         # Validation
         try:
             datetime.strptime(self.default_time_var.get(), "%H:%M")
@@ -203,7 +203,7 @@ class SettingsWindow:
         # Confirm
         response = messagebox.askyesno(
             "Επιβεβαίωση",
-            "Αποθήκευση αλλαγών και επανεκκίνηση εφαρμογής;"
+            "Αποθήκευση αλλαγών;"
         )
 
         if not response:
@@ -224,12 +224,13 @@ class SettingsWindow:
 
         try:
             if self.config_editor.save_config(new_values):
-                messagebox.showinfo("Επιτυχία", "Οι ρυθμίσεις αποθηκεύτηκαν!\n\nΗ εφαρμογή θα επανεκκινηθεί.")
+                messagebox.showinfo(
+                    "Επιτυχία",
+                    "Οι ρυθμίσεις αποθηκεύτηκαν!\n\nΕφαρμόζονται από την επόμενη επεξεργασία."
+                )
                 self.window.destroy()
-
-                # Restart
-                python = sys.executable
-                os.execl(python, python, *sys.argv)
+            else:
+                messagebox.showerror("Σφάλμα", "Αποτυχία αποθήκευσης ρυθμίσεων! Ελέγξτε τις τιμές.")
         except Exception as e:
             messagebox.showerror("Σφάλμα", f"Αποτυχία αποθήκευσης ρυθμίσεων!: {e}")
 
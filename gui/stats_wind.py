@@ -53,6 +53,19 @@ class UsageStatsWindow:
 
         summary = self.telemetry.get_summary()
 
+        if summary['memory_runs']:
+            avg_kb = summary['memory_kb_per_sample_avg']
+            memory_text = (
+                f"   • Εκτελέσεις με προφίλ: {summary['memory_runs']}\n"
+                f"   • Μνήμη/δείγμα: {avg_kb:.1f} KB (μέσος), "
+                f"{summary['memory_kb_per_sample_max']:.1f} KB (μέγιστος)\n"
+                f"   • Peak εκτέλεσης: {summary['memory_peak_mb_max']:.1f} MB "
+                f"(RSS έως {summary['memory_rss_peak_mb_max']:.0f} MB)\n"
+                f"   • Εκτίμηση για 1000 δείγματα: ~{avg_kb * 1000 / 1024:.0f} MB ανά worker"
+            )
+        else:
+            memory_text = "   • Χωρίς δεδομένα (ενεργοποιήστε MEMORY_PROFILE στο config.py)"
+
         stats_text = f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║                    ΣΤΑΤΙΣΤΙΚΑ ΧΡΗΣΗΣ                             ║
@@ -73,6 +86,9 @@ class UsageStatsWindow:
 ⚠️ ERRORS:
    • Πρόσφατα Σφάλματα: {summary['recent_errors']}
 
+🧠 ΜΝΗΜΗ:
+{memory_text}
+
 ╔══════════════════════════════════════════════════════════════════╗
 ℹ️  Τα δεδομένα αποθηκεύονται τοπικά για maintenance purposes
 ╚══════════════════════════════════════════════════════════════════╝
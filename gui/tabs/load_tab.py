@@ -7,13 +7,13 @@ from tkinter import ttk, messagebox, filedialog, scrolledtext
 import os
 import sys
 import re
-import pandas as pd
 
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from modules.data_loader import DataLoader
+# Διάστημα ελέγχου για την απάντηση της cache προφόρτωσης του worker
+TAKE_POLL_MS = 50
 
 
 class LoadTab:
@@ -27,6 +27,8 @@ class LoadTab:
         """
         self.app = app_reference
         self.frame = ttk.Frame(parent, padding="20")
+        # Token του αιτήματος προς την cache προφόρτωσης που περιμένει απάντηση
+        self._pending_take = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -39,8 +41,12 @@ class LoadTab:
             row=0, column=0, sticky=tk.W, pady=5
         )
 
-        self.protocol_entry = ttk.Entry(file_frame, width=30, font=("Consolas", 10))
+        # Combobox: οι προτάσεις autocomplete έρχονται από τον κατάλογο του BASE_PATH
+        self.protocol_entry = ttk.Combobox(file_frame, width=28, font=("Consolas", 10))
         self.protocol_entry.grid(row=0, column=1, padx=10, pady=5)
+        self.protocol_entry.bind("<KeyRelease>", self._on_protocol_typed)
+        self.protocol_entry.bind("<FocusIn>", lambda _e: self._get_catalog().refresh_async())
+        self.protocol_entry.bind("<Return>", lambda _e: self.load_file())
 
         ttk.Button(file_frame, text="📥 Φόρτωση", command=self.load_file).grid(
             row=0, column=2, padx=5
@@ -50,6 +56,14 @@ class LoadTab:
             row=0, column=3, padx=5
         )
 
+        ttk.Button(file_frame, text="🧩 Συγχώνευση", command=self.merge_files).grid(
+            row=0, column=4, padx=5
+        )
+
+        ttk.Button(file_frame, text="🩺 Έλεγχος", command=self.preflight_file).grid(
+            row=0, column=5, padx=5
+        )
+
         # File info
         info_frame = ttk.LabelFrame(self.frame, text="Πληροφορίες Αρχείου", padding="10")
         info_frame.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -59,25 +73,45 @@ class LoadTab:
         )
         self.file_info_text.pack(fill=tk.BOTH, expand=True)
 
-    def load_file(self):
-        """Φόρτωση αρχείου"""
+    def _get_catalog(self):
+        """Ο κατάλογος αρχείων του BASE_PATH (κοινός με τον DataLoader)"""
+        from modules.catalog import get_catalog
+        return get_catalog()
+
+    def _on_protocol_typed(self, event):
+        """Ενημέρωση προτάσεων με βάση το πρόθεμα (χωρίς I/O στο Tk thread)"""
+        if event.keysym in ("Return", "Up", "Down", "Escape", "Tab"):
+            return
+        catalog = self._get_catalog()
+        catalog.refresh_async()
+        self.protocol_entry["values"] = catalog.complete(self.protocol_entry.get(), limit=30)
+
+    def load_file(self, excel_file: str = None):
+        """
+        Φόρτωση αρχείου
+
+        Args:
+            excel_file: Συγκεκριμένο αρχείο (από τον διάλογο)· αλλιώς αναζήτηση στον κατάλογο
+        """
         protocol = self.protocol_entry.get().strip()
         if not protocol:
             messagebox.showwarning("Προειδοποίηση", "Εισάγετε αριθμό πρωτοκόλλου")
             return
 
         try:
+            # Lazy import: pandas φορτώνεται στην πρώτη φόρτωση, όχι στην εκκίνηση
+            from modules.data_loader import DataLoader
+
             loader = DataLoader()
-            try:
-                excel_file = os.path.join(loader.base_path, f"{protocol}.xls")
-                if not os.path.exists(excel_file):
-                    messagebox.showinfo("Σφάλμα", f"Το αρχείο δεν είναι .xls: {excel_file}")
-                    excel_file = os.path.join(loader.base_path, f"{protocol}.xlsx")
-                    if not os.path.exists(excel_file):
-                        messagebox.showerror("Σφάλμα", f"Το αρχείο δεν βρέθηκε .xls: {excel_file}")
-                        return
-            except Exception as e:
-                print(f'Exception : {e} (try to open find excel_file)')
+            # Αναζήτηση στον κατάλογο (.xls πριν από .xlsx) αντί για os.path.exists ανά επέκταση
+            excel_file = excel_file or loader.find_file(protocol)
+            if excel_file is None:
+                suggestions = loader.catalog.complete(protocol[:4], limit=5)
+                hint = f"\n\nΠαρόμοια: {', '.join(suggestions)}" if suggestions else ""
+                messagebox.showerror(
+                    "Σφάλμα", f"Το αρχείο δεν βρέθηκε: {protocol}.xls / .xlsx στο {loader.base_path}{hint}"
+                )
+                return
 
             self.app.protocol_number = protocol.strip()
 
@@ -88,43 +122,155 @@ class LoadTab:
                 messagebox.showerror("Σφάλμα", "Μη έγκυρος αριθμός πρωτοκόλλου")
                 return
 
-            # Load data
-            self.app.excel_df = pd.read_excel(excel_file)
-            self.app.csv_first_4 = protocol[:4]
-            self.app.dash_part = result.group()
+            # Load data: πρώτα ζητείται από την cache προφόρτωσης του worker και η απάντηση
+            # έρχεται μέσω after, χωρίς να μπλοκάρει το Tk loop· σε miss διαβάζεται εδώ
+            worker = self.app.get_worker()
+            if self._pending_take is not None:
+                worker.abandon_prefetched(self._pending_take)
+            self._pending_take = worker.request_prefetched(excel_file)
+            if self._pending_take is None:
+                self._show_loaded(loader.read(excel_file), excel_file, protocol, result.group())
+            else:
+                self._await_prefetched(self._pending_take, loader, excel_file, protocol, result.group())
 
-            # Display info
-            info = f"""
-Αρχείο: {protocol}.xls
+        except Exception as e:
+            self._load_failed(e)
+
+    def _await_prefetched(self, token, loader, excel_file, protocol, dash_part):
+        """Ελέγχει (μέσω after) για το DataFrame του worker· σε miss διαβάζει το αρχείο"""
+        if token != self._pending_take:
+            return  # ο χρήστης ξεκίνησε άλλη φόρτωση
+        done, excel_df = self.app.get_worker().prefetched_frame(token)
+        if not done:
+            self.app.root.after(TAKE_POLL_MS, self._await_prefetched,
+                                token, loader, excel_file, protocol, dash_part)
+            return
+        self._pending_take = None
+        try:
+            if excel_df is not None:
+                self.app.logger.info(f"⚡ {os.path.basename(excel_file)} από την cache προφόρτωσης")
+            else:
+                excel_df = loader.read(excel_file)
+            self._show_loaded(excel_df, excel_file, protocol, dash_part)
+        except Exception as e:
+            self._load_failed(e)
+
+    def _show_loaded(self, excel_df, excel_file, protocol, dash_part):
+        """Αποθηκεύει το φορτωμένο DataFrame στην εφαρμογή και εμφανίζει τις πληροφορίες του"""
+        self.app.excel_df = excel_df
+        self.app.csv_first_4 = protocol[:4]
+        self.app.dash_part = dash_part
+
+        # Display info
+        info = f"""
+Αρχείο: {os.path.basename(excel_file)}
 Γραμμές: {len(self.app.excel_df)}
 Στήλες: {', '.join(self.app.excel_df.columns.tolist())}
-            """
+        """
+
+        self.file_info_text.config(state=tk.NORMAL)
+        self.file_info_text.delete(1.0, tk.END)
+        self.file_info_text.insert(1.0, info)
+        self.file_info_text.config(state=tk.DISABLED)
+
+        #LOGS
+        self.app.logger.info(f"✅ Φορτώθηκε: {os.path.basename(excel_file)} ({len(self.app.excel_df)} γραμμές)")
+        messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.app.excel_df)} γραμμές")
+
+    def _load_failed(self, e: Exception):
+        """Αναφορά αποτυχίας φόρτωσης"""
+        messagebox.showerror("Σφάλμα", str(e))
+        self.app.logger.error(f"❌ {str(e)}")
+        self.app.telemetry.record_error(str(e))
+
+    def preflight_file(self):
+        """Γρήγορος προέλεγχος (μόνο a/a, nutrients, pH) χωρίς φόρτωση του αρχείου"""
+        protocol = self.protocol_entry.get().strip()
+        if not protocol:
+            messagebox.showwarning("Προειδοποίηση", "Εισάγετε αριθμό πρωτοκόλλου")
+            return
+
+        try:
+            from modules.preflight import preflight
+
+            entry = self._get_catalog().lookup(protocol)
+            if entry is None:
+                messagebox.showerror("Σφάλμα", f"Το αρχείο δεν βρέθηκε: {protocol}.xls / .xlsx")
+                return
+
+            report = preflight(entry.path)
 
             self.file_info_text.config(state=tk.NORMAL)
             self.file_info_text.delete(1.0, tk.END)
-            self.file_info_text.insert(1.0, info)
+            self.file_info_text.insert(1.0, report.format())
             self.file_info_text.config(state=tk.DISABLED)
 
-            #LOGS
-            self.app.logger.info(f"✅ Φορτώθηκε: {protocol}.xls ({len(self.app.excel_df)} γραμμές)")
-            messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.app.excel_df)} γραμμές")
+            status = "✅" if report.ok else "⚠️"
+            self.app.logger.info(f"{status} Προέλεγχος {protocol}: {report.rows} γραμμές ({report.elapsed:.2f}s)")
 
         except Exception as e:
             messagebox.showerror("Σφάλμα", str(e))
             self.app.logger.error(f"❌ {str(e)}")
-            self.app.telemetry.record_error(str(e))
 
     def browse_file(self):
         """Αναζήτηση αρχείου"""
         filename = filedialog.askopenfilename(
             title="Επιλογή Αρχείου",
-            filetypes=[("Excel files", "*.xls *.xlsx"), ("All files", "*.*")]
+            filetypes=[("Excel / CSV files", "*.xls *.xlsx *.csv *.tsv *.txt"), ("All files", "*.*")]
         )
         if filename:
             protocol = os.path.splitext(os.path.basename(filename))[0]
             self.protocol_entry.delete(0, tk.END)
             self.protocol_entry.insert(0, protocol)
-            self.load_file()
+            self.load_file(filename)
+
+    def merge_files(self):
+        """Επιλογή πολλών αρχείων και συγχώνευση σε μία συνεχή εκτέλεση"""
+        filenames = filedialog.askopenfilenames(
+            title="Επιλογή Αρχείων για Συγχώνευση",
+            filetypes=[("Excel / CSV files", "*.xls *.xlsx *.csv *.tsv *.txt"), ("All files", "*.*")]
+        )
+        if not filenames:
+            return
+
+        try:
+            from modules.merge import MultiFileMerger
+
+            merger = MultiFileMerger(list(filenames))
+            merged_df = merger.merge()
+            protocol_number, first_4, dash_part = merger.get_protocol_info()
+
+            self.app.excel_df = merged_df
+            self.app.protocol_number = protocol_number
+            self.app.csv_first_4 = first_4
+            self.app.dash_part = dash_part
+
+            self.protocol_entry.delete(0, tk.END)
+            self.protocol_entry.insert(0, merger.protocols[0])
+
+            per_file = "\n".join(
+                f"  - {proto}: {len(df)} γραμμές"
+                for proto, df in zip(merger.protocols, merger.frames)
+            )
+            info = f"""
+Συγχώνευση: {len(merger.protocols)} αρχεία
+{per_file}
+Σύνολο γραμμών: {len(merged_df)}
+Αρχείο εξόδου: {protocol_number}.csv
+            """
+
+            self.file_info_text.config(state=tk.NORMAL)
+            self.file_info_text.delete(1.0, tk.END)
+            self.file_info_text.insert(1.0, info)
+            self.file_info_text.config(state=tk.DISABLED)
+
+            self.app.logger.info(f"🧩 Συγχωνεύτηκαν: {protocol_number} ({len(merged_df)} γραμμές)")
+            messagebox.showinfo("Επιτυχία", f"Συγχωνεύτηκαν {len(merger.protocols)} αρχεία")
+
+        except Exception as e:
+            messagebox.showerror("Σφάλμα", str(e))
+            self.app.logger.error(f"❌ {str(e)}")
+            self.app.telemetry.record_error(str(e))
 
     def reset(self):
         """Reset tab"""
@@ -4,7 +4,6 @@ Handles data processing and logging
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 import sys
 import os
 from datetime import datetime
@@ -13,11 +12,10 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from modules.data_processor import process_data
-from modules.time_handler import TimeHandler, MetadataGenerator
-from modules.zero_manager import prepare_zero_data
-from modules.output_generator import generate_output
-from modules.missing_row import MissingRowHandler
+from modules.settings import get_settings
+
+# Κάθε πόσο το Tk loop ελέγχει για events του worker
+POLL_INTERVAL_MS = 100
 
 
 class ProcessTab:
@@ -30,6 +28,7 @@ class ProcessTab:
             app_reference: Reference to main app
         """
         self.app = app_reference
+        self._job_id = None
         self.frame = ttk.Frame(parent, padding="20")
         self._setup_ui()
 
@@ -84,102 +83,85 @@ class ProcessTab:
         self.progress.start()
         self.app.processing_start_time = datetime.now()
 
-        thread = threading.Thread(target=self._process_data)
-        thread.daemon = True
-        thread.start()
-
-    def _process_data(self):
         try:
             self.set_status("⚡ Έναρξη επεξεργασίας...", "#2980b9")
 
+            # Lazy import (συνήθως ήδη ζεσταμένο από το background warmup)
+            from modules.missing_row import MissingRowHandler
+
             self.set_status("🔍 Έλεγχος για missing a/a...", "#2980b9")
             missing_rows = MissingRowHandler.find_missing_aa_rows(self.app.excel_df)
 
             if missing_rows:
                 self.app.logger.warn(f"⚠️ Βρέθηκαν {len(missing_rows)} γραμμές με missing a/a")
 
-            self._continue_processing()
-
-            self.set_status("✅ Ολοκληρώθηκε!", "#27ae60")
-
-        except Exception as e:
-            self.app.telemetry.record_error(str(e))
-            self.app.logger.error(f"❌ {str(e)}")
-            self.set_status(f"❌ Σφάλμα: {e}", "#c0392b")
-            self.app.root.after(0, messagebox.showerror, "Σφάλμα", str(e))
-
-        finally:
-            self.app.root.after(0, self.progress.stop)
-            self.app.root.after(0, lambda: self.process_btn.config(state=tk.NORMAL))
-
-
-    def _continue_processing(self):
-        """Συνέχεια επεξεργασίας"""
-        try:
-            # ΒΗΜΑ 2: Επεξεργασία (ΧΩΡΙΣ drop_zero)
-            self.app.logger.info("⚙️ Επεξεργασία δεδομένων...")
-            temp_df = process_data(self.app.excel_df)
-
-            # ΒΗΜΑ 3: DROP_ZERO_NUTRIENTS στο τέλος
-            if self.app.settings_tab.get_drop_zero():
-                self.app.logger.info("🧹 Εφαρμογή DROP_ZERO_NUTRIENTS...")
-                before_count = len(temp_df)
-                temp_df = temp_df[
-                    ~((temp_df['Fat'] == 0) &
-                      (temp_df['Protein'] == 0) &
-                      (temp_df['Lactose'] == 0))
-                ].reset_index(drop=True)
-                after_count = len(temp_df)
-                removed = before_count - after_count
-                self.app.logger.info(f"  🗑️ Αφαιρέθηκαν {removed} γραμμές")
-
-            self.app.processed_df = temp_df
-
-            # ΒΗΜΑ 4: Metadata
-            self.app.logger.info("🕐 Δημιουργία timestamps...")
-            time_handler = TimeHandler(len(self.app.processed_df))
-            date = self.app.settings_tab.get_date()
-            initial_time = self.app.settings_tab.get_time()
-
-            parsed_date = datetime.strptime(date, "%d-%m")
-            formatted_date = parsed_date.replace(year=datetime.now().year).strftime("%d/%m/%Y")
-
-            sample_ids = time_handler.generate_sample_ids(self.app.csv_first_4, self.app.dash_part)
-            sample_times, zero_times = time_handler.generate_sample_times(initial_time)
-
-            # ΒΗΜΑ 5: Generate output
-            self.app.logger.info("📝 Δημιουργία metadata...")
-            metadata = MetadataGenerator.generate_metadata(len(self.app.processed_df), formatted_date)
-            metadata["protocol_number"] = self.app.protocol_number
-            metadata['sample_ids'] = sample_ids
-            metadata['sample_times'] = sample_times
-            metadata['zero_times'] = zero_times
-
             self.app.logger.info(f"📦 Product: {self.app.settings_tab.get_product()}")
 
-            self.app.logger.info("0️⃣ Προετοιμασία zero data...")
-            zero_dfs = prepare_zero_data(len(self.app.processed_df), formatted_date, zero_times)
-
-            self.app.logger.info("💾 Δημιουργία τελικού αρχείου...")
-            final_path = generate_output(self.app.processed_df, metadata, zero_dfs)
-            self.app.last_output_path = final_path
-
-
-            # Telemetry
-            duration = (datetime.now() - self.app.processing_start_time).total_seconds()
-            filename = f"{self.app.csv_first_4}{self.app.dash_part}"
-            self.app.telemetry.record_file_processed(filename, len(self.app.processed_df), duration)
-
-            self.app.logger.info(f"✅ ΕΠΙΤΥΧΙΑ! ({duration:.1f}s)")
-            self.app.root.after(0, self.app.results_tab.show_results, final_path)
+            # Το pipeline τρέχει στον worker process· εδώ μόνο αποδίδουμε events
+            self._job_id = self.app.get_worker().submit(
+                self.app.excel_df,
+                protocol_number=self.app.protocol_number,
+                csv_first_4=self.app.csv_first_4,
+                dash_part=self.app.dash_part,
+                date=self.app.settings_tab.get_date(),
+                initial_time=self.app.settings_tab.get_time(),
+                drop_zero_nutrients=self.app.settings_tab.get_drop_zero(),
+                # Ένα snapshot ρυθμίσεων για όλη την εκτέλεση
+                settings=get_settings(),
+            )
+            self.app.root.after(POLL_INTERVAL_MS, self._poll_worker)
 
         except Exception as e:
-            self.app.telemetry.record_error(str(e))
-            self.app.logger.error(f"❌ {str(e)}")
-            self.app.root.after(0, messagebox.showerror, "Σφάλμα", str(e))
-        finally:
-            self.app.root.after(0, self.progress.stop)
-            self.app.root.after(0, lambda: self.process_btn.config(state=tk.NORMAL))
+            self._on_error(str(e))
+
+    def _poll_worker(self):
+        """Αποδίδει τα events του worker (τρέχει στο Tk loop μέσω after)"""
+        for kind, job_id, payload in self.app.get_worker().poll_events():
+            if job_id != self._job_id:
+                continue
+            if kind == "log":
+                self.app.logger.info(payload)
+            elif kind == "done":
+                self._on_done(payload)
+                return
+            elif kind == "error":
+                self._on_error(payload.splitlines()[0] if payload else "Άγνωστο σφάλμα")
+                self.app.logger.error(payload)
+                return
+        self.app.root.after(POLL_INTERVAL_MS, self._poll_worker)
+
+    def _on_done(self, result):
+        self._finish()
+        final_path = result['final_path']
+        self.app.processed_samples = result['samples']
+        self.app.last_output_path = final_path
+
+        # Telemetry
+        duration = (datetime.now() - self.app.processing_start_time).total_seconds()
+        filename = f"{self.app.csv_first_4}{self.app.dash_part}"
+        self.app.telemetry.record_file_processed(filename, result['samples'], duration,
+                                                 memory=result.get('memory'))
+        if result.get('memory'):
+            self.app.logger.info(f"🧠 Μνήμη: {result['memory']['kb_per_sample']} KB/δείγμα "
+                                 f"(peak {result['memory']['peak_mb']} MB)")
+
+        self.app.logger.info(f"✅ ΕΠΙΤΥΧΙΑ! ({duration:.1f}s)")
+        # Χρόνος αδράνειας: προφόρτωση του επόμενου πιθανού αρχείου (στον worker process)
+        self.app.get_worker().prefetch(self.app.protocol_number, get_settings())
+        self.set_status("✅ Ολοκληρώθηκε!", "#27ae60")
+        self.app.results_tab.show_results(final_path)
+
+    def _on_error(self, message):
+        self._finish()
+        self.app.telemetry.record_error(message)
+        self.app.logger.error(f"❌ {message}")
+        self.set_status(f"❌ Σφάλμα: {message}", "#c0392b")
+        messagebox.showerror("Σφάλμα", message)
+
+    def _finish(self):
+        self._job_id = None
+        self.progress.stop()
+        self.process_btn.config(state=tk.NORMAL)
 
     def get_frame(self):
         """Returns the frame"""
@@ -12,7 +12,6 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-import config
 
 
 class ResultsTab:
@@ -31,7 +30,7 @@ class ResultsTab:
     def _setup_ui(self):
         """Δημιουργία UI"""
         self.results_text = scrolledtext.ScrolledText(
-            self.frame, height=20, state=tk.DISABLED, font=("Consolas", 10)
+            self.frame, height=8, state=tk.DISABLED, font=("Consolas", 10)
         )
         self.results_text.pack(fill=tk.BOTH, expand=True, pady=10)
 
@@ -57,13 +56,58 @@ class ResultsTab:
             command=self.reset
         ).pack(side=tk.LEFT, padx=5)
 
+        self._setup_archive_search()
+
+    def _setup_archive_search(self):
+        """Αναζήτηση στο αρχείο δειγμάτων (όλες οι προηγούμενες εκτελέσεις)"""
+        search_frame = ttk.LabelFrame(self.frame, text="🗄️ Αρχείο δειγμάτων", padding="10")
+        search_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        bar = ttk.Frame(search_frame)
+        bar.pack(fill=tk.X)
+        ttk.Label(bar, text="Sample Id / πρωτόκολλο / ημερομηνία (DD/MM/YYYY) / μήνας (MM/YYYY):").pack(side=tk.LEFT)
+        self.search_entry = ttk.Entry(bar, width=24)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<Return>", lambda _e: self.search_archive())
+        ttk.Button(bar, text="🔎 Αναζήτηση", command=self.search_archive).pack(side=tk.LEFT, padx=5)
+        self.search_status = ttk.Label(bar, text="")
+        self.search_status.pack(side=tk.LEFT, padx=10)
+
+        self.search_columns = ("Sample Id", "Fat", "Protein", "Lactose", "FPD", "TS", "SNF", "pH", "Date", "Time")
+        self.search_tree = ttk.Treeview(search_frame, columns=self.search_columns, show="headings", height=8)
+        for col in self.search_columns:
+            self.search_tree.heading(col, text=col)
+            self.search_tree.column(col, width=110 if col == "Sample Id" else 70, anchor=tk.CENTER)
+        scrollbar = ttk.Scrollbar(search_frame, orient=tk.VERTICAL, command=self.search_tree.yview)
+        self.search_tree.configure(yscrollcommand=scrollbar.set)
+        self.search_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=5)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+
+    def search_archive(self):
+        """Εκτελεί την αναζήτηση (indexed query στη SQLite) και γεμίζει τον πίνακα"""
+        from modules.archive import SampleArchive
+        from modules.settings import get_settings
+
+        text = self.search_entry.get().strip()
+        try:
+            results = SampleArchive(settings=get_settings()).search(text)
+        except Exception as e:
+            self.search_status.config(text=f"❌ {e}")
+            return
+
+        self.search_tree.delete(*self.search_tree.get_children())
+        visible = results[list(self.search_columns)].astype(object)
+        for row in visible.where(visible.notna(), "").itertuples(index=False):
+            self.search_tree.insert("", tk.END, values=list(row))
+        self.search_status.config(text=f"{len(results)} δείγματα")
+
     def show_results(self, final_path):
         """Εμφάνιση αποτελεσμάτων"""
         results = f"""
 ✅ ΕΠΙΤΥΧΙΑ!
 
 📄 Αρχείο: {final_path}
-📊 Δείγματα: {len(self.app.processed_df)}
+📊 Δείγματα: {self.app.processed_samples}
         """
 
         self.results_text.config(state=tk.NORMAL)
@@ -76,7 +120,7 @@ class ResultsTab:
 
         messagebox.showinfo(
             "Επιτυχία",
-            f"Ολοκληρώθηκε!\n\nΔείγματα: {len(self.app.processed_df)}"
+            f"Ολοκληρώθηκε!\n\nΔείγματα: {self.app.processed_samples}"
         )
 
     def open_output_folder(self):
@@ -112,7 +156,7 @@ class ResultsTab:
         self.app.excel_df = None
         self.app.csv_first_4 = None
         self.app.dash_part = None
-        self.app.processed_df = None
+        self.app.processed_samples = 0
 
         # Reset tabs
         self.app.load_tab.reset()
@@ -13,7 +13,7 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-import config
+from modules.settings import get_settings
 
 
 class SettingsTab:
@@ -31,6 +31,8 @@ class SettingsTab:
 
     def _setup_ui(self):
         """Δημιουργία UI"""
+        settings = get_settings()
+
         # Date
         date_frame = ttk.LabelFrame(self.frame, text="📅 Ημερομηνία", padding="15")
         date_frame.pack(fill=tk.X, pady=10)
@@ -46,7 +48,7 @@ class SettingsTab:
 
         ttk.Label(time_frame, text="Ώρα (HH:MM):").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.time_entry = ttk.Entry(time_frame, width=20)
-        self.time_entry.insert(0, config.DEFAULT_TIME)
+        self.time_entry.insert(0, settings.default_time)
         self.time_entry.grid(row=0, column=1, padx=10, pady=5)
 
         ttk.Button(
@@ -61,14 +63,14 @@ class SettingsTab:
 
         ttk.Label(product_frame, text="Όνομα:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.product_entry = ttk.Entry(product_frame, width=30)
-        self.product_entry.insert(0, config.DEFAULT_PRODUCT)
+        self.product_entry.insert(0, settings.default_product)
         self.product_entry.grid(row=0, column=1, padx=10, pady=5)
 
         # Filter
         filter_frame = ttk.LabelFrame(self.frame, text="🔧 Φίλτρα", padding="15")
         filter_frame.pack(fill=tk.X, pady=10)
 
-        self.drop_zero_var = tk.BooleanVar(value=getattr(config, 'DROP_ZERO_NUTRIENTS', True))
+        self.drop_zero_var = tk.BooleanVar(value=settings.drop_zero_nutrients)
         ttk.Checkbutton(
             filter_frame,
             text="Αφαίρεση γραμμών με Fat=Protein=Lactose=0",
@@ -11,7 +11,18 @@ class UsageTelemetry:
             os.path.dirname(os.path.abspath(__file__)),
             'usage_stats.json'
         )
-        self.stats = self._load_stats()
+        # Lazy: το JSON διαβάζεται στην πρώτη χρήση, όχι στην εκκίνηση του GUI
+        self._stats = None
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            self._stats = self._load_stats()
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        self._stats = value
 
     def _load_stats(self):
         """Φορτώνει τα statistics από το αρχείο"""
@@ -49,8 +60,8 @@ class UsageTelemetry:
         self.stats['last_used'] = datetime.now().isoformat()
         self._save_stats()
 
-    def record_file_processed(self, filename, samples_count, duration_seconds=None):
-        """Καταγράφει επεξεργασία αρχείου"""
+    def record_file_processed(self, filename, samples_count, duration_seconds=None, memory=None):
+        """Καταγράφει επεξεργασία αρχείου (memory: σύνοψη του προφίλ μνήμης, αν υπάρχει)"""
         self.stats['total_files_processed'] += 1
 
         record = {
@@ -59,6 +70,10 @@ class UsageTelemetry:
             'samples': samples_count,
             'duration_sec': duration_seconds
         }
+        if memory:
+            record['peak_mb'] = memory.get('peak_mb')
+            record['rss_peak_mb'] = memory.get('rss_peak_mb')
+            record['kb_per_sample'] = memory.get('kb_per_sample')
 
         self.stats['processing_history'].append(record)
 
@@ -101,6 +116,13 @@ class UsageTelemetry:
             if datetime.fromisoformat(record['timestamp']).date() >= week_ago
         )
 
+        # Μνήμη ανά δείγμα από τις πρόσφατες εκτελέσεις με προφίλ μνήμης
+        memory_runs = [
+            record for record in self.stats['processing_history']
+            if record.get('kb_per_sample')
+        ][-20:]
+        per_sample = [record['kb_per_sample'] for record in memory_runs]
+
         return {
             'total_files': self.stats['total_files_processed'],
             'total_sessions': self.stats['total_sessions'],
@@ -108,5 +130,10 @@ class UsageTelemetry:
             'week_files': week_files,
             'last_used': self.stats['last_used'],
             'first_used': self.stats['first_used'],
-        'recent_errors': len(self.stats['errors'])
+        'recent_errors': len(self.stats['errors']),
+            'memory_runs': len(memory_runs),
+            'memory_kb_per_sample_avg': sum(per_sample) / len(per_sample) if per_sample else None,
+            'memory_kb_per_sample_max': max(per_sample) if per_sample else None,
+            'memory_peak_mb_max': max((r.get('peak_mb') or 0 for r in memory_runs), default=None),
+            'memory_rss_peak_mb_max': max((r.get('rss_peak_mb') or 0 for r in memory_runs), default=None),
         }
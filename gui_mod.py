@@ -12,6 +12,9 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Πρώτο import: κρατά τον χρόνο εκκίνησης για την αναφορά startup
+from modules.startup import GUI_MODULES, warm_imports_async, format_import_report, elapsed_since_start
+
 # Import core modules
 
 # Import modules
@@ -25,7 +28,7 @@ from gui.log import UILogger
 # Import tab modules
 from gui.tabs import LoadTab, SettingsTab, ProcessTab, ResultsTab
 
-import config
+from modules.settings import get_settings
 
 
 class CSVLabGUI:
@@ -41,16 +44,19 @@ class CSVLabGUI:
 
         # Core components
         self.telemetry = UsageTelemetry()
-        self.telemetry.record_session_start()
         self.config_editor = ConfigEditor()
 
         # Data variables
         self.excel_df = None
         self.csv_first_4 = None
         self.dash_part = None
-        self.processed_df = None
+        self.processed_samples = 0
         self.processing_start_time = None
 
+        # Pipeline σε ξεχωριστό process (ξεκινά μετά την εμφάνιση του παραθύρου)·
+        # εκεί τρέχει και η προφόρτωση του επόμενου πιθανού Excel
+        self.worker = None
+
         # Setup UI
         self._setup_ui()
 
@@ -59,7 +65,40 @@ class CSVLabGUI:
 
         # Initial log
         self.log("✅ CSV Lab εκκίνησε επιτυχώς!")
-        self.log(f"📁 Φάκελος εργασίας: {config.BASE_PATH}")
+        self.log(f"📁 Φάκελος εργασίας: {get_settings().base_path}")
+
+        # Μετά την εμφάνιση του παραθύρου: telemetry I/O + warmup βαριών imports
+        self.root.after_idle(self._after_window_shown)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _after_window_shown(self):
+        """Εργασίες που δεν χρειάζεται να καθυστερούν το πρώτο παράθυρο"""
+        self.log(f"🚀 Παράθυρο έτοιμο σε {elapsed_since_start():.2f}s")
+        self.telemetry.record_session_start()
+        warm_imports_async(GUI_MODULES, on_done=self._on_warmup_done)
+        # Πρώτη σάρωση του φακέλου εισόδου για το autocomplete πρωτοκόλλων
+        from modules.catalog import get_catalog
+        get_catalog().refresh_async()
+        self.get_worker().start()
+
+    def get_worker(self):
+        """Το worker pool του pipeline (δημιουργείται στην πρώτη χρήση)"""
+        if self.worker is None:
+            from modules.worker import WorkerPool
+            # Ένας ζεστός worker αρκεί για το GUI· ανακύκλωση για να μη μεγαλώνει η μνήμη
+            self.worker = WorkerPool(max_workers=1, max_jobs_per_worker=25)
+        return self.worker
+
+    def _on_close(self):
+        """Κλείσιμο παραθύρου: τερματισμός worker και μετά destroy"""
+        if self.worker is not None:
+            self.worker.stop(timeout=2)
+        self.root.destroy()
+
+    def _on_warmup_done(self, timings):
+        """Καλείται από το warmup thread (ο logger είναι thread-safe)"""
+        for line in format_import_report(timings).splitlines():
+            self.logger.info(line)
 
     def _center_window(self):
         """Κεντράρει το παράθυρο"""
@@ -238,4 +277,7 @@ def run_gui():
 
 
 if __name__ == "__main__":
+    # Απαραίτητο για τον worker process σε Windows (spawn / PyInstaller)
+    import multiprocessing
+    multiprocessing.freeze_support()
     run_gui()
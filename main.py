@@ -8,11 +8,7 @@ import os
 # Προσθήκη του parent directory στο path για σωστά imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.data_loader import load_data
-from modules.data_processor import process_data
-from modules.time_handler import generate_time_metadata
-from modules.zero_manager import prepare_zero_data
-from modules.output_generator import generate_output
+from modules.settings import get_settings
 
 
 def print_header(text):
@@ -26,45 +22,55 @@ def main():
     """Κύρια συνάρτηση εκτέλεσης"""
     
     print_header("ΣΥΣΤΗΜΑ ΕΠΕΞΕΡΓΑΣΙΑΣ ΔΕΔΟΜΕΝΩΝ ΓΑΛΑΚΤΟΣ - WINDOWS")
+
+    # Με --import-times τα βαριά imports γίνονται εδώ ένα-ένα και χρονομετρούνται·
+    # αλλιώς φορτώνονται όταν τα ζητήσουν τα load_data / run_pipeline
+    if "--import-times" in sys.argv:
+        from modules.startup import timed_imports, format_import_report
+        print(format_import_report(timed_imports()))
+
+    from modules.data_loader import load_data
+    from modules.time_handler import TimeHandler
+    from modules.pipeline import run_pipeline
     
     try:
+        # Ρυθμίσεις: φορτώνονται μία φορά και περνούν σε όλα τα βήματα
+        settings = get_settings()
+
         # Βήμα 1: Φόρτωση δεδομένων
-        print_header("ΒΗΜΑ 1/5: Φόρτωση δεδομένων από Excel")
-        excel_df, csv_first_4, dash_part = load_data()
+        print_header("ΒΗΜΑ 1/3: Φόρτωση δεδομένων από Excel")
+        excel_df, csv_first_4, dash_part = load_data(settings)
         print()
-        
-        # Βήμα 2: Επεξεργασία δεδομένων
-        print_header("ΒΗΜΑ 2/5: Επεξεργασία και καθαρισμός δεδομένων")
-        processed_df = process_data(excel_df)
-        print()
-        
-        # Βήμα 3: Δημιουργία μεταδεδομένων και χρονικών δεδομένων
-        print_header("ΒΗΜΑ 3/5: Δημιουργία μεταδεδομένων")
-        metadata = generate_time_metadata(
-            len(processed_df), 
-            csv_first_4, 
-            dash_part
-        )
+
+        # Βήμα 2: Ημερομηνία ανάλυσης και αρχική ώρα
+        print_header("ΒΗΜΑ 2/3: Ημερομηνία και ώρα ανάλυσης")
+        prompts = TimeHandler(0, settings)
+        date = prompts.get_analysis_date()
+        initial_time = prompts.get_initial_time()
         print()
-        
-        # Βήμα 4: Προετοιμασία zero data
-        print_header("ΒΗΜΑ 4/5: Προετοιμασία zero calibration data")
-        zero_dfs = prepare_zero_data(
-            len(processed_df),
-            metadata['date'][0],
-            metadata['zero_times']
+
+        # Βήμα 3: Ίδιο pipeline με το GUI / watcher: οι μηδενικές γραμμές αφαιρούνται
+        # πριν το layout, ώστε ώρες, zero blocks, CSV και αρχείο δειγμάτων να συμφωνούν
+        print_header("ΒΗΜΑ 3/3: Επεξεργασία και τελικό output")
+        result = run_pipeline(
+            excel_df,
+            protocol_number=f"{csv_first_4}{dash_part}",
+            csv_first_4=csv_first_4,
+            dash_part=dash_part,
+            date=date,
+            initial_time=initial_time,
+            settings=settings,
         )
-        print()
-        
-        # Βήμα 5: Δημιουργία τελικού output
-        print_header("ΒΗΜΑ 5/5: Δημιουργία τελικού output")
-        final_path = generate_output(processed_df, metadata, zero_dfs)
+        final_path = result['final_path']
         print()
         
         # Επιτυχής ολοκλήρωση
         print_header("ΕΠΕΞΕΡΓΑΣΙΑ ΟΛΟΚΛΗΡΩΘΗΚΕ ΕΠΙΤΥΧΩΣ!")
         print(f"\n📄 Τελικό αρχείο: {final_path}")
-        print(f"\n💡 Συμβουλή: Ανοίξτε το αρχείο με Excel ή Notepad++")
+        if settings.output_xlsx:
+            print(f"📗 Excel: {os.path.splitext(final_path)[0]}.xlsx")
+        else:
+            print(f"\n💡 Συμβουλή: Ανοίξτε το αρχείο με Excel ή Notepad++ (ή ορίστε OUTPUT_XLSX = True)")
         print()
         
         # Προσφορά για άνοιγμα του φακέλου
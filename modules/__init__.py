@@ -8,14 +8,62 @@ Modules:
 - time_handler: Διαχείριση χρονικών δεδομένων
 - zero_data_manager: Διαχείριση zero calibration data
 - output_generator: Δημιουργία τελικού output
+- settings: Typed ρυθμίσεις εφαρμογής (settings.json + config.py defaults)
+- pipeline: Headless εκτέλεση όλου του pipeline
+- merge: Συγχώνευση πολλών αρχείων σε μία συνεχή εκτέλεση
 """
 
-from .data_loader import DataLoader, load_data
-from .data_processor import DataProcessor, process_data
-from .time_handler import TimeHandler, MetadataGenerator, generate_time_metadata
-from .zero_manager import ZeroDataManager, prepare_zero_data
-from .output_generator import OutputGenerator, FinalOutputAssembler, generate_output
-from .missing_row import MissingRowHandler
+import importlib
+
+# Lazy imports (PEP 562): τα submodules (και pandas/numpy/openpyxl) φορτώνονται
+# μόνο στην πρώτη χρήση, ώστε το `import modules` να είναι σχεδόν δωρεάν.
+_LAZY_ATTRS = {
+    'DataLoader': 'data_loader',
+    'load_data': 'data_loader',
+    'DataProcessor': 'data_processor',
+    'process_data': 'data_processor',
+    'TimeHandler': 'time_handler',
+    'MetadataGenerator': 'time_handler',
+    'generate_time_metadata': 'time_handler',
+    'ZeroDataManager': 'zero_manager',
+    'prepare_zero_data': 'zero_manager',
+    'OutputGenerator': 'output_generator',
+    'FinalOutputAssembler': 'output_generator',
+    'generate_output': 'output_generator',
+    'MissingRowHandler': 'missing_row',
+    'AppSettings': 'settings',
+    'SettingsStore': 'settings',
+    'get_settings': 'settings',
+    'save_settings': 'settings',
+    'run_pipeline': 'pipeline',
+    'MultiFileMerger': 'merge',
+    'merge_files': 'merge',
+    'run_merged': 'merge',
+    'BatchLayout': 'layout',
+    'JobWorkspace': 'workspace',
+    'PipelineWorker': 'worker',
+    'WorkerPool': 'worker',
+    'JobService': 'service',
+    'SampleArchive': 'archive',
+    'FileCatalog': 'catalog',
+    'get_catalog': 'catalog',
+    'WorkbookPrefetcher': 'prefetch',
+    'PreflightReport': 'preflight',
+    'plan_layout': 'plan',
+    'LayoutPlan': 'plan',
+    'OutputDialect': 'dialect',
+    'get_dialect': 'dialect',
+    'render_csv': 'dialect',
+    'run_differential': 'differential',
+    'DifferentialReport': 'differential',
+    'MemoryProfiler': 'memprofile',
+    'MemoryReport': 'memprofile',
+    'HeaderResolver': 'columns',
+    'resolve_columns': 'columns',
+    'QCRule': 'qc',
+    'evaluate_qc': 'qc',
+    'qc_summary': 'qc',
+}
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
@@ -42,13 +90,67 @@ __all__ = [
     'OutputGenerator',
     'FinalOutputAssembler',
     'generate_output',
+    'OutputDialect',
+    'get_dialect',
+    'render_csv',
 
     #Missing row Handler
     'MissingRowHandler',
 
+    # Settings
+    'AppSettings',
+    'SettingsStore',
+    'get_settings',
+    'save_settings',
+
+    # Pipeline / Merge
+    'run_pipeline',
+    'MultiFileMerger',
+    'merge_files',
+    'run_merged',
+
+    # Layout / Workspaces
+    'BatchLayout',
+    'JobWorkspace',
+    'PipelineWorker',
+    'WorkerPool',
+    'JobService',
+    'SampleArchive',
+    'FileCatalog',
+    'get_catalog',
+    'WorkbookPrefetcher',
+    'PreflightReport',
+    'plan_layout',
+    'LayoutPlan',
+    'run_differential',
+    'DifferentialReport',
+    'MemoryProfiler',
+    'MemoryReport',
+
+    # Column Resolution
+    'HeaderResolver',
+    'resolve_columns',
+
+    # Quality Control
+    'QCRule',
+    'evaluate_qc',
+    'qc_summary',
 ]
 
 
+def __getattr__(name):
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 # Package-level convenience functions
 def quick_process(file_number: str, date: str = None, initial_time: str = None):
     """
@@ -0,0 +1,300 @@
+"""
+Module για το μόνιμο αρχείο δειγμάτων (SQLite)
+
+Κάθε εκτέλεση του pipeline προσθέτει τα επεξεργασμένα δείγματα (πρωτόκολλο, a/a,
+Sample Id, nutrients, TS/SNF, pH, ημερομηνία και ώρα) σε μια τοπική βάση SQLite με
+indexes, ώστε η αναζήτηση ενός δείγματος ή η τάση ενός μήνα να είναι ένα query αντί
+για άνοιγμα δεκάδων CSV.
+
+Η επανεπεξεργασία του ίδιου πρωτοκόλλου για την ίδια ημερομηνία αντικαθιστά την
+προηγούμενη εγγραφή (κρατιέται η τελευταία εκτέλεση).
+"""
+import os
+import re
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+    from .formatting import FIXED_POINT_ATTR, from_fixed_point
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.formatting import FIXED_POINT_ATTR, from_fixed_point
+
+
+# Στήλη DataFrame -> στήλη πίνακα samples
+VALUE_COLUMNS = {
+    "Fat": "fat",
+    "Protein": "protein",
+    "Lactose": "lactose",
+    "FPD": "fpd",
+    "TS": "ts",
+    "SNF": "snf",
+    "pH": "ph",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id        INTEGER PRIMARY KEY,
+    protocol      TEXT NOT NULL,
+    analysis_date TEXT NOT NULL,          -- YYYY-MM-DD
+    processed_at  TEXT NOT NULL,
+    final_path    TEXT,
+    samples       INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_runs_protocol_date ON runs (protocol, analysis_date);
+
+CREATE TABLE IF NOT EXISTS samples (
+    run_id        INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    protocol      TEXT NOT NULL,
+    aa            INTEGER,
+    sample_id     TEXT NOT NULL,
+    fat           REAL,
+    protein       REAL,
+    lactose       REAL,
+    fpd           REAL,
+    ts            REAL,
+    snf           REAL,
+    ph            REAL,
+    analysis_date TEXT NOT NULL,          -- YYYY-MM-DD
+    analysis_time TEXT,
+    qc            INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_samples_sample_id ON samples (sample_id);
+CREATE INDEX IF NOT EXISTS ix_samples_date ON samples (analysis_date);
+CREATE INDEX IF NOT EXISTS ix_samples_protocol ON samples (protocol, aa);
+CREATE INDEX IF NOT EXISTS ix_samples_run ON samples (run_id);
+"""
+
+# Στήλες που επιστρέφουν τα queries (με τα ονόματα του CSV)
+_SELECT = (
+    "SELECT protocol, aa AS 'a/a', sample_id AS 'Sample Id', fat AS Fat, protein AS Protein, "
+    "lactose AS Lactose, fpd AS FPD, ts AS TS, snf AS SNF, ph AS pH, "
+    "analysis_date AS Date, analysis_time AS Time, qc AS QC FROM samples"
+)
+
+
+def _iso_date(date: str) -> str:
+    """DD/MM/YYYY (ή ήδη YYYY-MM-DD) -> YYYY-MM-DD"""
+    date = str(date).strip()
+    for fmt in ("%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(date, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    raise ValueError(f"Μη έγκυρη ημερομηνία για το αρχείο δειγμάτων: {date}")
+
+
+class SampleArchive:
+    """Πρόσβαση στη βάση δειγμάτων (μία σύνδεση ανά λειτουργία, ασφαλές για threads)"""
+
+    def __init__(self, path: str = None, settings: AppSettings = None):
+        """
+        Args:
+            path: Αρχείο SQLite (default: ARCHIVE_PATH)
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        """
+        self.settings = settings or get_settings()
+        self.path = str(path or self.settings.archive_path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            # WAL: αναζητήσεις από το GUI ενώ ένας worker γράφει
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    # ---------- ΕΓΓΡΑΦΗ ----------
+
+    def record_run(self, protocol: str, date: str, df: pd.DataFrame, sample_ids: List[str],
+                   sample_times: List[str], qc_flags: pd.Series = None,
+                   final_path: str = None) -> int:
+        """
+        Καταχωρεί τα δείγματα μιας εκτέλεσης (αντικαθιστά προηγούμενη ίδιου πρωτοκόλλου/ημερομηνίας)
+
+        Args:
+            protocol: Αριθμός πρωτοκόλλου (π.χ. "1605-6")
+            date: Ημερομηνία ανάλυσης DD/MM/YYYY
+            df: Τα δείγματα όπως γράφτηκαν (επεξεργασμένο DataFrame, ίδια σειρά με sample_ids)
+            sample_ids: Sample Id ανά γραμμή
+            sample_times: Ώρα HH:MM ανά γραμμή
+            qc_flags: QC bitmask ανά γραμμή (προαιρετικό)
+            final_path: Το τελικό CSV
+
+        Returns:
+            int: run_id
+        """
+        iso_date = _iso_date(date)
+        n = len(df)
+        fixed = df.attrs.get(FIXED_POINT_ATTR) or {}
+
+        columns = {"run_id": None, "protocol": [protocol] * n}
+        columns["aa"] = (pd.to_numeric(df["a/a"], errors="coerce").astype("Int64")
+                         if "a/a" in df.columns else pd.Series([None] * n, dtype="Int64")).array
+        columns["sample_id"] = list(sample_ids)
+        for source, target in VALUE_COLUMNS.items():
+            if source not in df.columns:
+                values = pd.Series([None] * n, dtype="float64")
+            elif source in fixed:
+                values = from_fixed_point(df[source], fixed[source])
+            else:
+                values = pd.to_numeric(df[source], errors="coerce").astype("float64")
+            columns[target] = values.to_numpy()
+        columns["analysis_date"] = [iso_date] * n
+        columns["analysis_time"] = list(sample_times)
+        columns["qc"] = (qc_flags.to_numpy() if qc_flags is not None else [0] * n)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM runs WHERE protocol = ? AND analysis_date = ?",
+                         (protocol, iso_date))
+            cursor = conn.execute(
+                "INSERT INTO runs (protocol, analysis_date, processed_at, final_path, samples) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (protocol, iso_date, datetime.now().isoformat(timespec="seconds"), final_path, n),
+            )
+            run_id = cursor.lastrowid
+            names = [k for k in columns if k != "run_id"]
+            rows = zip(
+                [run_id] * n,
+                *[[_py(v) for v in columns[k]] for k in names],
+            )
+            conn.executemany(
+                f"INSERT INTO samples (run_id, {', '.join(names)}) "
+                f"VALUES ({', '.join('?' * (len(names) + 1))})",
+                rows,
+            )
+        return run_id
+
+    # ---------- QUERIES ----------
+
+    def _query(self, where: str = "", params: tuple = (), order: str = "analysis_date DESC, protocol, aa",
+               limit: int = 500) -> pd.DataFrame:
+        sql = f"{_SELECT} {('WHERE ' + where) if where else ''} ORDER BY {order} LIMIT ?"
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(sql, conn, params=params + (int(limit),))
+
+    def find_samples(self, sample_id: str = None, protocol: str = None,
+                     date_from: str = None, date_to: str = None, limit: int = 500) -> pd.DataFrame:
+        """
+        Αναζήτηση δειγμάτων (όλα τα κριτήρια είναι προαιρετικά και συνδυάζονται)
+
+        Args:
+            sample_id: Πρόθεμα Sample Id (π.χ. "1605-6" ή "1605-6 12")
+            protocol: Ακριβής αριθμός πρωτοκόλλου
+            date_from / date_to: Όρια ημερομηνίας (DD/MM/YYYY ή YYYY-MM-DD, κλειστά)
+            limit: Μέγιστο πλήθος γραμμών
+        """
+        clauses, params = [], []
+        if sample_id:
+            # Εύρος αντί για LIKE, ώστε να χρησιμοποιείται το index
+            clauses.append("sample_id >= ? AND sample_id < ?")
+            params += [sample_id, sample_id + "￿"]
+        if protocol:
+            clauses.append("protocol = ?")
+            params.append(protocol)
+        if date_from:
+            clauses.append("analysis_date >= ?")
+            params.append(_iso_date(date_from))
+        if date_to:
+            clauses.append("analysis_date <= ?")
+            params.append(_iso_date(date_to))
+        return self._query(" AND ".join(clauses), tuple(params), limit=limit)
+
+    def search(self, text: str, limit: int = 500) -> pd.DataFrame:
+        """
+        Ελεύθερη αναζήτηση για το GUI:
+            "05/2026" ή "2026-05"   -> όλα τα δείγματα του μήνα
+            "16/05/2026"            -> δείγματα της ημέρας
+            οτιδήποτε άλλο          -> πρόθεμα Sample Id / πρωτοκόλλου
+        """
+        text = (text or "").strip()
+        month = re.fullmatch(r"(\d{1,2})/(\d{4})|(\d{4})-(\d{1,2})", text)
+        if month:
+            mm, yyyy = (month.group(1), month.group(2)) if month.group(1) else (month.group(4), month.group(3))
+            start = f"{yyyy}-{int(mm):02d}-01"
+            end = f"{yyyy}-{int(mm):02d}-31"
+            return self._query("analysis_date BETWEEN ? AND ?", (start, end), limit=limit)
+        if re.fullmatch(r"\d{1,2}/\d{1,2}/\d{4}", text):
+            day = _iso_date(datetime.strptime(text, "%d/%m/%Y").strftime("%d/%m/%Y"))
+            return self._query("analysis_date = ?", (day,), limit=limit)
+        if not text:
+            return self._query(limit=limit)
+        return self.find_samples(sample_id=text, limit=limit)
+
+    def monthly_trend(self, column: str = "Fat", date_from: str = None,
+                      date_to: str = None) -> pd.DataFrame:
+        """
+        Μέσος όρος / min / max ανά μήνα για μια στήλη (π.χ. "Fat", "SNF", "pH")
+
+        Returns:
+            pd.DataFrame: month, samples, mean, min, max
+        """
+        target = VALUE_COLUMNS.get(column)
+        if target is None:
+            raise ValueError(f"Άγνωστη στήλη: {column} (διαθέσιμες: {', '.join(VALUE_COLUMNS)})")
+        clauses, params = [f"{target} IS NOT NULL"], []
+        if date_from:
+            clauses.append("analysis_date >= ?")
+            params.append(_iso_date(date_from))
+        if date_to:
+            clauses.append("analysis_date <= ?")
+            params.append(_iso_date(date_to))
+        sql = (
+            f"SELECT substr(analysis_date, 1, 7) AS month, COUNT(*) AS samples, "
+            f"AVG({target}) AS mean, MIN({target}) AS min, MAX({target}) AS max "
+            f"FROM samples WHERE {' AND '.join(clauses)} GROUP BY month ORDER BY month"
+        )
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(sql, conn, params=tuple(params))
+
+    def runs(self, limit: int = 100) -> pd.DataFrame:
+        """Οι πιο πρόσφατες εκτελέσεις"""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                "SELECT run_id, protocol, analysis_date, processed_at, samples, final_path "
+                "FROM runs ORDER BY processed_at DESC LIMIT ?", conn, params=(int(limit),)
+            )
+
+
+def _py(value):
+    """numpy / pandas scalar -> τύπος Python για το sqlite3 (NA -> NULL)"""
+    if value is None or value is pd.NA:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+        if isinstance(value, float) and value != value:
+            return None
+    return value
+
+
+def archive_run(protocol: str, date: str, df: pd.DataFrame, sample_ids: List[str],
+                sample_times: List[str], qc_flags: pd.Series = None, final_path: str = None,
+                settings: AppSettings = None) -> Optional[int]:
+    """
+    Wrapper για το pipeline: καταχωρεί την εκτέλεση αν ARCHIVE_SAMPLES είναι ενεργό.
+    Ένα σφάλμα της βάσης δεν αποτυγχάνει την επεξεργασία (επιστρέφει None).
+    """
+    settings = settings or get_settings()
+    if not settings.archive_samples:
+        return None
+    try:
+        run_id = SampleArchive(settings=settings).record_run(
+            protocol, date, df, sample_ids, sample_times, qc_flags, final_path
+        )
+        print(f"🗄️ Καταχωρήθηκαν {len(df)} δείγματα στο αρχείο δειγμάτων (run {run_id})")
+        return run_id
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"⚠️ Δεν έγινε καταχώρηση στο αρχείο δειγμάτων: {e}")
+        return None
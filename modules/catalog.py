@@ -0,0 +1,199 @@
+"""
+Module για τον κατάλογο αρχείων πρωτοκόλλων του φακέλου εισόδου (BASE_PATH)
+
+Αντί για os.listdir / os.path.exists σε κάθε αναζήτηση (ένα round-trip ανά έλεγχο σε
+network share), ο κατάλογος κρατά στη μνήμη πρωτόκολλο -> (διαδρομή, μέγεθος, mtime)
+και μια ταξινομημένη λίστα πρωτοκόλλων για autocomplete με bisect.
+
+Ο φάκελος ξανασαρώνεται μόνο όταν αλλάξει το mtime του (προσθήκη / διαγραφή /
+μετονομασία αρχείου) και το πολύ μία φορά ανά min_interval δευτερόλεπτα.
+"""
+import heapq
+import os
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .settings import AppSettings, get_settings
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+
+
+EXCEL_EXTENSIONS = (".xls", ".xlsx")
+DELIMITED_EXTENSIONS = (".tsv", ".txt", ".csv")
+# Σειρά προτίμησης όταν ένα πρωτόκολλο υπάρχει με πολλές επεκτάσεις
+INPUT_EXTENSIONS = EXCEL_EXTENSIONS + DELIMITED_EXTENSIONS
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Ένα αρχείο πρωτοκόλλου"""
+    protocol: str
+    path: str
+    size: int
+    mtime: float
+
+
+def protocol_key(protocol: str) -> str:
+    """Κλειδί αναζήτησης: χωρίς κενά στα άκρα, χωρίς διάκριση πεζών/κεφαλαίων"""
+    return protocol.strip().casefold()
+
+
+class FileCatalog:
+    """Κατάλογος των Excel ενός φακέλου με incremental refresh"""
+
+    def __init__(self, root: str, min_interval: float = 2.0,
+                 extensions: Tuple[str, ...] = EXCEL_EXTENSIONS):
+        """
+        Args:
+            root: Φάκελος εισόδου
+            min_interval: Ελάχιστα δευτερόλεπτα ανάμεσα σε δύο ελέγχους του φακέλου
+            extensions: Επεκτάσεις αρχείων με σειρά προτίμησης
+        """
+        self.root = str(root)
+        self.min_interval = min_interval
+        self.extensions = tuple(extensions)
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._keys: List[str] = []
+        self._dir_mtime = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._refreshing: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ---------- ΣΑΡΩΣΗ ----------
+
+    def refresh(self, force: bool = False, recheck: bool = False) -> bool:
+        """
+        Ξανασαρώνει τον φάκελο αν άλλαξε
+
+        Args:
+            force: Σάρωση ακόμη κι αν δεν άλλαξε το mtime του φακέλου
+            recheck: Έλεγχος του mtime ακόμη κι αν δεν πέρασε το min_interval
+
+        Returns:
+            bool: True αν έγινε σάρωση
+        """
+        now = time.monotonic()
+        if not (force or recheck) and now - self._checked < self.min_interval:
+            return False
+        self._checked = now
+        try:
+            dir_mtime = os.stat(self.root).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._entries, self._keys, self._dir_mtime = {}, [], None
+            return False
+        if not force and dir_mtime == self._dir_mtime:
+            return False
+
+        entries = self._scan()
+        with self._lock:
+            self._entries = entries
+            self._keys = sorted(entries)
+            self._dir_mtime = dir_mtime
+        return True
+
+    def _scan(self) -> Dict[str, CatalogEntry]:
+        # scandir: ένα listing με τα stat του καταλόγου, χωρίς stat ανά αρχείο στα Windows
+        entries: Dict[str, CatalogEntry] = {}
+        with os.scandir(self.root) as it:
+            for item in it:
+                stem, ext = os.path.splitext(item.name)
+                ext = ext.lower()
+                if ext not in self.extensions or item.name.startswith("~$"):
+                    continue
+                try:
+                    if not item.is_file():
+                        continue
+                    st = item.stat()
+                except OSError:
+                    continue
+                key = protocol_key(stem)
+                # Αν υπάρχουν πολλά, προτιμάται η πρώτη επέκταση (.xls πριν από .xlsx,
+                # όπως η παλιά σειρά ελέγχου, και το Excel πριν από το export)
+                existing = entries.get(key)
+                if existing is not None and self._rank(existing.path) <= self.extensions.index(ext):
+                    continue
+                entries[key] = CatalogEntry(stem.strip(), item.path, st.st_size, st.st_mtime)
+        return entries
+
+    def _rank(self, path: str) -> int:
+        return self.extensions.index(os.path.splitext(path)[1].lower())
+
+    def refresh_async(self):
+        """Refresh σε background thread (για το GUI)· αγνοείται αν τρέχει ήδη ένα"""
+        if self._refreshing is not None and self._refreshing.is_alive():
+            return
+        self._refreshing = threading.Thread(target=self.refresh, name="catalog-refresh", daemon=True)
+        self._refreshing.start()
+
+    # ---------- ΑΝΑΖΗΤΗΣΗ ----------
+
+    def lookup(self, protocol: str, refresh: bool = True) -> Optional[CatalogEntry]:
+        """
+        Βρίσκει το αρχείο ενός πρωτοκόλλου
+
+        Args:
+            protocol: π.χ. "1605-6"
+            refresh: Έλεγχος για αλλαγές στον φάκελο πριν την αναζήτηση
+        """
+        if refresh:
+            self.refresh()
+        key = protocol_key(protocol)
+        entry = self._entries.get(key)
+        if entry is None and refresh and self._dir_mtime is not None:
+            # Αρχείο που μόλις αντιγράφηκε, μέσα στο min_interval: ένα stat του φακέλου
+            if self.refresh(recheck=True):
+                entry = self._entries.get(key)
+        return entry
+
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """Πρωτόκολλα που ξεκινούν με prefix (ταξινομημένα), χωρίς I/O"""
+        key = protocol_key(prefix)
+        with self._lock:
+            keys, entries = self._keys, self._entries
+        out = []
+        for i in range(bisect_left(keys, key), len(keys)):
+            if not keys[i].startswith(key) or len(out) >= limit:
+                break
+            out.append(entries[keys[i]].protocol)
+        return out
+
+    def newest(self, n: int = 10) -> List[CatalogEntry]:
+        """Τα n πιο πρόσφατα (κατά mtime) αρχεία"""
+        with self._lock:
+            entries = list(self._entries.values())
+        return heapq.nlargest(n, entries, key=lambda e: e.mtime)
+
+    def protocols(self) -> List[str]:
+        with self._lock:
+            return [self._entries[k].protocol for k in self._keys]
+
+
+_CATALOGS: Dict[str, FileCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_catalog(settings: AppSettings = None, root: str = None) -> FileCatalog:
+    """
+    Ο κοινός κατάλογος ανά φάκελο (η σάρωση γίνεται στο πρώτο refresh / lookup)
+
+    Τα .csv περιλαμβάνονται μόνο αν ο φάκελος δεν είναι και φάκελος εξόδου: εκεί
+    τα τελικά CSV της εφαρμογής έχουν το ίδιο όνομα με το πρωτόκολλο.
+    """
+    settings = settings or get_settings()
+    root = os.path.abspath(str(root or settings.base_path))
+    extensions = INPUT_EXTENSIONS
+    if os.path.normcase(root) == os.path.normcase(os.path.abspath(str(settings.output_path))):
+        extensions = tuple(e for e in INPUT_EXTENSIONS if e != ".csv")
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(root)
+        if catalog is None:
+            catalog = _CATALOGS[root] = FileCatalog(root, extensions=extensions)
+    return catalog
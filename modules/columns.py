@@ -0,0 +1,178 @@
+"""
+Module για την αντιστοίχιση επικεφαλίδων του Excel σε κανονικά ονόματα στηλών
+
+Κάθε όργανο γράφει τις επικεφαλίδες λίγο διαφορετικά ("PH", "pH ", "lactose ",
+"freeze point"...). Ο HeaderResolver τις αντιστοιχίζει με πίνακα aliases χωρίς
+διάκριση πεζών/κεφαλαίων και κενών, και κρατά cache ανά "υπογραφή" επικεφαλίδων,
+ώστε επόμενα αρχεία από το ίδιο όργανο να επιλύονται αμέσως.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+
+
+AA_COLUMN = "a/a"
+
+# Κανονικό όνομα -> γνωστές παραλλαγές (συγκρίνονται μετά από normalize_header)
+DEFAULT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    AA_COLUMN: ("a/a",),
+    "pH": ("ph",),
+    "Fat": ("fat",),
+    "Protein": ("protein", "proteine"),
+    "Lactose": ("lactose",),
+    "FPD": ("fpd", "freeze point", "freezing point"),
+}
+
+MAX_CACHED_SIGNATURES = 128
+
+
+def normalize_header(name) -> str:
+    """'  Freeze   Point ' -> 'freeze point'"""
+    return " ".join(str(name).split()).casefold()
+
+
+@dataclass(frozen=True)
+class HeaderResolution:
+    """Αποτέλεσμα επίλυσης για μία υπογραφή επικεφαλίδων"""
+    positions: Tuple[int, ...]       # θέσεις στηλών που κρατιούνται (με την αρχική σειρά)
+    names: Tuple[str, ...]           # τελικά ονόματα για αυτές τις θέσεις
+    sources: Dict[str, str]          # κανονικό όνομα -> αρχική επικεφαλίδα
+    dropped: Tuple[str, ...]         # επικεφαλίδες που αφαιρούνται
+    duplicates: Tuple[str, ...]      # επικεφαλίδες που αντιστοιχούν σε ήδη υπάρχουσα στήλη
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Επιλογή και μετονομασία σε μία πράξη"""
+        out = df.iloc[:, list(self.positions)]
+        out.columns = list(self.names)
+        return out
+
+    def source_for(self, canonical: str) -> Optional[str]:
+        """Η αρχική επικεφαλίδα για ένα κανονικό όνομα (ή None)"""
+        return self.sources.get(canonical)
+
+
+class HeaderResolver:
+    """Αντιστοίχιση επικεφαλίδων σε κανονικές στήλες, με cache ανά υπογραφή"""
+
+    def __init__(self, aliases: Dict[str, Sequence[str]] = None,
+                 extra_renames: Dict[str, str] = None,
+                 drop: Iterable[str] = (), drop_after_aa: bool = True):
+        """
+        Args:
+            aliases: Κανονικό όνομα -> παραλλαγές (default: DEFAULT_ALIASES)
+            extra_renames: Επιπλέον παραλλαγή -> κανονικό όνομα (π.χ. COLUMN_RENAMES)
+            drop: Στήλες προς αφαίρεση (π.χ. COLS_TO_DELETE)
+            drop_after_aa: Αφαίρεση της άχρηστης στήλης αμέσως μετά το a/a,
+                εκτός αν αντιστοιχεί σε κανονική στήλη
+        """
+        aliases = DEFAULT_ALIASES if aliases is None else aliases
+        self._lookup: Dict[str, str] = {}
+        for canonical, variants in aliases.items():
+            self._lookup[normalize_header(canonical)] = canonical
+            for variant in variants:
+                self._lookup[normalize_header(variant)] = canonical
+        for variant, canonical in (extra_renames or {}).items():
+            self._lookup[normalize_header(variant)] = canonical
+
+        self._drop = {normalize_header(name) for name in drop}
+        self.drop_after_aa = drop_after_aa
+        self._cache: Dict[Tuple[str, ...], HeaderResolution] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "HeaderResolver":
+        return cls(extra_renames=settings.column_renames, drop=settings.cols_to_delete)
+
+    def canonical(self, name) -> Optional[str]:
+        """Κανονικό όνομα μιας επικεφαλίδας (ή None αν είναι άγνωστη)"""
+        return self._lookup.get(normalize_header(name))
+
+    def resolve(self, columns: Iterable) -> HeaderResolution:
+        """
+        Επιλύει μια σειρά επικεφαλίδων (O(1) αν η ίδια υπογραφή έχει ξαναδεί)
+
+        Args:
+            columns: Οι επικεφαλίδες του DataFrame (με τη σειρά τους)
+        """
+        signature = tuple(str(c) for c in columns)
+        cached = self._cache.get(signature)
+        if cached is not None:
+            return cached
+
+        resolution = self._resolve(signature)
+        with self._lock:
+            if len(self._cache) >= MAX_CACHED_SIGNATURES:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[signature] = resolution
+        return resolution
+
+    def _resolve(self, signature: Tuple[str, ...]) -> HeaderResolution:
+        normalized = [normalize_header(c) for c in signature]
+        canonical = [self._lookup.get(n) for n in normalized]
+
+        skip = set()
+        if self.drop_after_aa and AA_COLUMN in canonical:
+            after = canonical.index(AA_COLUMN) + 1
+            if after < len(signature) and canonical[after] is None:
+                skip.add(after)
+
+        positions: List[int] = []
+        names: List[str] = []
+        sources: Dict[str, str] = {}
+        dropped: List[str] = []
+        duplicates: List[str] = []
+
+        for pos, (header, norm, canon) in enumerate(zip(signature, normalized, canonical)):
+            if pos in skip or (canon is None and norm in self._drop):
+                dropped.append(header)
+                continue
+            name = canon or header.strip()
+            if canon is not None:
+                if canon in sources:
+                    duplicates.append(header)
+                    continue
+                sources[canon] = header
+            elif name in names:
+                duplicates.append(header)
+                continue
+            positions.append(pos)
+            names.append(name)
+
+        return HeaderResolution(
+            positions=tuple(positions),
+            names=tuple(names),
+            sources=sources,
+            dropped=tuple(dropped),
+            duplicates=tuple(duplicates),
+        )
+
+
+_RESOLVERS: Dict[tuple, HeaderResolver] = {}
+
+
+def get_header_resolver(settings: AppSettings = None) -> HeaderResolver:
+    """Κοινόχρηστος resolver ανά (COLUMN_RENAMES, COLS_TO_DELETE)"""
+    settings = settings or get_settings()
+    key = (tuple(sorted(settings.column_renames.items())), settings.cols_to_delete)
+    resolver = _RESOLVERS.get(key)
+    if resolver is None:
+        resolver = _RESOLVERS.setdefault(key, HeaderResolver.from_settings(settings))
+    return resolver
+
+
+def resolve_columns(df: pd.DataFrame, settings: AppSettings = None) -> pd.DataFrame:
+    """
+    Wrapper function: επιστρέφει το df με κανονικά ονόματα στηλών
+
+    Args:
+        df: DataFrame με τις αρχικές επικεφαλίδες
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+    """
+    return get_header_resolver(settings).resolve(df.columns).apply(df)
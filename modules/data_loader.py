@@ -1,27 +1,159 @@
 """
 Module για τη φόρτωση και την αρχική επικύρωση δεδομένων από Excel αρχεία
+και από CSV/TSV exports των αναλυτών
 Windows Version
 """
+import importlib.util
 import os
 import re
 import pandas as pd
-from typing import Tuple
-import xlrd
-import openpyxl
+from typing import Optional, Tuple
 
-
-# Import config με fallback
 try:
-    from . import config
+    from .settings import AppSettings, get_settings
+    from .catalog import DELIMITED_EXTENSIONS, get_catalog
+    from .columns import AA_COLUMN, get_header_resolver
 except ImportError:
-    import config
+    from modules.settings import AppSettings, get_settings
+    from modules.catalog import DELIMITED_EXTENSIONS, get_catalog
+    from modules.columns import AA_COLUMN, get_header_resolver
+
+
+# Στήλες που διαβάζονται ως κείμενο και μετατρέπονται σε αριθμούς (δεκαδικό "," ή ".")
+NUMERIC_COLUMNS = (AA_COLUMN, "pH", "Fat", "Protein", "Lactose", "FPD")
+SNIFF_BYTES = 64 * 1024
+ENCODINGS = ("utf-8-sig", "cp1253")
+# pyarrow (αν είναι εγκατεστημένο) διαβάζει με πολλά threads· αλλιώς ο C parser του pandas
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+
+def sniff_delimited(path: str) -> Tuple[str, str, str]:
+    """
+    Εντοπίζει διαχωριστικό, υποδιαστολή και κωδικοποίηση από την αρχή του αρχείου
+
+    Returns:
+        Tuple[str, str, str]: (sep, decimal, encoding) π.χ. (";", ",", "utf-8-sig")
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    # Μόνο ολόκληρες γραμμές, ώστε να μην κοπεί χαρακτήρας πολλών bytes
+    if len(head) == SNIFF_BYTES and b"\n" in head:
+        head = head[:head.rindex(b"\n")]
+
+    for encoding in ENCODINGS:
+        try:
+            text = head.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        encoding, text = "latin-1", head.decode("latin-1")
+
+    header = text.splitlines()[0] if text else ""
+    if "\t" in header:
+        sep = "\t"
+    else:
+        # Στα ελληνικά locales το Excel γράφει ";" (το "," είναι υποδιαστολή)
+        sep = ";" if header.count(";") > header.count(",") else ","
+    decimal = "," if sep != "," and re.search(r"\d,\d", text) else "."
+    return sep, decimal, encoding
+
+
+def _numeric_from_text(values: pd.Series) -> pd.Series:
+    """Κείμενο -> αριθμοί με "," ή "." ως υποδιαστολή"""
+    text = values.str.strip()
+    numbers = pd.to_numeric(text.str.replace(",", ".", regex=False), errors="coerce")
+    invalid = numbers.isna() & text.notna() & (text != "")
+    if invalid.any():
+        # Μη αριθμητικό κείμενο μένει ως έχει, για να το χειριστεί η επεξεργασία
+        return numbers.astype(object).where(~invalid, values)
+    return numbers
+
+
+def _as_excel_dtype(values: pd.Series) -> pd.Series:
+    """Ακέραιες στήλες χωρίς κενά ως int64, όπως θα τις έδινε το read_excel"""
+    if values.dtype == "float64" and values.notna().all() and (values % 1 == 0).all():
+        return values.astype("int64")
+    return values
+
+
+def read_delimited(path: str, settings: AppSettings = None) -> pd.DataFrame:
+    """
+    Διαβάζει CSV/TSV export αναλυτή στο ίδιο σχήμα με το pd.read_excel
+
+    Οι αριθμητικές στήλες (a/a, pH, Fat, Protein, Lactose, FPD, με οποιαδήποτε γνωστή
+    ορθογραφία επικεφαλίδας) διαβάζονται με ρητό dtype float64 από τον parser. Αν
+    κάποια τιμή δεν είναι αριθμός για τον parser (π.χ. "-0,01" σε αρχείο με ","
+    ως διαχωριστικό), οι στήλες ξαναδιαβάζονται ως κείμενο και μετατρέπονται vectorized.
+
+    Args:
+        path: Αρχείο .csv / .tsv / .txt
+        settings: Ρυθμίσεις εφαρμογής (για την επίλυση επικεφαλίδων)
+    """
+    settings = settings or get_settings()
+    sep, decimal, encoding = sniff_delimited(path)
+    header = pd.read_csv(path, sep=sep, encoding=encoding, nrows=0).columns
+    resolver = get_header_resolver(settings)
+    numeric = [c for c in header if resolver.canonical(c) in NUMERIC_COLUMNS]
+
+    options = dict(sep=sep, decimal=decimal, encoding=encoding, engine=CSV_ENGINE)
+    try:
+        df = pd.read_csv(path, dtype={c: "float64" for c in numeric}, **options)
+    except ValueError:
+        df = pd.read_csv(path, dtype={c: str for c in numeric}, **options)
+        for column in numeric:
+            df[column] = _numeric_from_text(df[column])
+    for column in numeric:
+        df[column] = _as_excel_dtype(df[column])
+    return df
+
+
+def read_input(path: str, settings: AppSettings = None) -> pd.DataFrame:
+    """Διαβάζει αρχείο εισόδου: Excel (.xls/.xlsx) ή CSV/TSV export"""
+    if path.lower().endswith(DELIMITED_EXTENSIONS):
+        return read_delimited(path, settings)
+    return pd.read_excel(path)
+
+
+def parse_protocol_number(protocol: str) -> Tuple[str, str]:
+    """
+    Διασπά αριθμό πρωτοκόλλου (π.χ. "1234-56") σε πρώτα 4 ψηφία και dash part
+
+    Returns:
+        Tuple[str, str]: (csv_first_4, dash_part) π.χ. ("1234", "-56")
+
+    Raises:
+        ValueError: Αν ο αριθμός δεν είναι της μορφής NNNN-NN
+    """
+    protocol = protocol.strip()
+    result = re.search(r"(-\d+)", protocol)
+    if not result or len(protocol) < 4 or not protocol[:4].isdigit():
+        raise ValueError(f"Μη έγκυρος αριθμός πρωτοκόλλου: {protocol}")
+    return protocol[:4], result.group()
 
 
 class DataLoader:
     """Κλάση για τη διαχείριση φόρτωσης δεδομένων"""
     
-    def __init__(self, base_path: str = None):
-        self.base_path = base_path or config.BASE_PATH
+    def __init__(self, base_path: str = None, settings: AppSettings = None):
+        self.settings = settings or get_settings()
+        self.base_path = base_path or self.settings.base_path
+        self.catalog = get_catalog(self.settings, root=self.base_path)
+
+    def find_file(self, protocol: str) -> Optional[str]:
+        """
+        Διαδρομή του αρχείου ενός πρωτοκόλλου (.xls, .xlsx ή CSV/TSV export) από τον
+        κατάλογο του BASE_PATH
+
+        Returns:
+            Optional[str]: Η διαδρομή ή None αν δεν υπάρχει
+        """
+        entry = self.catalog.lookup(protocol)
+        return entry.path if entry is not None else None
+
+    def read(self, path: str) -> pd.DataFrame:
+        """Διαβάζει Excel ή CSV/TSV export στο σχήμα που περιμένει το process_data"""
+        return read_input(path, self.settings)
 
     def get_user_file(self) -> Tuple[pd.DataFrame, str, str]:
         """
@@ -55,18 +187,16 @@ class DataLoader:
                 
                 csv_first_4 = user_excel[:4]
                 
-                # Δημιουργία path αρχείου
-                excel_file = os.path.abspath(f"{user_excel}.xls")
-                
-                # Έλεγχος αν υπάρχει το αρχείο
-                if not os.path.exists(excel_file):
-                    print(f"Το αρχείο δεν βρέθηκε: {excel_file}")
-                    self._list_available_files()
+                # Αναζήτηση στον κατάλογο του BASE_PATH (.xls ή .xlsx)
+                excel_file = self.find_file(user_excel)
+                if excel_file is None:
+                    print(f"Το αρχείο δεν βρέθηκε: {user_excel}.xls / .xlsx στο {self.base_path}")
+                    self._list_available_files(user_excel)
                     continue
                 
                 # Προσπάθεια ανάγνωσης Excel
                 try:
-                    excel_df = pd.read_excel(excel_file)
+                    excel_df = self.read(excel_file)
                     print("✅ Το αρχείο φορτώθηκε επιτυχώς!")
                     print(f"Πρώτα 4 ψηφία: {csv_first_4}")
                     print(f"Dash part: {dash_part}")
@@ -81,16 +211,19 @@ class DataLoader:
                 print(f"Προέκυψε ένα απροσδόκητο σφάλμα: {e}")
                 continue
     
-    def _list_available_files(self):
-        """Εμφανίζει τα διαθέσιμα αρχεία στον BASE_PATH"""
+    def _list_available_files(self, protocol: str = ""):
+        """Εμφανίζει τα διαθέσιμα αρχεία στον BASE_PATH (πρώτα όσα μοιάζουν με το protocol)"""
         if os.path.exists(self.base_path):
-            available_files = [
-                f for f in os.listdir(self.base_path)
-                if f.endswith(('.xls', '.xlsx'))
-            ]
+            # Προτάσεις με το ίδιο πρόθεμα (π.χ. ίδια ημερομηνία DDMM), αλλιώς όλα
+            available_files = self.catalog.complete(protocol[:4], limit=10) if protocol else []
             if available_files:
-                print("\n📁 Διαθέσιμα αρχεία στον φάκελο:")
-                for f in sorted(available_files)[:10]:  # Εμφάνιση μέχρι 10 αρχείων
+                print(f"\n📁 Αρχεία που ξεκινούν με {protocol[:4]}:")
+            else:
+                available_files = self.catalog.protocols()
+                if available_files:
+                    print("\n📁 Διαθέσιμα αρχεία στον φάκελο:")
+            if available_files:
+                for f in available_files[:10]:  # Εμφάνιση μέχρι 10 αρχείων
                     print(f"  - {f}")
                 if len(available_files) > 10:
                     print(f"  ... και {len(available_files) - 10} ακόμα αρχεία")
@@ -99,17 +232,20 @@ class DataLoader:
                 print(f"   Τοποθετήστε τα αρχεία σας στο: {self.base_path}")
         else:
             print(f"❌ Ο φάκελος '{self.base_path}' δεν βρέθηκε.")
-            print(f"   Δημιουργήστε τον φάκελο ή ελέγξτε το config.py")
+            print(f"   Δημιουργήστε τον φάκελο ή ελέγξτε τις ρυθμίσεις (BASE_PATH)")
 
 
-def load_data() -> Tuple[pd.DataFrame, str, str]:
+def load_data(settings: AppSettings = None) -> Tuple[pd.DataFrame, str, str]:
     """
     Wrapper function για εύκολη χρήση
+
+    Args:
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
     
     Returns:
         Tuple[DataFrame, str, str]: (excel_df, csv_first_4, dash_part)
     """
-    loader = DataLoader()
+    loader = DataLoader(settings=settings)
     return loader.get_user_file()
 
 
@@ -5,18 +5,23 @@ Windows Version - Updated με Zero Nutrient Filter
 import pandas as pd
 from typing import List, Optional
 
-# Import config με fallback
 try:
-    from . import config
+    from .settings import AppSettings, get_settings
+    from .columns import get_header_resolver
+    from .formatting import FIXED_POINT_ATTR, PRECISION_ATTR, quantize_series, to_fixed_point
 except ImportError:
-    import config
+    from modules.settings import AppSettings, get_settings
+    from modules.columns import get_header_resolver
+    from modules.formatting import FIXED_POINT_ATTR, PRECISION_ATTR, quantize_series, to_fixed_point
 
 
 class DataProcessor:
     """Κλάση για την επεξεργασία δεδομένων γάλακτος"""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, settings: AppSettings = None):
         self.df = df.copy()
+        self.settings = settings or get_settings()
+        self._decimal_errors = []
 
     def initial_filtering(self) -> pd.DataFrame:
         """
@@ -25,14 +30,9 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Καθαρισμένο DataFrame
         """
-        # Αφαίρεση περιττής στήλης μετά το 'a/a'
-        self._remove_column_after_aa()
-
-        # Καθαρισμός whitespace από ονόματα στηλών
-        self.df.columns = self.df.columns.str.strip()
-
-        # Διαγραφή περιττών στηλών
-        self._remove_unnecessary_columns()
+        # Επίλυση επικεφαλίδων: άχρηστη στήλη μετά το 'a/a', COLS_TO_DELETE,
+        # μετονομασίες (χωρίς διάκριση πεζών/κενών) σε μία επιλογή/μετονομασία
+        self._resolve_columns()
 
         # Αφαίρεση duplicates
         self.df = self.df.drop_duplicates()
@@ -46,119 +46,84 @@ class DataProcessor:
         # Μετατροπή a/a σε integer
         self.df["a/a"] = self.df["a/a"].astype(int)
 
-        # Μετονομασίες στηλών
-        self.df = self.df.rename(columns=config.COLUMN_RENAMES)
-        dupes = self.df.columns[self.df.columns.duplicated()].tolist()
-        print("DUPLICATE COLS:", dupes)
-
         print(f"✅ Αρχικό filtering ολοκληρώθηκε. Σύνολο γραμμών: {len(self.df)}")
         return self.df
 
-    def _remove_column_after_aa(self):
-        """Διαγράφει τη στήλη αμέσως μετά το 'a/a' ΜΟΝΟ αν είναι άχρηστη."""
-        cols = self.df.columns.tolist()
-        if "a/a" not in cols:
-            return
-
-        idx = cols.index("a/a")
-        if idx + 1 >= len(cols):
-            return
-
-        col_to_delete = cols[idx + 1]
-
-        # ✅ Προστασία: ΜΗΝ σβήνεις χρήσιμες στήλες
-        protected = {"PH", "Fat", "Protein", "Lactose", "FPD", "freeze point", "proteine", "fat", "lactose"}
-        if col_to_delete.strip() in protected:
-            # Είναι χρήσιμη → μην την πειράξεις
-            return
+    def _resolve_columns(self):
+        """Αντιστοιχίζει τις επικεφαλίδες σε κανονικά ονόματα (modules/columns.py)"""
+        resolution = get_header_resolver(self.settings).resolve(self.df.columns)
+        self.df = resolution.apply(self.df)
 
-        self.df = self.df.drop(columns=[col_to_delete])
-        print(f"Η στήλη '{col_to_delete}' διαγράφηκε.")
-
-    def _remove_unnecessary_columns(self):
-        """Διαγράφει περιττές στήλες"""
-        cols_to_delete = [col for col in config.COLS_TO_DELETE if col in self.df.columns]
-        if cols_to_delete:
-            self.df = self.df.drop(columns=cols_to_delete)
-            print(f"Διαγράφηκαν στήλες: {cols_to_delete}")
+        if resolution.dropped:
+            print(f"Διαγράφηκαν στήλες: {list(resolution.dropped)}")
+        if resolution.duplicates:
+            print(f"⚠️ Διπλές στήλες (κρατήθηκε η πρώτη): {list(resolution.duplicates)}")
 
     def format_decimals(self, two_dec_cols: List[str] = None,
                         four_dec_cols: List[str] = None) -> pd.DataFrame:
         """
-        Μορφοποιεί δεκαδικά ψηφία και ελέγχει για σφάλματα
+        Στρογγυλοποιεί τα δεκαδικά και ελέγχει για σφάλματα.
+        Οι στήλες μένουν αριθμητικές· η μορφοποίηση σε κείμενο γίνεται μία φορά
+        κατά την εγγραφή (modules/formatting.py) με βάση το precision spec
+        που αποθηκεύεται στο df.attrs['precision'].
+
+        Με FIXED_POINT_NUTRIENTS οι στήλες αποθηκεύονται ως Int32 ακέραιοι
+        (εκατοστά / δεκάκις χιλιοστά) και καταγράφονται στο df.attrs['fixed_point'].
         
         Args:
             two_dec_cols: Στήλες με 2 δεκαδικά
             four_dec_cols: Στήλες με 4 δεκαδικά
             
         Returns:
-            pd.DataFrame: Μορφοποιημένο DataFrame
+            pd.DataFrame: DataFrame με αριθμητικές, στρογγυλοποιημένες στήλες
         """
-        two_dec_cols = two_dec_cols or config.TWO_DECIMAL_COLS
-        four_dec_cols = four_dec_cols or config.FOUR_DECIMAL_COLS
+        two_dec_cols = two_dec_cols or self.settings.two_decimal_cols
+        four_dec_cols = four_dec_cols or self.settings.four_decimal_cols
+
+        spec = {col: 2 for col in two_dec_cols}
+        spec.update({col: 4 for col in four_dec_cols})
 
-        # Μορφοποίηση
-        for col in two_dec_cols:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-                self.df[col] = self.df[col].apply(lambda x: self._smart_format(x, 2))
+        fixed_point = self.settings.fixed_point_nutrients
+        present = {c: d for c, d in spec.items() if c in self.df.columns}
 
-        for col in four_dec_cols:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-                self.df[col] = self.df[col].apply(lambda x: self._smart_format(x, 4))
+        for col, decimals in present.items():
+            values = pd.to_numeric(self.df[col], errors='coerce')
+            # Έλεγχος δεκαδικών στις αρχικές τιμές
+            self._validate_decimals(col, values, decimals)
+            if fixed_point:
+                self.df[col] = to_fixed_point(values, decimals)
+            else:
+                self.df[col] = quantize_series(values, decimals)
 
-        # Έλεγχος δεκαδικών
-        self._validate_decimals(two_dec_cols, 2)
-        self._validate_decimals(four_dec_cols, 4)
+        self._report_decimal_errors()
+        self.df.attrs[PRECISION_ATTR] = present
+        self.df.attrs[FIXED_POINT_ATTR] = dict(present) if fixed_point else {}
 
         return self.df
 
-    @staticmethod
-    def _smart_format(x, decimals: int) -> str:
-        """Μορφοποιεί αριθμό με καθορισμένα δεκαδικά"""
-        if pd.isna(x):
-            return x
-        try:
-            x = float(x)
-            return f"{x:.{decimals}f}".rstrip("0").rstrip(".")
-        except (ValueError, TypeError):
-            return x
-
-    @staticmethod
-    def _count_decimals(x) -> int:
-        """Μετρά τα δεκαδικά ψηφία μιας τιμής"""
-        if pd.isna(x):
-            return 0
-        s = str(x)
-        if "." in s:
-            return len(s.split(".")[1])
-        return 0
-
-    def _validate_decimals(self, columns: List[str], max_decimals: int):
-        """Ελέγχει αν οι στήλες τηρούν τα όρια δεκαδικών"""
-        decimal_errors = []
-
-        for col in columns:
-            if col not in self.df.columns:
-                continue
-
-            for idx, val in self.df[col].items():
-                decs = self._count_decimals(val)
-                if decs > max_decimals:
-                    decimal_errors.append(
-                        f"Στήλη '{col}', γραμμή {idx}, τιμή {val} "
-                        f"έχει {decs} δεκαδικά (max {max_decimals})"
-                    )
+    def _validate_decimals(self, col: str, values: pd.Series, max_decimals: int):
+        """Vectorized έλεγχος: τιμές με περισσότερα από max_decimals δεκαδικά"""
+        scaled = values * (10 ** max_decimals)
+        bad = values.notna() & ((scaled - scaled.round()).abs() > 1e-6)
+        for idx, val in values[bad].items():
+            self._decimal_errors.append(
+                f"Στήλη '{col}', γραμμή {idx}, τιμή {val} "
+                f"έχει περισσότερα από {max_decimals} δεκαδικά"
+            )
+
+    def _report_decimal_errors(self):
+        """Εμφανίζει τα σφάλματα δεκαδικών που βρέθηκαν"""
+        decimal_errors = self._decimal_errors
 
         if not decimal_errors:
-            print(f"✅ Όλες οι στήλες τηρούν σωστά τα όρια {max_decimals} δεκαδικών.")
+            print(f"✅ Όλες οι στήλες τηρούν σωστά τα όρια δεκαδικών.")
         else:
             print(f"❌ Βρέθηκαν {len(decimal_errors)} σφάλματα δεκαδικών:")
             for err in decimal_errors[:5]:  # Εμφάνιση μόνο 5 πρώτων
                 print(f"  {err}")
             if len(decimal_errors) > 5:
                 print(f"  ... και {len(decimal_errors) - 5} ακόμα σφάλματα")
+        self._decimal_errors = []
 
     def calculate_derived_values(self) -> pd.DataFrame:
         """
@@ -167,19 +132,25 @@ class DataProcessor:
         Returns:
             pd.DataFrame: DataFrame με νέες στήλες
         """
+        fixed = self.df.attrs.get(FIXED_POINT_ATTR) or {}
+        if all(fixed.get(c) == 2 for c in ('Fat', 'Protein', 'Lactose')):
+            # Ακριβή αθροίσματα σε εκατοστά, χωρίς round
+            self.df['TS'] = self.df['Fat'] + self.df['Protein'] + self.df['Lactose']
+            self.df['SNF'] = self.df['Protein'] + self.df['Lactose'] + 70
+            self.df.attrs[FIXED_POINT_ATTR] = {**fixed, 'TS': 2, 'SNF': 2}
+            print("✅ Υπολογίστηκαν TS και SNF")
+            return self.df
+
+        # Οι στήλες είναι ήδη αριθμητικές (format_decimals) - χωρίς re-parse
+        fat = pd.to_numeric(self.df['Fat'], errors='coerce')
+        protein = pd.to_numeric(self.df['Protein'], errors='coerce')
+        lactose = pd.to_numeric(self.df['Lactose'], errors='coerce')
+
         # Υπολογισμός TS (Total Solids)
-        self.df['TS'] = (
-                self.df['Fat'].astype(float) +
-                self.df['Protein'].astype(float) +
-                self.df['Lactose'].astype(float)
-        ).round(2)
+        self.df['TS'] = (fat + protein + lactose).round(2)
 
         # Υπολογισμός SNF (Solids Non-Fat)
-        self.df['SNF'] = (
-                self.df['Protein'].astype(float) +
-                self.df['Lactose'].astype(float) +
-                0.7
-        ).round(2)
+        self.df['SNF'] = (protein + lactose + 0.7).round(2)
 
         print("✅ Υπολογίστηκαν TS και SNF")
         return self.df
@@ -189,19 +160,19 @@ class DataProcessor:
         return self.df
 
 
-def process_data(excel_df: pd.DataFrame) -> pd.DataFrame:
+def process_data(excel_df: pd.DataFrame, settings: AppSettings = None) -> pd.DataFrame:
     """
     Wrapper function για πλήρη επεξεργασία δεδομένων
     
     Args:
         excel_df: Το αρχικό DataFrame από το Excel
-        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
         
     Returns:
         pd.DataFrame: Πλήρως επεξεργασμένο DataFrame
     """
 
-    processor = DataProcessor(excel_df)
+    processor = DataProcessor(excel_df, settings)
 
     # Βασική επεξεργασία
     processor.initial_filtering()
@@ -0,0 +1,233 @@
+"""
+Module για τη διάλεκτο (dialect) του τελικού CSV ανά όργανο-στόχο
+
+Μία διάλεκτος ορίζει διαχωριστικό πεδίων, υποδιαστολή, quoting και αλλαγή γραμμής.
+Οι γραμμές δειγμάτων και τα zero blocks γράφονται από τον ίδιο writer
+(render_csv, ανά στήλη), ώστε όλο το αρχείο να έχει την ίδια μορφή.
+
+Η διάλεκτος "default" αναπαράγει byte-προς-byte την έξοδο των παλαιότερων εκδόσεων:
+δείγματα με "." ως υποδιαστολή και τα zero blocks με το κείμενο του zero template
+όπως είναι (π.χ. "-0,01"). Οι υπόλοιπες διάλεκτοι αποδίδουν και τους αριθμούς των
+zero blocks με τη δική τους υποδιαστολή.
+"""
+import csv
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+    from .formatting import format_decimal_series
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.formatting import format_decimal_series
+
+
+# Αριθμητικές στήλες των zero blocks (οι υπόλοιπες είναι κείμενο: Rep #, Date, Time...)
+ZERO_NUMERIC_COLUMNS = ("Fat", "Protein", "Lactose", "FPD", "TS", "SNF")
+ZERO_DECIMALS = 4
+
+
+@dataclass(frozen=True)
+class OutputDialect:
+    """Μορφή του τελικού CSV"""
+    name: str
+    sep: str = ","
+    decimal: str = "."
+    # Υποδιαστολή για τους αριθμούς των zero blocks· None: το κείμενο του template ως έχει
+    zero_decimal: Optional[str] = None
+    lineterminator: str = "\n"
+    quotechar: str = '"'
+    quoting: int = csv.QUOTE_MINIMAL
+
+    def validate(self):
+        """Πετά ValueError αν η διάλεκτος δεν είναι εγγράψιμη χωρίς αμφισημία"""
+        errors = []
+        if len(self.sep) != 1 or len(self.quotechar) != 1:
+            errors.append("sep / quotechar πρέπει να είναι ένας χαρακτήρας")
+        if self.decimal not in (".", ","):
+            errors.append(f"Μη έγκυρη υποδιαστολή: {self.decimal!r}")
+        if self.zero_decimal not in (None, ".", ","):
+            errors.append(f"Μη έγκυρη υποδιαστολή zero blocks: {self.zero_decimal!r}")
+        if self.quoting not in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL):
+            errors.append("Υποστηρίζονται μόνο QUOTE_MINIMAL / QUOTE_ALL")
+        if not self.lineterminator:
+            errors.append("Κενό lineterminator")
+        if errors:
+            raise ValueError(f"Διάλεκτος {self.name}: " + "; ".join(errors))
+
+    # ---------- ΕΓΓΡΑΦΗ ----------
+
+    def render(self, df: pd.DataFrame, header: bool = True,
+               numeric: Iterable[str] = ()) -> str:
+        """
+        Αποδίδει το DataFrame ως κείμενο CSV
+
+        Args:
+            df: Γραμμές προς εγγραφή (αριθμοί ή ήδη μορφοποιημένο κείμενο)
+            header: Γραμμή επικεφαλίδας
+            numeric: Στήλες κειμένου που περιέχουν αριθμούς (παίρνουν την υποδιαστολή
+                της διαλέκτου)· οι float στήλες αναγνωρίζονται αυτόματα
+        """
+        return render_csv(df, self, header=header, numeric=numeric)
+
+    def render_zero(self, zero_df: pd.DataFrame) -> str:
+        """Αποδίδει ένα zero block (πάντα με την επικεφαλίδα του template)"""
+        if self.zero_decimal is None:
+            return render_csv(zero_df, self, header=True)
+        columns = [c for c in ZERO_NUMERIC_COLUMNS if c in zero_df.columns]
+        parsed = zero_df.copy(deep=False)
+        for col in columns:
+            parsed[col] = _renumber(zero_df[col])
+        return render_csv(parsed, replace(self, decimal=self.zero_decimal),
+                          header=True, numeric=columns)
+
+    def render_zero_blocks(self, zero_dfs: List[pd.DataFrame]) -> List[str]:
+        """
+        Αποδίδει πολλά zero blocks με ένα πέρασμα ανά στήλη (ίδιο κείμενο με render_zero
+        ανά block). Τα blocks του ίδιου template ενώνονται, αποδίδονται μαζί και
+        χωρίζονται ξανά ανά block.
+        """
+        if len(zero_dfs) < 2 or any(not z.columns.equals(zero_dfs[0].columns) for z in zero_dfs):
+            return [self.render_zero(z) for z in zero_dfs]
+        combined = pd.concat(zero_dfs, ignore_index=True)
+        dialect, numeric = self, ()
+        if self.zero_decimal is not None:
+            numeric = [c for c in ZERO_NUMERIC_COLUMNS if c in combined.columns]
+            for col in numeric:
+                combined[col] = _renumber(combined[col])
+            dialect = replace(self, decimal=self.zero_decimal)
+
+        header = render_header(combined, dialect)
+        lines = render_lines(combined, dialect, numeric=numeric)
+        term = dialect.lineterminator
+        blocks, start = [], 0
+        for zero_df in zero_dfs:
+            stop = start + len(zero_df)
+            blocks.append(header + term + "".join(line + term for line in lines[start:stop]))
+            start = stop
+        return blocks
+
+
+DIALECTS: Dict[str, OutputDialect] = {}
+
+
+def register_dialect(dialect: OutputDialect) -> OutputDialect:
+    """Προσθέτει (ή αντικαθιστά) διάλεκτο στον κατάλογο"""
+    dialect.validate()
+    DIALECTS[dialect.name] = dialect
+    return dialect
+
+
+# Η ιστορική μορφή (δείγματα με ".", zero blocks όπως το template)
+DEFAULT_DIALECT = register_dialect(OutputDialect("default"))
+# Ενιαία τελεία ως υποδιαστολή, CRLF
+register_dialect(OutputDialect("dot", zero_decimal=".", lineterminator="\r\n"))
+# Ελληνικό/ευρωπαϊκό locale του Excel: ";" ως διαχωριστικό, "," ως υποδιαστολή, CRLF
+register_dialect(OutputDialect("comma", sep=";", decimal=",", zero_decimal=",",
+                               lineterminator="\r\n"))
+
+
+def get_dialect(settings: AppSettings = None) -> OutputDialect:
+    """Η διάλεκτος εξόδου από τις ρυθμίσεις (OUTPUT_DIALECT)"""
+    settings = settings or get_settings()
+    try:
+        return DIALECTS[settings.output_dialect]
+    except KeyError:
+        raise ValueError(
+            f"Άγνωστη διάλεκτος εξόδου: {settings.output_dialect} "
+            f"(διαθέσιμες: {', '.join(DIALECTS)})"
+        ) from None
+
+
+# ---------- WRITER ----------
+
+def _renumber(values: pd.Series) -> pd.Series:
+    """Κείμενο του zero template ("-0,01", "0", "Mean") -> αριθμοί όπου γίνεται, αλλιώς κείμενο"""
+    text = values.astype(str).str.strip()
+    numbers = pd.to_numeric(text.str.replace(",", ".", regex=False), errors="coerce")
+    formatted = format_decimal_series(numbers, ZERO_DECIMALS)
+    return formatted.where(numbers.notna(), values.astype(object))
+
+
+def _column_text(values: pd.Series) -> List[str]:
+    """Κείμενο κάθε κελιού όπως θα το έγραφε το to_csv (NaN/NA -> "")"""
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+        return values.to_numpy().astype(str).tolist()
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        arr = values.to_numpy()
+        text = arr.astype(str).astype(object)
+        text[np.isnan(arr)] = ""
+        return text.tolist()
+    arr = values.to_numpy(dtype=object, na_value=None)
+    return ["" if v is None else (v if v.__class__ is str else str(v)) for v in arr]
+
+
+def _quote(text: List[str], dialect: OutputDialect, special: str) -> List[str]:
+    """QUOTE_MINIMAL: σε εισαγωγικά μόνο τα πεδία με διαχωριστικό, εισαγωγικό ή αλλαγή γραμμής"""
+    q = dialect.quotechar
+    if dialect.quoting == csv.QUOTE_ALL:
+        return [q + v.replace(q, q + q) + q for v in text]
+    # Ένας έλεγχος για όλη τη στήλη· ανά πεδίο μόνο αν υπάρχει κάποιος ειδικός χαρακτήρας
+    joined = "\x00".join(text)
+    if not any(c in joined for c in special):
+        return text
+    return [q + v.replace(q, q + q) + q if any(c in v for c in special) else v for v in text]
+
+
+def _special(dialect: OutputDialect) -> str:
+    """Χαρακτήρες που επιβάλλουν εισαγωγικά (QUOTE_MINIMAL)"""
+    return "".join(sorted(set(dialect.sep + dialect.quotechar + "\r\n" + dialect.lineterminator)))
+
+
+def render_header(df: pd.DataFrame, dialect: OutputDialect = DEFAULT_DIALECT) -> str:
+    """Η γραμμή επικεφαλίδας (χωρίς αλλαγή γραμμής)"""
+    return dialect.sep.join(_quote([str(c) for c in df.columns], dialect, _special(dialect)))
+
+
+def render_lines(df: pd.DataFrame, dialect: OutputDialect = DEFAULT_DIALECT,
+                 numeric: Iterable[str] = ()) -> List[str]:
+    """
+    Οι γραμμές δεδομένων ως κείμενο (χωρίς επικεφαλίδα και αλλαγές γραμμής), με ένα
+    πέρασμα ανά στήλη. Οι γραμμές ενός μεγάλου DataFrame μπορούν να μοιραστούν σε
+    segments χωρίς νέα απόδοση.
+    """
+    numeric = set(numeric)
+    special = _special(dialect)
+    decimal = dialect.decimal
+
+    columns: List[List[str]] = []
+    for name, values in df.items():
+        text = _column_text(values)
+        if decimal != "." and (name in numeric or values.dtype.kind == "f"):
+            text = [v.replace(".", decimal) for v in text]
+        columns.append(_quote(text, dialect, special))
+
+    if not columns:
+        return [""] * len(df)
+    return list(map(dialect.sep.join, zip(*columns)))
+
+
+def render_csv(df: pd.DataFrame, dialect: OutputDialect = DEFAULT_DIALECT,
+               header: bool = True, numeric: Iterable[str] = ()) -> str:
+    """
+    CSV writer ανά στήλη (μετατροπή σε κείμενο με numpy, χωρίς csv.writer ανά γραμμή)
+
+    Για τη διάλεκτο "default" το αποτέλεσμα είναι ίδιο με
+    df.to_csv(index=False, header=header, lineterminator="\\n").
+
+    Args:
+        df: Γραμμές προς εγγραφή
+        dialect: Διάλεκτος εξόδου
+        header: Γραμμή επικεφαλίδας
+        numeric: Στήλες κειμένου με αριθμούς (υποδιαστολή της διαλέκτου)
+    """
+    lines = render_lines(df, dialect, numeric)
+    if header:
+        lines.insert(0, render_header(df, dialect))
+    if not lines:
+        return ""
+    return dialect.lineterminator.join(lines) + dialect.lineterminator
@@ -0,0 +1,460 @@
+"""
+Module για differential έλεγχο (golden output) και benchmark των γρήγορων διαδρομών
+
+Τρέχει δίπλα-δίπλα την αναφορά και τις βελτιστοποιημένες υλοποιήσεις στα ίδια
+δεδομένα και συγκρίνει τα αποτελέσματα:
+    - CSV: run_pipeline, part files, απόδοση στη μνήμη και παράλληλη απόδοση (render
+      processes), byte-προς-byte. Για τα golden workbooks (tests/golden) η αναφορά
+      είναι το CSV της αρχικής (baseline) υλοποίησης, καταγεγραμμένο με το
+      tests/record_golden.py: ελέγχονται μορφοποίηση, διάταξη, ώρες, Sample IDs και
+      αλλαγές γραμμής. Για τα υπόλοιπα δεδομένα η αναφορά είναι η ροή των part files.
+    - Φόρμες pH: PHHandler.fill_form με openpyxl έναντι του template XML (ph_form).
+      Σύγκριση κελί-προς-κελί (τιμή, τύπος, μορφή, style).
+    - XLSX εξόδου: τα κελιά του .xlsx έναντι του CSV.
+
+Δεδομένα: τα golden workbooks, συνθετικά workbooks (--rows) και καταγεγραμμένα αρχεία
+(ή αριθμοί πρωτοκόλλου).
+Η αναφορά δίνει χρόνους και επιτάχυνση ανά διαδρομή· exit code 1 σε οποιαδήποτε διαφορά.
+
+Εκτέλεση:
+    python -m modules.differential [--rows 300 3000] [αρχείο.xlsx 1605-7 ...]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+    from .data_processor import process_data
+    from .time_handler import TimeHandler, MetadataGenerator
+    from .zero_manager import prepare_zero_data
+    from .output_generator import (FinalOutputAssembler, OutputGenerator, generate_output,
+                                   zero_nutrient_mask)
+    from .pipeline import run_pipeline
+    from .workspace import JobWorkspace
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.data_processor import process_data
+    from modules.time_handler import TimeHandler, MetadataGenerator
+    from modules.zero_manager import prepare_zero_data
+    from modules.output_generator import (FinalOutputAssembler, OutputGenerator, generate_output,
+                                          zero_nutrient_mask)
+    from modules.pipeline import run_pipeline
+    from modules.workspace import JobWorkspace
+
+
+DEFAULT_ROWS = (300, 3000)
+ANALYSIS_DATE = "16/05/2026"
+INITIAL_TIME = "10:30"
+# Render processes της διαδρομής parallel (RENDER_WORKERS)
+RENDER_CHECK_WORKERS = 2
+
+# Golden αρχεία από την baseline υλοποίηση: (όνομα, γραμμές, seed) -> <όνομα>.xlsx / <όνομα>.csv
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "golden")
+GOLDEN_PROTOCOL = "1605-6"
+GOLDEN_CASES = (
+    ("baseline-300", 300, 0),
+    ("baseline-172", 172, 1),    # ακριβώς 2 batches
+    ("baseline-40", 40, 2),      # ένα batch, χωρίς zero blocks
+)
+
+
+@dataclass
+class CheckResult:
+    """Μία διαδρομή σε ένα σύνολο δεδομένων"""
+    kind: str                       # "CSV" / "pH" / "XLSX"
+    name: str                       # π.χ. "baseline", "memory"
+    seconds: float
+    reference: bool = False
+    identical: bool = True
+    detail: str = ""
+
+
+@dataclass
+class DifferentialReport:
+    """Αποτελέσματα για ένα workbook (συνθετικό ή καταγεγραμμένο)"""
+    label: str
+    rows: int
+    results: List[CheckResult] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and all(r.identical for r in self.results)
+
+    def format(self) -> str:
+        """Κείμενο αναφοράς (για CLI)"""
+        lines = [f"🧪 {self.label} ({self.rows} γραμμές)"]
+        if self.error:
+            lines.append(f"  ❌ {self.error}")
+        baselines = {r.kind: r.seconds for r in self.results if r.reference}
+        for r in self.results:
+            if r.reference:
+                status = "(αναφορά)"
+            else:
+                base = baselines.get(r.kind)
+                speedup = f"x{base / r.seconds:.1f}" if base and r.seconds > 0 else "  - "
+                mark = "✅" if r.identical else "❌"
+                status = f"{speedup:>6}  {mark} {r.detail}"
+            lines.append(f"  {r.kind:<5}{r.name:<10}{r.seconds:8.3f}s  {status}")
+        return "\n".join(lines)
+
+
+# ---------- ΔΕΔΟΜΕΝΑ ----------
+
+def generate_workbook(rows: int, seed: int = 0, zero_nutrients: bool = True) -> pd.DataFrame:
+    """
+    Συνθετικό DataFrame όπως το Excel του οργάνου (ονόματα στηλών με τις παραλλαγές
+    που διορθώνει το HeaderResolver, μηδενικά nutrients, τιμές στο μισό για τη στρογγυλοποίηση)
+
+    Args:
+        rows: Γραμμές
+        seed: Seed του γεννήτορα
+        zero_nutrients: Μία γραμμή με Fat=Protein=Lactose=0 (αφαιρείται στην επεξεργασία)
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "a/a": np.arange(1, rows + 1),
+        "Unnamed: 1": [""] * rows,
+        "PH": np.round(rng.uniform(6.2, 6.9, rows), 2),
+        "fat": np.round(rng.uniform(0, 6, rows), 2),
+        "proteine": np.round(rng.uniform(2, 5, rows), 2),
+        "lactose ": np.round(rng.uniform(3, 6, rows), 2),
+        "freeze point": np.round(rng.uniform(-0.56, -0.5, rows), 4),
+        "syal": [1] * rows,
+    })
+    if rows > 10:
+        if zero_nutrients:
+            df.loc[5, ["fat", "proteine", "lactose "]] = 0
+        df.loc[7, "fat"] = 2.675
+        df.loc[9, "freeze point"] = -0.52345
+    return df
+
+
+def _prepare(excel_df: pd.DataFrame, protocol: str, settings: AppSettings):
+    """Τα δεδομένα εισόδου του generate_output (όπως στο run_pipeline, χωρίς QC / archive)"""
+    processed = process_data(excel_df, settings)
+    time_handler = TimeHandler(len(processed), settings)
+    sample_ids = time_handler.generate_sample_ids(protocol[:4], protocol[4:] or "-1")
+
+    output_df = processed
+    mask = zero_nutrient_mask(processed) if settings.drop_zero_nutrients else None
+    if mask is not None and mask.any():
+        output_df = processed.loc[~mask].reset_index(drop=True)
+        sample_ids = [sid for sid, drop in zip(sample_ids, mask) if not drop]
+
+    sample_times, zero_times = TimeHandler(len(output_df), settings).generate_sample_times(INITIAL_TIME)
+    metadata = MetadataGenerator.generate_metadata(len(output_df), ANALYSIS_DATE, settings)
+    metadata.update(protocol_number=protocol, sample_ids=sample_ids,
+                    sample_times=sample_times, zero_times=zero_times)
+
+    with JobWorkspace(settings, label=protocol) as workspace:
+        zero_dfs = prepare_zero_data(len(output_df), ANALYSIS_DATE, zero_times, workspace.settings)
+    return processed, output_df, metadata, zero_dfs
+
+
+# ---------- GOLDEN ----------
+
+def golden_cases(directory: str = GOLDEN_DIR) -> List[Tuple[str, str, bytes]]:
+    """(όνομα, workbook εισόδου, bytes αναμενόμενου CSV) για όσα golden αρχεία υπάρχουν"""
+    cases = []
+    for name, _, _ in GOLDEN_CASES:
+        source = os.path.join(directory, f"{name}.xlsx")
+        expected = os.path.join(directory, f"{name}.csv")
+        if os.path.exists(source) and os.path.exists(expected):
+            with open(expected, "rb") as f:
+                cases.append((name, source, f.read()))
+    return cases
+
+
+# ---------- ΣΥΓΚΡΙΣΕΙΣ ----------
+
+def diff_bytes(expected: bytes, actual: bytes) -> str:
+    """Περιγραφή της πρώτης διαφοράς ("" αν τα bytes είναι ίδια)"""
+    if expected == actual:
+        return ""
+    limit = min(len(expected), len(actual))
+    offset = next((i for i in range(limit) if expected[i] != actual[i]), limit)
+    line = expected.count(b"\n", 0, offset) + 1
+    exp_line = expected.splitlines()[line - 1] if line <= len(expected.splitlines()) else b""
+    act_line = actual.splitlines()[line - 1] if line <= len(actual.splitlines()) else b""
+    return (f"byte {offset}, γραμμή {line}: αναμενόταν {exp_line[:80]!r}, "
+            f"βρέθηκε {act_line[:80]!r} (μέγεθος {len(expected)} / {len(actual)})")
+
+
+def workbook_cells(path: str) -> Dict[str, Dict[str, tuple]]:
+    """Φύλλο -> κελί -> (τιμή, τύπος, μορφή αριθμού, style) για σύγκριση κελί-προς-κελί"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path)
+    out = {}
+    for ws in wb.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for c in row:
+                if c.value is not None or c.has_style:
+                    style = (repr(c.font), repr(c.border), repr(c.fill), repr(c.alignment))
+                    cells[c.coordinate] = (c.value, type(c.value).__name__, c.number_format, style)
+        cells["<merged>"] = tuple(sorted(str(r) for r in ws.merged_cells.ranges))
+        out[ws.title] = cells
+    return out
+
+
+def diff_cells(expected: Dict[str, Dict[str, tuple]], actual: Dict[str, Dict[str, tuple]]) -> str:
+    """Περιγραφή της πρώτης διαφοράς κελιού ("" αν είναι ίδια)"""
+    if list(expected) != list(actual):
+        return f"φύλλα {list(expected)} / {list(actual)}"
+    for title, cells in expected.items():
+        other = actual[title]
+        for ref in sorted(set(cells) | set(other)):
+            a, b = cells.get(ref), other.get(ref)
+            if a != b:
+                if a is not None and b is not None and a[:3] == b[:3]:
+                    return f"{title}!{ref}: διαφορετικό style"
+                return f"{title}!{ref}: {a[:3] if a else None} / {b[:3] if b else None}"
+    return ""
+
+
+def diff_xlsx_csv(xlsx_path: str, csv_bytes: bytes) -> str:
+    """Κελιά του .xlsx εξόδου έναντι των πεδίων του CSV ("" αν αντιστοιχούν)"""
+    import csv
+    from openpyxl import load_workbook
+
+    wb = load_workbook(xlsx_path, read_only=True)
+    try:
+        rows = list(wb.worksheets[0].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    lines = list(csv.reader(csv_bytes.decode("utf-8").splitlines()))
+    if len(rows) != len(lines):
+        return f"γραμμές {len(rows)} / {len(lines)}"
+    for n, (row, fields) in enumerate(zip(rows, lines), 1):
+        for value, text in zip(row, fields):
+            if value is None:
+                same = text == ""
+            elif isinstance(value, (int, float)):
+                try:
+                    same = float(text.replace(",", ".")) == value
+                except ValueError:
+                    same = False
+            else:
+                same = str(value) == text
+            if not same:
+                return f"γραμμή {n}: {value!r} / {text!r}"
+    return ""
+
+
+def _timed(func: Callable, *args, **kwargs) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _default_form_template(path: str):
+    """Απλό template φόρμας pH (όταν δεν υπάρχει το PH_FORM_TEMPLATE_PATH)"""
+    from openpyxl import Workbook
+    from openpyxl.styles import Border, Font, Side
+
+    thin = Side(style="thin")
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "pH"
+    ws.merge_cells("A1:H1")
+    ws["A1"] = "ΦΟΡΜΑ pH"
+    ws["A1"].font = Font(bold=True)
+    for col, label in zip("ABDEGH", ["pH", "a/a"] * 3):
+        ws[f"{col}2"] = label
+    for row in range(3, 53):
+        for col in "ABDEGH":
+            ws[f"{col}{row}"].border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            if col in "ADG":
+                ws[f"{col}{row}"].number_format = "0.00"
+    ws["J1"] = "=AVERAGE(A3:A52)"
+    wb.save(path)
+
+
+# ---------- ΕΚΤΕΛΕΣΗ ----------
+
+def run_differential(excel_df: pd.DataFrame, label: str, protocol: str = "1605-6",
+                     settings: AppSettings = None, keep_dir: str = None,
+                     quiet: bool = False, expected: bytes = None) -> DifferentialReport:
+    """
+    Τρέχει αναφορά και γρήγορες διαδρομές σε ένα workbook και συγκρίνει τα αποτελέσματα
+
+    Args:
+        excel_df: Το DataFrame εισόδου (όπως από το read_input)
+        label: Όνομα για την αναφορά
+        protocol: Πρωτόκολλο (όνομα αρχείου εξόδου / Sample IDs)
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        keep_dir: Αν δοθεί, οι έξοδοι μένουν σε αυτόν τον φάκελο
+        quiet: Χωρίς τα μηνύματα προόδου του pipeline
+        expected: Αναμενόμενο τελικό CSV (golden από την baseline)· None: αναφορά
+            είναι η ροή των part files
+    """
+    base = settings or get_settings()
+    root = keep_dir or tempfile.mkdtemp(prefix="differential-")
+    os.makedirs(root, exist_ok=True)
+    # Έξοδοι μόνο μέσα στο root, με την ιστορική μορφή
+    settings = replace(base, app_path=root, parts_path=os.path.join(root, "parts"),
+                       output_path=os.path.join(root, "reference"), output_dialect="default",
+                       output_xlsx=False, archive_samples=False,
+                       memory_profile=False, qc_write_remarks=False)
+    report = DifferentialReport(label=label, rows=len(excel_df))
+
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    try:
+        with output:
+            _run_checks(excel_df, protocol, settings, base, root, report, expected)
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+    finally:
+        if keep_dir is None:
+            shutil.rmtree(root, ignore_errors=True)
+    return report
+
+
+def _run_checks(excel_df: pd.DataFrame, protocol: str, settings: AppSettings, base: AppSettings,
+                root: str, report: DifferentialReport, expected: bytes = None):
+    processed, output_df, metadata, zero_dfs = _prepare(excel_df, protocol, settings)
+
+    def output(name: str, in_memory: bool, workers: int = 1) -> Tuple[float, bytes]:
+        variant = replace(settings, output_path=os.path.join(root, name))
+        seconds, path = _timed(generate_output, output_df, metadata, zero_dfs,
+                               drop_zero_nutrients=False, settings=variant,
+                               in_memory=in_memory, xlsx=False, render_workers=workers)
+        with open(path, "rb") as f:
+            return seconds, f.read()
+
+    def compare(name: str, seconds: float, actual: bytes):
+        detail = diff_bytes(expected, actual)
+        report.results.append(CheckResult("CSV", name, seconds, identical=not detail,
+                                          detail=detail or "ίδια bytes"))
+
+    # CSV: αναφορά (golden της baseline ή part files) + κάθε διαδρομή σε δικό της φάκελο
+    # parallel: render processes ανεξάρτητα από το PARALLEL_MIN_ROWS, για να ελέγχεται
+    # και στα μικρά αρχεία
+    variants = [("parts", False), ("memory", True), ("parallel", True, RENDER_CHECK_WORKERS)]
+    if expected is None:
+        seconds, expected = output(*variants.pop(0))
+        report.results.append(CheckResult("CSV", "parts", seconds, reference=True))
+    else:
+        report.results.append(CheckResult("CSV", "baseline", 0.0, reference=True))
+    for name, *args in variants:
+        compare(name, *output(name, *args))
+
+    # Ολόκληρο το run_pipeline (διάταξη, ώρες, Sample IDs, zero blocks) στα ίδια δεδομένα
+    pipeline_settings = replace(settings, output_path=os.path.join(root, "pipeline"))
+    seconds, result = _timed(run_pipeline, excel_df, protocol, protocol[:4], protocol[4:] or "-1",
+                             ANALYSIS_DATE, INITIAL_TIME, settings=pipeline_settings,
+                             log=lambda text: None)
+    with open(result["final_path"], "rb") as f:
+        compare("pipeline", seconds, f.read())
+
+    # XLSX εξόδου: ίδια κελιά με το CSV
+    generator = OutputGenerator(output_df, metadata, settings)
+    generator.create_filled_dataframe()
+    assembler = FinalOutputAssembler(protocol_number=protocol,
+                                     settings=replace(settings, output_path=os.path.join(root, "xlsx")))
+    chunks = generator.break_into_parts()
+    seconds, xlsx_path = _timed(assembler.assemble_xlsx, chunks, zero_dfs, tuple(generator.precision))
+    detail = diff_xlsx_csv(xlsx_path, expected)
+    report.results.append(CheckResult("XLSX", "stream", seconds, identical=not detail,
+                                      detail=detail or "ίδια κελιά με το CSV"))
+
+    _check_ph_forms(processed, base, root, report)
+
+
+def _check_ph_forms(processed: pd.DataFrame, settings: AppSettings, root: str,
+                    report: DifferentialReport):
+    try:
+        from .pH_handler import PHHandler
+    except ImportError:
+        from modules.pH_handler import PHHandler
+
+    template = str(settings.ph_form_template_path)
+    if not os.path.exists(template):
+        template = os.path.join(root, "ph_template.xlsx")
+        _default_form_template(template)
+
+    handler = PHHandler(processed)
+    if handler.missing_ph_aas():
+        report.results.append(CheckResult("pH", "skip", 0.0, reference=True))
+        return
+
+    paths = {}
+    for name, fast in (("openpyxl", False), ("xml", True)):
+        out_dir = os.path.join(root, f"ph-{name}")
+        os.makedirs(out_dir, exist_ok=True)
+        seconds, paths[name] = _timed(handler.fill_form, template, os.path.join(out_dir, "ph.xlsx"),
+                                      fast=fast)
+        report.results.append(CheckResult("pH", name, seconds, reference=not fast))
+
+    detail = ""
+    if len(paths["openpyxl"]) != len(paths["xml"]):
+        detail = f"φόρμες {len(paths['openpyxl'])} / {len(paths['xml'])}"
+    for expected, actual in zip(paths["openpyxl"], paths["xml"]):
+        detail = detail or diff_cells(workbook_cells(expected), workbook_cells(actual))
+    fast = report.results[-1]
+    fast.identical = not detail
+    fast.detail = detail or f"ίδια κελιά ({len(paths['xml'])} φόρμες)"
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Differential έλεγχος και benchmark των γρήγορων διαδρομών")
+    parser.add_argument("files", nargs="*", help="Καταγεγραμμένα αρχεία ή αριθμοί πρωτοκόλλου")
+    parser.add_argument("--rows", type=int, nargs="*", default=list(DEFAULT_ROWS),
+                        help="Μεγέθη συνθετικών workbooks (default: 300 3000)")
+    parser.add_argument("--keep", default=None, help="Φάκελος για να κρατηθούν οι έξοδοι")
+    args = parser.parse_args(argv)
+
+    try:
+        from .catalog import get_catalog
+        from .data_loader import read_input
+    except ImportError:
+        from modules.catalog import get_catalog
+        from modules.data_loader import read_input
+
+    settings = get_settings()
+    jobs: List[Tuple[str, str, Optional[Callable[[], pd.DataFrame]], Optional[bytes]]] = [
+        (f"golden-{name}", GOLDEN_PROTOCOL, lambda source=source: read_input(source, settings), expected)
+        for name, source, expected in golden_cases()
+    ]
+    jobs += [
+        (f"συνθετικό-{rows}", "1605-6", lambda rows=rows: generate_workbook(rows), None)
+        for rows in args.rows
+    ]
+    for name in args.files:
+        path = name
+        if not os.path.exists(path):
+            entry = get_catalog(settings).lookup(name)
+            path = entry.path if entry is not None else None
+        protocol = os.path.splitext(os.path.basename(path or name))[0]
+        jobs.append((os.path.basename(path or name), protocol,
+                     (lambda path=path: read_input(path, settings)) if path else None, None))
+
+    failed = 0
+    for i, (label, protocol, load, expected) in enumerate(jobs):
+        if load is None:
+            print(f"❌ Δεν βρέθηκε: {label}\n")
+            failed += 1
+            continue
+        keep = os.path.join(args.keep, f"{i + 1}-{protocol}") if args.keep else None
+        report = run_differential(load(), label, protocol, settings, keep, quiet=True,
+                                  expected=expected)
+        print(report.format())
+        print()
+        failed += 0 if report.ok else 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
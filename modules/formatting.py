@@ -0,0 +1,157 @@
+"""
+Module για τη μορφοποίηση αριθμητικών στηλών κατά την εγγραφή (render time)
+
+Το επεξεργασμένο DataFrame κρατά τα nutrients ως αριθμούς. Η μετατροπή σε κείμενο
+με συγκεκριμένα δεκαδικά γίνεται μία φορά, vectorized, λίγο πριν το CSV/Excel.
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .settings import AppSettings
+except ImportError:
+    from modules.settings import AppSettings
+
+
+PRECISION_ATTR = "precision"
+# Στήλες αποθηκευμένες ως ακέραιοι: {στήλη: δεκαδικά της κλίμακας}
+FIXED_POINT_ATTR = "fixed_point"
+FIXED_POINT_DTYPE = "Int32"
+
+
+def precision_spec(settings: AppSettings) -> Dict[str, int]:
+    """
+    Δεκαδικά ανά στήλη από τις ρυθμίσεις (TWO_DECIMAL_COLS / FOUR_DECIMAL_COLS)
+
+    Returns:
+        Dict[str, int]: π.χ. {'Fat': 2, 'Protein': 2, 'Lactose': 2, 'FPD': 4}
+    """
+    spec = {col: 2 for col in settings.two_decimal_cols}
+    spec.update({col: 4 for col in settings.four_decimal_cols})
+    return spec
+
+
+def quantize_series(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Στρογγυλοποίηση ίδια με float(f"{x:.{decimals}f}") αλλά vectorized.
+    Το np.round διαφέρει μόνο όταν η τιμή είναι (σχεδόν) στο μισό (π.χ. 2.675),
+    οπότε μόνο αυτές οι λίγες τιμές στρογγυλοποιούνται με το format της Python.
+
+    Args:
+        values: Αριθμητική στήλη
+        decimals: Πλήθος δεκαδικών
+
+    Returns:
+        pd.Series: float στήλη
+    """
+    arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    rounded = np.round(arr, decimals)
+
+    scaled = np.abs(arr * (10 ** decimals))
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [float(f"{x:.{decimals}f}") for x in arr[near_half]]
+
+    return pd.Series(rounded, index=values.index, name=values.name)
+
+
+def format_decimal_series(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Vectorized εκδοχή του f"{x:.{decimals}f}".rstrip("0").rstrip(".")
+    Τα NaN μένουν NaN (γράφονται ως κενό στο CSV).
+
+    Args:
+        values: Αριθμητική στήλη
+        decimals: Πλήθος δεκαδικών
+
+    Returns:
+        pd.Series: object στήλη με κείμενο (ή NaN)
+    """
+    numeric = pd.to_numeric(values, errors="coerce")
+    arr = numeric.to_numpy(dtype=float, na_value=np.nan)
+    mask = np.isnan(arr)
+
+    out = np.full(arr.shape, np.nan, dtype=object)
+    if (~mask).any():
+        text = np.char.mod(f"%.{decimals}f", arr[~mask])
+        text = np.char.rstrip(np.char.rstrip(text, "0"), ".")
+        out[~mask] = text.astype(object)
+
+    return pd.Series(out, index=values.index, name=values.name, dtype=object)
+
+
+def to_fixed_point(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Μετατρέπει αριθμητική στήλη σε ακέραιους μονάδων 10^-decimals (Int32, με NA)
+    π.χ. 3.45 με decimals=2 -> 345
+
+    Args:
+        values: Αριθμητική στήλη
+        decimals: Δεκαδικά της κλίμακας
+    """
+    quantized = quantize_series(values, decimals).to_numpy()
+    mask = np.isnan(quantized)
+    ints = np.rint(np.where(mask, 0, quantized) * (10 ** decimals)).astype(np.int32)
+    array = pd.arrays.IntegerArray(ints, mask)
+    return pd.Series(array, index=values.index, name=values.name)
+
+
+def from_fixed_point(values: pd.Series, decimals: int) -> pd.Series:
+    """Ακέραιοι μονάδων 10^-decimals -> float (NA -> NaN)"""
+    return values.astype("float64") / (10 ** decimals)
+
+
+def format_fixed_series(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Ακέραιοι μονάδων 10^-decimals -> κείμενο χωρίς μηδενικά στο τέλος
+    (ίδια μορφή με format_decimal_series, μόνο με ακέραιες πράξεις)
+    π.χ. 345 -> "3.45", 350 -> "3.5", 300 -> "3", -5415 (decimals=4) -> "-0.5415"
+    Διαφορά από το float: μια αρνητική τιμή που στρογγυλεύεται σε 0 γράφεται "0", όχι "-0".
+    """
+    ints = values.to_numpy(dtype="float64", na_value=np.nan)
+    mask = np.isnan(ints)
+
+    out = np.full(ints.shape, np.nan, dtype=object)
+    if (~mask).any():
+        v = ints[~mask].astype(np.int64)
+        scale = 10 ** decimals
+        sign = np.where(v < 0, "-", "")
+        whole = (np.abs(v) // scale).astype(str)
+        frac = np.char.zfill((np.abs(v) % scale).astype(str), decimals)
+        frac = np.char.rstrip(frac, "0")
+        dot = np.where(np.char.str_len(frac) > 0, ".", "")
+        text = np.char.add(np.char.add(np.char.add(sign, whole), dot), frac)
+        out[~mask] = text.astype(object)
+
+    return pd.Series(out, index=values.index, name=values.name, dtype=object)
+
+
+def render_numeric_columns(df: pd.DataFrame, spec: Dict[str, int],
+                           fixed: Dict[str, int] = None) -> pd.DataFrame:
+    """
+    Επιστρέφει αντίγραφο με τις στήλες του spec μορφοποιημένες ως κείμενο
+
+    Args:
+        df: DataFrame με αριθμητικές στήλες
+        spec: Δεκαδικά ανά στήλη
+        fixed: Στήλες αποθηκευμένες ως fixed-point ακέραιοι {στήλη: δεκαδικά}.
+            Όσες δεν είναι στο spec (π.χ. TS/SNF) γίνονται πάλι float.
+
+    Returns:
+        pd.DataFrame: Έτοιμο για to_csv
+    """
+    fixed = fixed or {}
+    rendered = df.copy(deep=False)
+    for col, decimals in spec.items():
+        if col not in rendered.columns:
+            continue
+        if col in fixed:
+            rendered[col] = format_fixed_series(rendered[col], fixed[col])
+        else:
+            rendered[col] = format_decimal_series(rendered[col], decimals)
+    for col, decimals in fixed.items():
+        if col in rendered.columns and col not in spec:
+            rendered[col] = from_fixed_point(rendered[col], decimals)
+    return rendered
@@ -0,0 +1,140 @@
+"""
+Module για τη διάταξη (layout) του τελικού αρχείου σε batches δειγμάτων και zero blocks
+
+Ένα batch είναι BATCH_SIZE γραμμές μαζί με τη γραμμή επικεφαλίδας, δηλαδή
+BATCH_SIZE - 1 δείγματα. Ανάμεσα σε διαδοχικά batches μπαίνει ένα zero block
+με ZERO_BLOCK_ROWS χρονισμένες γραμμές. Μετά το τελευταίο batch δεν μπαίνει zero block.
+
+Το BatchLayout υπολογίζεται σε O(1) από το πλήθος δειγμάτων και τις ρυθμίσεις και
+το χρησιμοποιούν όλα τα στάδια: timestamps, zero blocks και χωρισμός σε parts.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .settings import AppSettings, get_settings
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+
+
+# "00:00" ... "23:59" (index = λεπτά από τα μεσάνυχτα)
+_HHMM = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)], dtype=object)
+
+
+@dataclass(frozen=True)
+class BatchLayout:
+    """Διάταξη δειγμάτων και zero blocks για συγκεκριμένο πλήθος δειγμάτων"""
+    num_samples: int
+    samples_per_batch: int
+    zero_block_rows: int
+    sample_increment: int       # δευτερόλεπτα ανά δείγμα
+    zero_increment: int         # δευτερόλεπτα ανά γραμμή zero block
+
+    @classmethod
+    def from_settings(cls, num_samples: int, settings: AppSettings = None) -> "BatchLayout":
+        settings = settings or get_settings()
+        return cls(
+            num_samples=num_samples,
+            samples_per_batch=max(1, settings.batch_size - 1),
+            zero_block_rows=settings.zero_block_rows,
+            sample_increment=settings.t_sample_increment,
+            zero_increment=settings.t_zero_increment,
+        )
+
+    # ---------- ΜΕΓΕΘΗ ----------
+
+    @property
+    def num_batches(self) -> int:
+        return -(-self.num_samples // self.samples_per_batch)
+
+    @property
+    def zero_count(self) -> int:
+        """Zero blocks: ένα ανάμεσα σε κάθε ζεύγος διαδοχικών batches"""
+        return max(0, self.num_batches - 1)
+
+    @property
+    def total_rows(self) -> int:
+        """Χρονισμένες γραμμές (δείγματα + γραμμές zero blocks)"""
+        return self.num_samples + self.zero_count * self.zero_block_rows
+
+    @property
+    def last_batch_samples(self) -> int:
+        if self.num_samples == 0:
+            return 0
+        return self.num_samples - (self.num_batches - 1) * self.samples_per_batch
+
+    # ---------- ΘΕΣΕΙΣ ----------
+
+    def batch_of(self, sample: int) -> int:
+        return sample // self.samples_per_batch
+
+    def sample_bounds(self, batch: int) -> Tuple[int, int]:
+        """[start, stop) δειγμάτων του batch"""
+        start = batch * self.samples_per_batch
+        return start, min(self.num_samples, start + self.samples_per_batch)
+
+    def row_at(self, row: int) -> Tuple[str, int, int]:
+        """
+        Τι βρίσκεται στη χρονισμένη γραμμή row (0-based) του αρχείου
+
+        Returns:
+            ("sample", i, -1) ή ("zero", k, j): δείγμα i ή γραμμή j του zero block k
+        """
+        if not 0 <= row < self.total_rows:
+            raise IndexError(f"Γραμμή {row} εκτός layout ({self.total_rows} γραμμές)")
+        segment = self.samples_per_batch + self.zero_block_rows
+        batch, pos = divmod(row, segment)
+        if pos < self.samples_per_batch:
+            return "sample", batch * self.samples_per_batch + pos, -1
+        return "zero", batch, pos - self.samples_per_batch
+
+    def iter_segments(self) -> Iterator[Tuple[int, int, int, Optional[int]]]:
+        """(batch, start, stop, zero block που ακολουθεί ή None) με τη σειρά του αρχείου"""
+        for batch in range(self.num_batches):
+            start, stop = self.sample_bounds(batch)
+            yield batch, start, stop, (batch if batch < self.zero_count else None)
+
+    # ---------- ΧΡΟΝΟΙ ----------
+
+    def sample_offset(self, sample: int) -> int:
+        """Δευτερόλεπτα από την αρχική ώρα για το δείγμα sample (0-based)"""
+        batch = self.batch_of(sample)
+        return ((sample + 1) * self.sample_increment
+                + batch * self.zero_block_rows * self.zero_increment)
+
+    def zero_offset(self, block: int, row: int) -> int:
+        """Δευτερόλεπτα από την αρχική ώρα για τη γραμμή row του zero block block"""
+        return ((block + 1) * self.samples_per_batch * self.sample_increment
+                + (block * self.zero_block_rows + row + 1) * self.zero_increment)
+
+    def sample_offsets(self) -> np.ndarray:
+        samples = np.arange(self.num_samples, dtype=np.int64)
+        batches = samples // self.samples_per_batch
+        return ((samples + 1) * self.sample_increment
+                + batches * self.zero_block_rows * self.zero_increment)
+
+    def zero_offsets(self) -> np.ndarray:
+        """Offsets όλων των γραμμών zero blocks, block-προς-block"""
+        blocks = np.repeat(np.arange(self.zero_count, dtype=np.int64), self.zero_block_rows)
+        rows = np.tile(np.arange(self.zero_block_rows, dtype=np.int64), self.zero_count)
+        return ((blocks + 1) * self.samples_per_batch * self.sample_increment
+                + (blocks * self.zero_block_rows + rows + 1) * self.zero_increment)
+
+    def sample_times(self, initial_time: str) -> List[str]:
+        """Ώρες HH:MM για όλα τα δείγματα"""
+        return _format_times(initial_time, self.sample_offsets())
+
+    def zero_times(self, initial_time: str) -> List[str]:
+        """Ώρες HH:MM για όλες τις γραμμές zero blocks"""
+        return _format_times(initial_time, self.zero_offsets())
+
+
+def _format_times(initial_time: str, offsets: np.ndarray) -> List[str]:
+    """Αρχική ώρα + offsets (δευτερόλεπτα) -> 'HH:MM' (με αναδίπλωση στα μεσάνυχτα)"""
+    start = datetime.strptime(initial_time, "%H:%M")
+    start_seconds = start.hour * 3600 + start.minute * 60
+    minutes = ((start_seconds + offsets) // 60) % (24 * 60)
+    return _HHMM[minutes].tolist()
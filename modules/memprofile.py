@@ -0,0 +1,332 @@
+"""
+Module για προφίλ μνήμης ανά στάδιο του pipeline (opt-in: MEMORY_PROFILE)
+
+Γύρω από κάθε στάδιο κρατά:
+    - tracemalloc snapshot πριν / μετά και το peak των Python/numpy allocations
+    - peak RSS του process (resource.getrusage στο Linux/macOS, GetProcessMemoryInfo στα Windows)
+    - τις γραμμές κώδικα με τις μεγαλύτερες allocations (όσες παραμένουν στο τέλος του
+      σταδίου), με απόδοση στη γραμμή της εφαρμογής που τις προκάλεσε και όχι μόνο στη
+      γραμμή μέσα σε pandas / numpy
+
+Η αναφορά (JSON) γράφεται στον φάκελο του telemetry (<APP_PATH>/gui/memory_profiles).
+Το peak RSS αφορά όλο το process: σε μόνιμο worker είναι το μέγιστο από την εκκίνησή
+του, γι' αυτό ανά στάδιο αναφέρεται και η αύξηση του peak (rss_growth).
+
+Το tracemalloc επιβραδύνει αισθητά την επεξεργασία· προορίζεται για διάγνωση και
+για το μέγεθος των batch workers, όχι για κανονική χρήση.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .settings import AppSettings, get_settings
+    from .workspace import atomic_output
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.workspace import atomic_output
+
+
+# Frames ανά allocation (αρκετά για να φτάσουν από pandas/numpy στον κώδικα της εφαρμογής)
+TRACE_FRAMES = 32
+# Γραμμές κώδικα ανά στάδιο στην αναφορά
+TOP_LINES = 10
+# Πόσες αναφορές κρατούνται στον φάκελο
+KEEP_REPORTS = 30
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_THIS_FILE = os.path.abspath(__file__)
+_MB = 1024 * 1024
+
+
+# ---------- RSS ----------
+
+def _windows_memory() -> Tuple[int, int]:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    get_info = ctypes.windll.psapi.GetProcessMemoryInfo
+    get_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not get_info(handle, ctypes.byref(counters), counters.cb):
+        return 0, 0
+    return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+
+def rss_bytes() -> Tuple[int, int]:
+    """
+    Τρέχον και μέγιστο RSS του process σε bytes (0 όπου δεν είναι διαθέσιμο)
+
+    Returns:
+        (current, peak)
+    """
+    if sys.platform == "win32":
+        try:
+            return _windows_memory()
+        except (OSError, AttributeError):
+            return 0, 0
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bytes
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    current = 0
+    try:
+        with open("/proc/self/statm", "r") as f:
+            current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    return current, peak
+
+
+# ---------- ΑΝΑΦΟΡΑ ----------
+
+@dataclass
+class LineStat:
+    """Allocations που παραμένουν στο τέλος ενός σταδίου, ανά γραμμή κώδικα"""
+    location: str           # αρχείο:γραμμή της εφαρμογής (ή της βιβλιοθήκης αν δεν βρεθεί)
+    size: int               # καθαρή μεταβολή σε bytes
+    count: int              # καθαρή μεταβολή σε blocks
+    origin: str = ""        # η εσωτερική γραμμή της allocation (π.χ. μέσα στο pandas)
+
+
+@dataclass
+class StageMemory:
+    """Μνήμη ενός σταδίου"""
+    name: str
+    seconds: float
+    traced_peak: int        # peak των tracemalloc allocations κατά το στάδιο
+    traced_delta: int       # allocations που έμειναν μετά το στάδιο
+    rss: int                # RSS στο τέλος του σταδίου
+    rss_peak: int           # peak RSS του process στο τέλος του σταδίου
+    rss_growth: int         # πόσο ανέβηκε το peak RSS μέσα στο στάδιο
+    top: List[LineStat] = field(default_factory=list)
+
+
+@dataclass
+class MemoryReport:
+    """Προφίλ μνήμης μιας εκτέλεσης"""
+    label: str
+    started: str
+    samples: int = 0
+    stages: List[StageMemory] = field(default_factory=list)
+    path: Optional[str] = None
+
+    @property
+    def peak_bytes(self) -> int:
+        """Μέγιστο traced peak από όλα τα στάδια"""
+        return max((s.traced_peak for s in self.stages), default=0)
+
+    @property
+    def rss_peak(self) -> int:
+        return max((s.rss_peak for s in self.stages), default=0)
+
+    @property
+    def bytes_per_sample(self) -> Optional[float]:
+        return self.peak_bytes / self.samples if self.samples else None
+
+    def summary(self) -> dict:
+        """Σύνοψη για το telemetry (JSON-friendly, μικρή)"""
+        return {
+            "peak_mb": round(self.peak_bytes / _MB, 2),
+            "rss_peak_mb": round(self.rss_peak / _MB, 2),
+            "kb_per_sample": None if self.bytes_per_sample is None else round(self.bytes_per_sample / 1024, 2),
+            "report": self.path,
+        }
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(self.summary())
+        return data
+
+    def format(self) -> str:
+        """Κείμενο αναφοράς (για log / CLI)"""
+        lines = [f"🧠 Μνήμη ανά στάδιο ({self.label}, {self.samples} δείγματα):"]
+        for stage in self.stages:
+            lines.append(
+                f"   • {stage.name}: peak {stage.traced_peak / _MB:.1f} MB, "
+                f"παραμένουν {stage.traced_delta / _MB:+.1f} MB, RSS {stage.rss / _MB:.0f} MB "
+                f"(peak {stage.rss_peak / _MB:.0f} MB, {stage.rss_growth / _MB:+.0f}), {stage.seconds:.2f}s"
+            )
+            for line in stage.top[:3]:
+                lines.append(f"       {line.size / _MB:+.2f} MB  {line.location}")
+        per_sample = self.bytes_per_sample
+        if per_sample is not None:
+            lines.append(f"   Σύνολο: peak {self.peak_bytes / _MB:.1f} MB, {per_sample / 1024:.1f} KB/δείγμα")
+        if self.path:
+            lines.append(f"   📄 {self.path}")
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _app_relpath(filename: str) -> Optional[str]:
+    """Διαδρομή σχετική με την εφαρμογή, ή None για βιβλιοθήκες και για αυτό το module"""
+    if filename.startswith("<"):
+        return None
+    path = os.path.abspath(filename)
+    if path == _THIS_FILE or not path.startswith(_APP_ROOT) or "site-packages" in path:
+        return None
+    return os.path.relpath(path, _APP_ROOT)
+
+
+def _app_frame(traceback) -> Tuple[str, str]:
+    """(γραμμή της εφαρμογής, εσωτερική γραμμή) για ένα traceback του tracemalloc"""
+    frames = list(traceback)
+    inner = frames[-1]
+    origin = f"{inner.filename}:{inner.lineno}"
+    # Τα frames είναι από το παλαιότερο προς το πιο πρόσφατο
+    for frame in reversed(frames):
+        relpath = _app_relpath(frame.filename)
+        if relpath is not None:
+            return f"{relpath}:{frame.lineno}", origin
+    return origin, origin
+
+
+def _top_lines(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+               limit: int = TOP_LINES) -> List[LineStat]:
+    """Οι γραμμές της εφαρμογής με τη μεγαλύτερη καθαρή αύξηση allocations"""
+    grouped: Dict[str, LineStat] = {}
+    for diff in after.compare_to(before, "traceback"):
+        # Χωρίς τις allocations του ίδιου του tracemalloc (το snapshot "before")
+        if diff.size_diff <= 0 or diff.traceback[-1].filename == tracemalloc.__file__:
+            continue
+        location, origin = _app_frame(diff.traceback)
+        stat = grouped.get(location)
+        if stat is None:
+            grouped[location] = LineStat(location, diff.size_diff, diff.count_diff, origin)
+        else:
+            stat.size += diff.size_diff
+            stat.count += diff.count_diff
+    return sorted(grouped.values(), key=lambda s: s.size, reverse=True)[:limit]
+
+
+class MemoryProfiler:
+    """
+    Προφίλ μνήμης ανά στάδιο (με enabled=False κάθε stage() είναι no-op)
+
+    Χρήση:
+        profiler = MemoryProfiler(enabled=settings.memory_profile, label="1605-6")
+        with profiler.stage("process_data"):
+            ...
+        profiler.finish(settings, samples=len(df))
+    """
+
+    def __init__(self, enabled: bool = True, label: str = "run", top: int = TOP_LINES):
+        self.enabled = enabled
+        self.top = top
+        self.report = MemoryReport(label=label, started=datetime.now().isoformat(timespec="seconds"))
+        self._owns_tracing = False
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._owns_tracing = True
+
+    def stage(self, name: str):
+        """Context manager που μετρά ένα στάδιο"""
+        if not self.enabled:
+            return nullcontext()
+        return self._stage(name)
+
+    @contextmanager
+    def _stage(self, name: str):
+        _, rss_peak_before = rss_bytes()
+        untraced, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        traced_before, _ = tracemalloc.get_traced_memory()
+        # Το snapshot "before" μένει στη μνήμη όσο τρέχει το στάδιο· αφαιρείται από το peak
+        overhead = traced_before - untraced
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            rss, rss_peak = rss_bytes()
+            self.report.stages.append(StageMemory(
+                name=name,
+                seconds=round(seconds, 4),
+                traced_peak=traced_peak - overhead,
+                traced_delta=traced_after - traced_before,
+                rss=rss,
+                rss_peak=rss_peak,
+                rss_growth=max(0, rss_peak - rss_peak_before),
+                top=_top_lines(before, after, self.top),
+            ))
+
+    def stop(self):
+        """Σταματά το tracemalloc (μόνο αν το ξεκίνησε αυτός ο profiler)"""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def finish(self, settings: AppSettings = None, samples: int = None,
+               directory: str = None) -> Optional[MemoryReport]:
+        """
+        Σταματά το tracing και γράφει την αναφορά
+
+        Args:
+            settings: Ρυθμίσεις εφαρμογής (για τον φάκελο του telemetry)
+            samples: Δείγματα της εκτέλεσης (για τη μνήμη ανά δείγμα)
+            directory: Φάκελος αναφοράς (default: report_directory())
+
+        Returns:
+            MemoryReport ή None αν ο profiler είναι ανενεργός
+        """
+        if not self.enabled:
+            return None
+        self.stop()
+        if samples is not None:
+            self.report.samples = samples
+        self.report.path = write_report(self.report, directory, settings)
+        return self.report
+
+
+def report_directory(settings: AppSettings = None) -> str:
+    """Φάκελος αναφορών μνήμης (δίπλα στο usage_stats.json του telemetry)"""
+    settings = settings or get_settings()
+    return os.path.join(settings.app_path, "gui", "memory_profiles")
+
+
+def write_report(report: MemoryReport, directory: str = None, settings: AppSettings = None) -> str:
+    """Γράφει την αναφορά ως JSON και κρατά τις KEEP_REPORTS πιο πρόσφατες"""
+    directory = directory or report_directory(settings)
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    safe_label = "".join(c if c.isalnum() or c in "-_" else "_" for c in report.label)
+    path = os.path.join(directory, f"{stamp}_{safe_label}.json")
+    report.path = path
+    with atomic_output(path, encoding="utf-8") as f:
+        json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+
+    reports = sorted(n for n in os.listdir(directory) if n.endswith(".json"))
+    for old in reports[:-KEEP_REPORTS]:
+        try:
+            os.remove(os.path.join(directory, old))
+        except OSError:
+            pass
+    return path
@@ -0,0 +1,154 @@
+"""
+Module για συγχώνευση πολλών αρχείων πρωτοκόλλου σε μία συνεχή εκτέλεση
+(ένα τελικό αρχείο με συνεχόμενα timestamps και zero blocks)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+    from .data_loader import parse_protocol_number, read_input
+    from .columns import resolve_columns
+    from .pipeline import run_pipeline
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.data_loader import parse_protocol_number, read_input
+    from modules.columns import resolve_columns
+    from modules.pipeline import run_pipeline
+
+
+SOURCE_PROTOCOL_COL = "source_protocol"
+SOURCE_AA_COL = "source_aa"
+
+
+class MultiFileMerger:
+    """Φορτώνει παράλληλα πολλά αρχεία και τα ενώνει με συνεχή αρίθμηση a/a"""
+
+    def __init__(self, paths: List[str], aa_col: str = "a/a", max_workers: int = None):
+        """
+        Args:
+            paths: Διαδρομές αρχείων Excel ή CSV/TSV (NNNN-NN.xls/.xlsx/.csv/.tsv)
+            aa_col: Στήλη αύξοντα αριθμού
+            max_workers: Μέγιστος αριθμός παράλληλων φορτώσεων
+        """
+        if not paths:
+            raise ValueError("Δεν δόθηκαν αρχεία για συγχώνευση")
+
+        self.aa_col = aa_col
+        self.max_workers = max_workers or min(8, len(paths))
+        self.paths = sorted(paths, key=self._order_key)
+        self.protocols = [self._protocol_of(p) for p in self.paths]
+        self.frames: List[pd.DataFrame] = []
+
+    @staticmethod
+    def _protocol_of(path: str) -> str:
+        return os.path.splitext(os.path.basename(path))[0].strip()
+
+    @classmethod
+    def _order_key(cls, path: str):
+        """Σταθερή σειρά: αριθμητικά κατά NNNN και μετά κατά -NN, τέλος κατά όνομα"""
+        protocol = cls._protocol_of(path)
+        try:
+            first_4, dash_part = parse_protocol_number(protocol)
+            return 0, int(first_4), int(dash_part[1:]), protocol
+        except ValueError:
+            return 1, 0, 0, protocol
+
+    def load_all(self) -> List[pd.DataFrame]:
+        """
+        Φορτώνει όλα τα αρχεία παράλληλα (η σειρά αποτελεσμάτων μένει σταθερή)
+
+        Returns:
+            List[pd.DataFrame]: Ένα DataFrame ανά αρχείο, με τη σειρά του self.paths
+        """
+        # Threads: το διάβασμα από network share και το unzip των .xlsx επικαλύπτονται
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            self.frames = list(pool.map(read_input, self.paths))
+
+        for protocol, df in zip(self.protocols, self.frames):
+            print(f"✅ Φορτώθηκε {protocol}: {len(df)} γραμμές")
+        return self.frames
+
+    def merge(self) -> pd.DataFrame:
+        """
+        Ενώνει τα αρχεία σε ένα DataFrame.
+        Οι επικεφαλίδες κάθε αρχείου επιλύονται πρώτα σε κανονικά ονόματα, ώστε
+        αρχεία από διαφορετικά όργανα ("PH" / "pH ") να ενώνονται στις ίδιες στήλες.
+        Το a/a κάθε αρχείου μετατοπίζεται μετά το μέγιστο a/a του προηγούμενου,
+        ενώ το αρχικό a/a και το πρωτόκολλο κρατιούνται σε ξεχωριστές στήλες.
+
+        Returns:
+            pd.DataFrame: Συγχωνευμένο DataFrame έτοιμο για process_data
+        """
+        if not self.frames:
+            self.load_all()
+
+        parts = []
+        offset = 0
+        for protocol, df in zip(self.protocols, self.frames):
+            df = resolve_columns(df)
+            if self.aa_col not in df.columns:
+                raise KeyError(f"Λείπει στήλη '{self.aa_col}' στο αρχείο {protocol}")
+
+            aa = pd.to_numeric(df[self.aa_col], errors="coerce")
+            part = df
+            part[SOURCE_PROTOCOL_COL] = protocol
+            part[SOURCE_AA_COL] = aa
+            part[self.aa_col] = aa + offset
+
+            if aa.notna().any():
+                offset += int(aa.max())
+            parts.append(part)
+
+        merged = pd.concat(parts, ignore_index=True, sort=False)
+        print(f"✅ Συγχωνεύτηκαν {len(parts)} αρχεία: {len(merged)} γραμμές, "
+              f"a/a 1..{offset}")
+        return merged
+
+    def get_protocol_info(self) -> Tuple[str, str, str]:
+        """
+        Returns:
+            Tuple[str, str, str]: (protocol_number, csv_first_4, dash_part)
+            Τα Sample IDs ακολουθούν το πρώτο αρχείο, το όνομα εξόδου περιέχει όλα.
+        """
+        first_4, dash_part = parse_protocol_number(self.protocols[0])
+        return "+".join(self.protocols), first_4, dash_part
+
+
+def merge_files(paths: List[str]) -> Tuple[pd.DataFrame, str, str, str]:
+    """
+    Wrapper function: φόρτωση και συγχώνευση πολλών αρχείων
+
+    Returns:
+        Tuple[DataFrame, str, str, str]: (merged_df, protocol_number, csv_first_4, dash_part)
+    """
+    merger = MultiFileMerger(paths)
+    merged = merger.merge()
+    protocol_number, first_4, dash_part = merger.get_protocol_info()
+    return merged, protocol_number, first_4, dash_part
+
+
+def run_merged(paths: List[str], date: str, initial_time: str,
+               drop_zero_nutrients: bool = None, settings: AppSettings = None) -> dict:
+    """
+    Συγχώνευση και πλήρης επεξεργασία σε ένα πέρασμα
+
+    Args:
+        paths: Διαδρομές αρχείων
+        date: Ημερομηνία ανάλυσης (DD-MM)
+        initial_time: Αρχική ώρα HH:MM
+        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από τις ρυθμίσεις
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+
+    Returns:
+        dict: Αποτέλεσμα του run_pipeline
+    """
+    settings = settings or get_settings()
+    merged, protocol_number, first_4, dash_part = merge_files(paths)
+    return run_pipeline(
+        merged, protocol_number, first_4, dash_part, date, initial_time,
+        drop_zero_nutrients=drop_zero_nutrients, settings=settings
+    )
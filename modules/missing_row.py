@@ -1,6 +1,15 @@
 import pandas as pd
 import numpy as np
 
+try:
+    from .qc import QC_LIMITS
+    from .columns import get_header_resolver
+except ImportError:
+    from modules.qc import QC_LIMITS
+    from modules.columns import get_header_resolver
+
+MANUAL_FIELDS = ("pH", "Fat", "Protein", "Lactose", "FPD")
+
 
 class MissingRowHandler:
     """Συμπληρώνει τα κενά της αυξουσας σειράς 'a/a' με manual input από χρήστη."""
@@ -33,46 +42,41 @@ class MissingRowHandler:
     # ---------- CREATE ROW FROM USER INPUT ----------
 
     @staticmethod
-    def create_manual_row(user_input):
+    def create_manual_row(user_input, columns=None):
         """
         Δημιουργεί νέα γραμμή από user input.
-        user_input dict:
-            {"aa": int,+pH:float+, "Fat": float, "Protein": float, "Lactose": float, "FPD": float}
+        user_input dict (κλειδιά με οποιαδήποτε γνωστή ορθογραφία, π.χ. "PH", "lactose "):
+            {"aa": int, "pH": float, "Fat": float, "Protein": float, "Lactose": float, "FPD": float}
+        columns: Οι επικεφαλίδες του DataFrame-στόχου· η γραμμή χρησιμοποιεί τα ίδια
+            ονόματα (π.χ. "lactose " αν έτσι είναι στο Excel). Αν None, κανονικά ονόματα.
         """
-        new_row = {
-            "a/a": user_input.get("aa", ""),
-            "fat": float(user_input.get("fat", 0.0)),
-            "pH": float(user_input.get("pH", 0.0)),
-            "proteine": float(user_input.get("proteine", 0.0)),
-            "lactose ": float(user_input.get("lactose ", 0.0)),
-            "freeze point": float(user_input.get("freeze point", 0.0)),
-        }
-
-        new_row.update(MissingRowHandler._calculate_auto_fields(new_row))
+        resolver = get_header_resolver()
+        values = {}
+        for key, value in user_input.items():
+            canonical = resolver.canonical(key)
+            if canonical in MANUAL_FIELDS:
+                values[canonical] = value
+
+        resolution = resolver.resolve(columns) if columns is not None else None
+
+        def header(canonical):
+            source = resolution.source_for(canonical) if resolution else None
+            return source or canonical
+
+        new_row = {header("a/a"): user_input.get("aa", "")}
+        for field in MANUAL_FIELDS:
+            new_row[header(field)] = float(values.get(field, 0.0))
         return new_row
 
-    @staticmethod
-    def _calculate_auto_fields(row):
-        """
-        Υπολογίζει αυτόματα TS και SNF.
-        """
-        fat = float(row.get("fat", 0.0))
-        protein = float(row.get("proteine", 0.0))
-        lactose = float(row.get("lactose ", 0.0))
-        fpd = float(row.get("freeze point", 0.0))
-
-        return {
-            "freeze point": fpd,
-        }
-
     # ---------- VALIDATION ----------
     @staticmethod
     def validate_input(value, field_name):
+        field = get_header_resolver().canonical(field_name) or field_name
         try:
             parsed = float(str(value).strip().replace(",", "."))
 
             # 1) Ειδικός κανόνας για FPD
-            if field_name == "freeze point":
+            if field == "FPD":
                 if parsed > 0:
                     return False, None, "FPD πρέπει να είναι ≤ 0"
                 return True, parsed, ""
@@ -81,15 +85,20 @@ class MissingRowHandler:
             if parsed < 0:
                 return False, None, f"{field_name} δεν μπορεί να είναι αρνητικό"
 
-            if field_name == "fat" and parsed > 10:
-                return False, None, "Fat είναι πολύ υψηλό (>10%)"
-            if field_name == "proteine" and parsed > 6:
-                return False, None, "Protein είναι πολύ υψηλό (>6%)"
-            if field_name == "lactose " and parsed > 8:
-                return False, None, "Lactose είναι πολύ υψηλό (>8%)"
-            if field_name == "pH":
-                if parsed < 3 or parsed > 6:
-                    return False, None, "pH πρέπει να είναι μεταξύ 3 και 6"
+            fat_max = QC_LIMITS["Fat"][1]
+            protein_max = QC_LIMITS["Protein"][1]
+            lactose_max = QC_LIMITS["Lactose"][1]
+            ph_min, ph_max = QC_LIMITS["pH"]
+
+            if field == "Fat" and parsed > fat_max:
+                return False, None, f"Fat είναι πολύ υψηλό (>{fat_max}%)"
+            if field == "Protein" and parsed > protein_max:
+                return False, None, f"Protein είναι πολύ υψηλό (>{protein_max}%)"
+            if field == "Lactose" and parsed > lactose_max:
+                return False, None, f"Lactose είναι πολύ υψηλό (>{lactose_max}%)"
+            if field == "pH":
+                if parsed < ph_min or parsed > ph_max:
+                    return False, None, f"pH πρέπει να είναι μεταξύ {ph_min} και {ph_max}"
                 return True, parsed, ""
 
             return True, parsed, ""
@@ -126,7 +135,7 @@ class MissingRowHandler:
             user_vals = dict(user_vals)  # ασφάλεια
             user_vals["aa"] = aa
 
-            row = MissingRowHandler.create_manual_row(user_vals)
+            row = MissingRowHandler.create_manual_row(user_vals, df.columns)
 
             # φτιάχνουμε row με ΟΛΑ τα columns του df (ό,τι λείπει -> NaN)
             full = {c: np.nan for c in df.columns}
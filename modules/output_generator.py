@@ -1,51 +1,85 @@
 """
 Module για τη δημιουργία τελικού output και συγχώνευση δεδομένων
 """
+import multiprocessing as mp
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
-import numpy as np
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-# Import config με fallback
 try:
-    from . import config
+    from .settings import AppSettings, get_settings
+    from .formatting import FIXED_POINT_ATTR, PRECISION_ATTR, precision_spec, render_numeric_columns
+    from .layout import BatchLayout
+    from .workspace import atomic_output
+    from .dialect import ZERO_NUMERIC_COLUMNS, get_dialect, render_header, render_lines
 except ImportError:
-    import config
+    from modules.settings import AppSettings, get_settings
+    from modules.formatting import FIXED_POINT_ATTR, PRECISION_ATTR, precision_spec, render_numeric_columns
+    from modules.layout import BatchLayout
+    from modules.workspace import atomic_output
+    from modules.dialect import ZERO_NUMERIC_COLUMNS, get_dialect, render_header, render_lines
+
+
+NUTRIENT_COLUMNS = ("Fat", "Protein", "Lactose")
+
+# Παράλληλη απόδοση (RENDER_WORKERS > 1): κάτω από τόσες γραμμές η μεταφορά των
+# στηλών στα processes κοστίζει περισσότερο από όσο κερδίζεται
+PARALLEL_MIN_ROWS = 20_000
+# (πλήθος processes, pool): μόνιμο ανάμεσα στα jobs, ώστε τα imports να γίνονται μία φορά
+_render_pool: Optional[Tuple[int, ProcessPoolExecutor]] = None
+
+
+def zero_nutrient_mask(df: pd.DataFrame):
+    """
+    True για γραμμές με Fat = Protein = Lactose = 0 (τα κενά μετρούν ως 0).
+    None αν λείπει κάποια από τις στήλες.
+    """
+    if any(c not in df.columns for c in NUTRIENT_COLUMNS):
+        return None
+
+    def to_num(s):
+        if pd.api.types.is_numeric_dtype(s):
+            return s.fillna(0)
+        s = s.astype(str).str.strip().str.replace(",", ".", regex=False)
+        return pd.to_numeric(s, errors="coerce").fillna(0)
+
+    mask = None
+    for c in NUTRIENT_COLUMNS:
+        is_zero = (to_num(df[c]) == 0).to_numpy()
+        mask = is_zero if mask is None else (mask & is_zero)
+    return mask
 
 
 class OutputGenerator:
     """Κλάση για τη δημιουργία τελικού output"""
 
-    def __init__(self, df: pd.DataFrame, metadata: dict):
+    def __init__(self, df: pd.DataFrame, metadata: dict, settings: AppSettings = None):
         """
         Args:
             df: Επεξεργασμένο DataFrame με δεδομένα
             metadata: Dictionary με metadata (sample_ids, times, κλπ.)
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
         """
         self.df = df
         self.metadata = metadata
+        self.settings = settings or get_settings()
         self.filled_df = None
-        self.parts_path = config.PARTS_PATH
+        self.parts_path = self.settings.parts_path
+        self.precision = df.attrs.get(PRECISION_ATTR) or precision_spec(self.settings)
+        self.fixed_point = df.attrs.get(FIXED_POINT_ATTR) or {}
+        self.dialect = get_dialect(self.settings)
 
     def drop_zero_nutrient_rows_on_filled(self, reset_index=False, verbose=True):
         if self.filled_df is None:
             raise ValueError("Πρώτα φτιάξε filled_df")
 
-        for c in ("Fat", "Protein", "Lactose"):
-            if c not in self.filled_df.columns:
-                if verbose:
-                    print(f"⚠️ Λείπει η στήλη {c}. Skip.")
-                return self.filled_df
-
-        def to_num(s):
-            s = s.astype(str).str.strip().str.replace(",", ".", regex=False)
-            return pd.to_numeric(s, errors="coerce").fillna(0)
-
-        fat = to_num(self.filled_df["Fat"])
-        protein = to_num(self.filled_df["Protein"])
-        lactose = to_num(self.filled_df["Lactose"])
-
-        drop_mask = (fat == 0) & (protein == 0) & (lactose == 0)
+        drop_mask = zero_nutrient_mask(self.filled_df)
+        if drop_mask is None:
+            if verbose:
+                print("⚠️ Λείπει κάποια από τις στήλες Fat/Protein/Lactose. Skip.")
+            return self.filled_df
 
         if verbose:
             print(f"🔍 Zero rows to drop: {int(drop_mask.sum())}")
@@ -64,54 +98,84 @@ class OutputGenerator:
         Returns:
             pd.DataFrame: Πλήρως συμπληρωμένο DataFrame
         """
-        # Source - https://stackoverflow.com/a/30522778
-        # Posted by miriamsimone, modified by community
-        # Retrieved 2025-12-10, License - CC BY-SA 4.0
-
-        self.filled_df = pd.DataFrame(
-            np.column_stack([
-                self.metadata['sample_ids'],
-                self.metadata['rep'],
-                self.metadata['product'],
-                self.df['Fat'],
-                self.df['Protein'],
-                self.df['Lactose'],
-                self.df['FPD'],
-                self.df['TS'],
-                self.df['SNF'],
-                self.metadata['date'],
-                self.metadata['sample_times'],
-                self.metadata['remark']
-            ]),
-            columns=config.TARGET_COLUMN_ORDER
-        )
+        # Οι αριθμητικές στήλες μένουν αριθμητικές (float ή Int32 fixed-point)·
+        # μορφοποιούνται στο render
+        columns = list(self.settings.target_column_order)
+        values = [
+            self.metadata['sample_ids'],
+            self.metadata['rep'],
+            self.metadata['product'],
+            self.df['Fat'].array,
+            self.df['Protein'].array,
+            self.df['Lactose'].array,
+            self.df['FPD'].array,
+            self.df['TS'].array,
+            self.df['SNF'].array,
+            self.metadata['date'],
+            self.metadata['sample_times'],
+            self.metadata['remark'],
+        ]
+        self.filled_df = pd.DataFrame(dict(zip(columns, values)), columns=columns)
 
         print(f"✅ Δημιουργήθηκε filled DataFrame με {len(self.filled_df)} γραμμές")
         return self.filled_df
 
-    def break_into_parts(self) -> List[pd.DataFrame]:
+    def render_filled_dataframe(self) -> pd.DataFrame:
         """
-        Χωρίζει το DataFrame σε parts των 87 γραμμών
+        Μορφοποιεί (μία φορά, vectorized) τις αριθμητικές στήλες για εγγραφή
 
         Returns:
-            List[pd.DataFrame]: Λίστα με DataFrame parts
+            pd.DataFrame: Αντίγραφο του filled DataFrame με κείμενο στις στήλες του precision spec
         """
         if self.filled_df is None:
             raise ValueError("Πρέπει να καλέσετε πρώτα create_filled_dataframe()")
+        return render_numeric_columns(self.filled_df, self.precision, self.fixed_point)
+
+    def break_into_parts(self, rendered: pd.DataFrame = None) -> List[pd.DataFrame]:
+        """
+        Χωρίζει το (μορφοποιημένο) DataFrame σε parts, ένα ανά batch του BatchLayout
+        (BATCH_SIZE γραμμές μαζί με την επικεφαλίδα)
+
+        Args:
+            rendered: Έτοιμο αποτέλεσμα του render_filled_dataframe() (αλλιώς υπολογίζεται εδώ)
+
+        Returns:
+            List[pd.DataFrame]: Λίστα με DataFrame parts έτοιμα για εγγραφή
+        """
+        if rendered is None:
+            rendered = self.render_filled_dataframe()
 
+        layout = BatchLayout.from_settings(len(rendered), self.settings)
         chunks = [
-            self.filled_df.iloc[i:i + config.BATCH_SIZE - 1]
-            for i in range(0, len(self.filled_df), config.BATCH_SIZE - 1)
+            rendered.iloc[start:stop]
+            for _, start, stop, _ in layout.iter_segments()
         ]
+        self._report_parts([len(chunk) for chunk in chunks])
+        return chunks
 
-        print(f"✅ Διαχωρισμός σε {len(chunks)} parts:")
-        for idx, chunk in enumerate(chunks, 1):
-            print(f"   Part {idx}: {len(chunk)} γραμμές")
+    def report_parts(self) -> List[int]:
+        """
+        Τα μεγέθη των parts με το ίδιο μήνυμα με το break_into_parts, χωρίς διαχωρισμό
+        (η παράλληλη απόδοση χωρίζει μόνη της τις στήλες)
+        """
+        layout = BatchLayout.from_settings(len(self.filled_df), self.settings)
+        sizes = [stop - start for _, start, stop, _ in layout.iter_segments()]
+        self._report_parts(sizes)
+        return sizes
 
-        return chunks
+    @staticmethod
+    def _report_parts(sizes: List[int]):
+        print(f"✅ Διαχωρισμός σε {len(sizes)} parts:")
+        for idx, size in enumerate(sizes, 1):
+            print(f"   Part {idx}: {size} γραμμές")
+
+    def save_parts_to_csv(self, chunks: List[pd.DataFrame] = None):
+        """
+        Αποθηκεύει τα parts ως ξεχωριστά CSV αρχεία
 
-    def save_parts_to_csv(self):
-        """Αποθηκεύει τα parts ως ξεχωριστά CSV αρχεία"""
+        Args:
+            chunks: Έτοιμα parts από break_into_parts() (αλλιώς υπολογίζονται εδώ)
+        """
         if self.filled_df is None:
             raise ValueError("Πρέπει να καλέσετε πρώτα create_filled_dataframe()")
 
@@ -119,11 +183,13 @@ class OutputGenerator:
         os.makedirs(self.parts_path, exist_ok=True)
 
         # Διαχωρισμός και αποθήκευση
-        chunks = self.break_into_parts()
+        if chunks is None:
+            chunks = self.break_into_parts()
 
         for idx, chunk in enumerate(chunks, 1):
             part_file = os.path.join(self.parts_path, f"p{idx}.csv")
-            chunk.to_csv(part_file, index=False)
+            with open(part_file, "w", encoding="utf-8", newline="") as f:
+                f.write(self.dialect.render(chunk, numeric=self.precision))
 
         print(f"✅ Αποθηκεύτηκαν {len(chunks)} part files στο {self.parts_path}")
 
@@ -132,15 +198,122 @@ class OutputGenerator:
         return self.filled_df
 
 
+def _xlsx_rows(df: pd.DataFrame, numeric: Iterable[str]) -> List[list]:
+    """
+    Τιμές κελιών ανά γραμμή για το .xlsx: αριθμοί στις αριθμητικές στήλες (το κείμενο
+    του CSV, π.χ. "4.93" ή "-0,01", γίνεται float), κείμενο στις υπόλοιπες, None για τα κενά
+    """
+    numeric = set(numeric)
+    positions = [i for i, name in enumerate(df.columns) if name in numeric]
+    # Μία μετατροπή ανά DataFrame (τα zero blocks είναι πολλά και μικρά)
+    rows = df.to_numpy(dtype=object, na_value=None).tolist()
+    for row in rows:
+        for i in positions:
+            value = row[i]
+            if value.__class__ is str:
+                try:
+                    row[i] = float(value.strip().replace(",", "."))
+                except ValueError:
+                    pass
+        for i, value in enumerate(row):
+            if value == "" or value != value:
+                row[i] = None
+    return rows
+
+
+def iter_xlsx_rows(chunks: List[pd.DataFrame], zero_dfs: List[pd.DataFrame],
+                   numeric: Iterable[str] = ()) -> Iterator[list]:
+    """
+    Οι γραμμές του τελικού φύλλου με την ίδια σειρά με το CSV: επικεφαλίδα, δείγματα
+    και μετά από κάθε part (εκτός του τελευταίου) το zero block με την επικεφαλίδα του
+    """
+    numeric = tuple(numeric)
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            yield [str(c) for c in chunk.columns]
+        yield from _xlsx_rows(chunk, numeric)
+        if i < len(chunks) - 1 and i < len(zero_dfs):
+            zero_df = zero_dfs[i]
+            yield [str(c) for c in zero_df.columns]
+            yield from _xlsx_rows(zero_df, ZERO_NUMERIC_COLUMNS)
+
+
+def render_segment_texts(columns: Dict[str, object], spec: Dict[str, int], fixed: Dict[str, int],
+                         dialect, numeric: tuple, bounds: List[Tuple[int, int]]) -> List[str]:
+    """
+    Kernel της παράλληλης απόδοσης (τρέχει σε render process): μορφοποιεί ένα
+    συνεχές εύρος γραμμών και το αποδίδει με ένα πέρασμα ανά στήλη (render_lines)
+
+    Args:
+        columns: Τα arrays του filled DataFrame για το εύρος, ανά στήλη (με τη σειρά τους)
+        spec: Δεκαδικά ανά στήλη (precision spec)
+        fixed: Στήλες fixed-point {στήλη: δεκαδικά}
+        dialect: Η OutputDialect του αρχείου
+        numeric: Στήλες κειμένου με αριθμούς (υποδιαστολή της διαλέκτου)
+        bounds: (start, stop) κάθε segment, σχετικά με την αρχή του εύρους
+
+    Returns:
+        List[str]: Το κείμενο κάθε segment, με τις αλλαγές γραμμής
+    """
+    frame = pd.DataFrame(columns, columns=list(columns), copy=False)
+    lines = render_lines(render_numeric_columns(frame, spec, fixed), dialect, numeric)
+    term = dialect.lineterminator
+    return ["".join(line + term for line in lines[start:stop]) for start, stop in bounds]
+
+
+def split_segment_ranges(bounds: List[Tuple[int, int]], workers: int) -> List[List[Tuple[int, int]]]:
+    """Μοιράζει τα segments σε έως workers συνεχόμενες ομάδες με περίπου ίσες γραμμές"""
+    total = max(1, bounds[-1][1]) if bounds else 1
+    groups: List[List[Tuple[int, int]]] = [[] for _ in range(workers)]
+    for start, stop in bounds:
+        groups[min(workers - 1, start * workers // total)].append((start, stop))
+    return [group for group in groups if group]
+
+
+def can_render_in_parallel() -> bool:
+    """Τα daemon processes δεν επιτρέπεται να ανοίξουν δικά τους processes"""
+    return not mp.current_process().daemon
+
+
+def _watch_parent():
+    """Initializer των render processes: τερματίζονται μόλις τερματιστεί ο γονέας"""
+    parent = mp.parent_process()
+    if parent is None:
+        return
+
+    def watch():
+        parent.join()
+        os._exit(1)
+
+    threading.Thread(target=watch, name="render-parent-watch", daemon=True).start()
+
+
+def get_render_pool(workers: int) -> ProcessPoolExecutor:
+    """Το μόνιμο pool της παράλληλης απόδοσης (ξαναδημιουργείται αν αλλάξει το μέγεθος)"""
+    global _render_pool
+    if _render_pool is not None and _render_pool[0] != workers:
+        _render_pool[1].shutdown(wait=True)
+        _render_pool = None
+    if _render_pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                                   initializer=_watch_parent)
+        _render_pool = (workers, pool)
+    return _render_pool[1]
+
+
 class FinalOutputAssembler:
-    def __init__(self, parts_path: str = None, output_path: str = None, protocol_number: str = None):
-        self.parts_path = parts_path or config.PARTS_PATH
+    def __init__(self, parts_path: str = None, output_path: str = None, protocol_number: str = None,
+                 settings: AppSettings = None):
+        self.settings = settings or get_settings()
+        self.parts_path = parts_path or self.settings.parts_path
 
-        out_dir = os.path.dirname(output_path or config.FINAL_OUTPUT_PATH)
+        out_dir = os.path.dirname(output_path or self.settings.final_output_path)
         proto = (protocol_number or "final").strip()
         safe = proto.replace("/", "-").replace("\\", "-")
 
         self.output_path = os.path.join(out_dir, f"{safe}.csv")
+        self.xlsx_path = os.path.join(out_dir, f"{safe}.xlsx")
+        self.dialect = get_dialect(self.settings)
 
     def _cleanup_parts(self):
         for fname in os.listdir(self.parts_path):
@@ -152,7 +325,8 @@ class FinalOutputAssembler:
 
     def assemble_final_csv(self, zero_dfs: List[pd.DataFrame]):
         """
-        Συναρμολογεί το τελικό CSV με parts και zero blocks
+        Συναρμολογεί το τελικό CSV με parts και zero blocks.
+        Το αρχείο γράφεται σε προσωρινό αρχείο και μετονομάζεται ατομικά στο τέλος.
 
         Args:
             zero_dfs: Λίστα με zero DataFrames
@@ -174,12 +348,12 @@ class FinalOutputAssembler:
         first_file = True
         zero_block_index = 0
 
-        with open(self.output_path, "w", encoding="utf-8", newline='') as fout:
+        with atomic_output(self.output_path) as fout:
             for i, fname in enumerate(part_files):
                 part_path = os.path.join(self.parts_path, fname)
 
-                # Γράφουμε το part
-                with open(part_path, "r", encoding="utf-8") as fin:
+                # Γράφουμε το part (newline='': οι αλλαγές γραμμής της διαλέκτου μένουν ως έχουν)
+                with open(part_path, "r", encoding="utf-8", newline="") as fin:
                     lines = fin.readlines()
 
                 if first_file:
@@ -191,9 +365,7 @@ class FinalOutputAssembler:
                 # Προσθήκη zero block (αν δεν είναι το τελευταίο part)
                 if i < len(part_files) - 1:
                     if zero_block_index < len(zero_dfs):
-                        zero_df = zero_dfs[zero_block_index]
-                        zero_csv_string = zero_df.to_csv(header=True, index=False, lineterminator='')
-                        fout.write(zero_csv_string)
+                        fout.write(self.dialect.render_zero(zero_dfs[zero_block_index]))
                         zero_block_index += 1
                     else:
                         print(f"⚠️  Προειδοποίηση: Δεν υπάρχουν αρκετά zero blocks")
@@ -206,6 +378,111 @@ class FinalOutputAssembler:
             self._cleanup_parts()
         print("🧹 Τα προσωρινά part αρχεία διαγράφηκαν.")
 
+    def assemble_in_memory(self, rendered: pd.DataFrame, zero_dfs: List[pd.DataFrame],
+                           numeric: tuple = ()):
+        """
+        Συναρμολογεί το τελικό CSV στη μνήμη, χωρίς part files: οι γραμμές δειγμάτων
+        αποδίδονται μία φορά για όλο το DataFrame και τα zero blocks μαζί, και τα
+        κείμενα μοιράζονται στα segments του BatchLayout. Το αρχείο είναι
+        byte-identical με το assemble_final_csv.
+
+        Args:
+            rendered: Το μορφοποιημένο filled DataFrame (render_filled_dataframe())
+            zero_dfs: Λίστα με zero DataFrames
+            numeric: Στήλες κειμένου με αριθμούς (υποδιαστολή της διαλέκτου)
+        """
+        layout = BatchLayout.from_settings(len(rendered), self.settings)
+        segments = list(layout.iter_segments())
+        needed = max(0, len(segments) - 1)
+        if needed > len(zero_dfs):
+            print(f"⚠️  Προειδοποίηση: Δεν υπάρχουν αρκετά zero blocks")
+        zero_texts = self.dialect.render_zero_blocks(zero_dfs[:needed])
+
+        lines = render_lines(rendered, self.dialect, numeric)
+        term = self.dialect.lineterminator
+        texts = ("".join(line + term for line in lines[start:stop]) for _, start, stop, _ in segments)
+        self._write_segments(render_header(rendered, self.dialect), texts, zero_texts, len(lines))
+
+    def assemble_in_parallel(self, filled: pd.DataFrame, zero_dfs: List[pd.DataFrame],
+                             spec: Dict[str, int], fixed: Dict[str, int], numeric: tuple = (),
+                             workers: int = 2):
+        """
+        Όπως το assemble_in_memory, αλλά η μορφοποίηση και η απόδοση των γραμμών γίνονται
+        σε workers processes: κάθε process παίρνει ένα μεγάλο συνεχές εύρος segments του
+        BatchLayout ως arrays στηλών (όχι DataFrame) και επιστρέφει το κείμενο κάθε
+        segment· εδώ ενώνονται με τη σειρά, μαζί με τα zero blocks. Ίδια bytes με το
+        assemble_in_memory.
+
+        Args:
+            filled: Το filled DataFrame (create_filled_dataframe(), χωρίς render)
+            zero_dfs: Λίστα με zero DataFrames
+            spec: Δεκαδικά ανά στήλη (OutputGenerator.precision)
+            fixed: Στήλες fixed-point (OutputGenerator.fixed_point)
+            numeric: Στήλες κειμένου με αριθμούς (υποδιαστολή της διαλέκτου)
+            workers: Πλήθος render processes
+        """
+        layout = BatchLayout.from_settings(len(filled), self.settings)
+        segments = list(layout.iter_segments())
+        needed = max(0, len(segments) - 1)
+        if needed > len(zero_dfs):
+            print(f"⚠️  Προειδοποίηση: Δεν υπάρχουν αρκετά zero blocks")
+        zero_texts = self.dialect.render_zero_blocks(zero_dfs[:needed])
+
+        pool = get_render_pool(workers)
+        futures = []
+        for group in split_segment_ranges([(start, stop) for _, start, stop, _ in segments], workers):
+            low, high = group[0][0], group[-1][1]
+            columns = {name: filled[name].array[low:high] for name in filled.columns}
+            bounds = [(start - low, stop - low) for start, stop in group]
+            futures.append(pool.submit(render_segment_texts, columns, spec, fixed,
+                                       self.dialect, numeric, bounds))
+        print(f"⚡ Απόδοση {len(segments)} segments σε {len(futures)} processes")
+
+        texts = (text for future in futures for text in future.result())
+        self._write_segments(render_header(filled, self.dialect), texts, zero_texts, len(filled))
+
+    def _write_segments(self, header: str, texts: Iterable[str], zero_texts: List[str], rows: int):
+        """Γράφει επικεφαλίδα, segments και zero blocks (ένα μετά από κάθε segment εκτός του τελευταίου)"""
+        term = self.dialect.lineterminator
+        with atomic_output(self.output_path) as fout:
+            fout.write(header + term)
+            for i, text in enumerate(texts):
+                fout.write(text)
+                if i < len(zero_texts):
+                    fout.write(zero_texts[i])
+
+        print(f"✅ Τελικό αρχείο αποθηκεύτηκε: {self.output_path}")
+        print(f"📊 Συνολικές γραμμές: {rows + 1 + sum(t.count(term) for t in zero_texts)}")
+
+    def assemble_xlsx(self, chunks: List[pd.DataFrame], zero_dfs: List[pd.DataFrame],
+                      numeric: tuple = ()) -> str:
+        """
+        Γράφει τις ίδιες γραμμές με το τελικό CSV σε .xlsx (openpyxl write-only:
+        οι γραμμές γράφονται σε streaming, χωρίς να κρατιέται όλο το φύλλο στη μνήμη)
+
+        Args:
+            chunks: Τα parts από OutputGenerator.break_into_parts()
+            zero_dfs: Λίστα με zero DataFrames
+            numeric: Στήλες κειμένου με αριθμούς (γράφονται ως αριθμητικά κελιά)
+
+        Returns:
+            str: Διαδρομή του .xlsx
+        """
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Samples")
+        rows = 0
+        for row in iter_xlsx_rows(chunks, zero_dfs, numeric):
+            ws.append(row)
+            rows += 1
+
+        with atomic_output(self.xlsx_path, binary=True) as fout:
+            wb.save(fout)
+
+        print(f"✅ Τελικό .xlsx αποθηκεύτηκε: {self.xlsx_path} ({rows} γραμμές)")
+        return self.xlsx_path
+
     @staticmethod
     def _part_key(name: str):
         """Helper για σωστή ταξινόμηση part files"""
@@ -222,7 +499,9 @@ class FinalOutputAssembler:
             return sum(1 for _ in f)
 
 
-def generate_output(df, metadata, zero_dfs, drop_zero_nutrients: bool = True) -> str:
+def generate_output(df, metadata, zero_dfs, drop_zero_nutrients: bool = True,
+                    settings: AppSettings = None, in_memory: bool = None,
+                    xlsx: bool = None, render_workers: int = None) -> str:
     """
     Wrapper function για πλήρη δημιουργία output
 
@@ -230,20 +509,68 @@ def generate_output(df, metadata, zero_dfs, drop_zero_nutrients: bool = True) ->
         df: Επεξεργασμένο DataFrame
         metadata: Dictionary με metadata
         zero_dfs: Λίστα με zero DataFrames
+        drop_zero_nutrients: Αφαίρεση γραμμών με Fat=Protein=Lactose=0
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        in_memory: Απόδοση του CSV στη μνήμη με ένα πέρασμα, χωρίς part files
+            (None -> OUTPUT_IN_MEMORY από τις ρυθμίσεις)
+        xlsx: Εγγραφή και .xlsx δίπλα στο CSV, παράλληλα με το CSV
+            (None -> OUTPUT_XLSX από τις ρυθμίσεις)
+        render_workers: Processes για την απόδοση του CSV στη μνήμη (None -> RENDER_WORKERS,
+            μόνο για τουλάχιστον PARALLEL_MIN_ROWS γραμμές· 1: σειριακά)
 
     Returns:
         str: Διαδρομή τελικού αρχείου
     """
+    settings = settings or get_settings()
+    if xlsx is None:
+        xlsx = settings.output_xlsx
+    if in_memory is None:
+        in_memory = settings.output_in_memory
 
-    generator = OutputGenerator(df, metadata)
+    generator = OutputGenerator(df, metadata, settings)
     generator.create_filled_dataframe()
     if drop_zero_nutrients:
         generator.drop_zero_nutrient_rows_on_filled(reset_index=False, verbose=False)
-    generator.save_parts_to_csv()
 
     protocol_number = metadata.get("protocol_number")
-    assembler = FinalOutputAssembler(protocol_number=protocol_number)
-    assembler.assemble_final_csv(zero_dfs)
+    assembler = FinalOutputAssembler(protocol_number=protocol_number, settings=settings)
+
+    numeric = tuple(generator.precision)
+    if render_workers is None:
+        rows = len(generator.filled_df)
+        render_workers = settings.render_workers if rows >= PARALLEL_MIN_ROWS else 1
+    parallel = in_memory and render_workers > 1
+    if parallel and not can_render_in_parallel():
+        print("⚠️  RENDER_WORKERS: daemon process χωρίς δικά του processes· σειριακή απόδοση")
+        parallel = False
+
+    if parallel and not xlsx:
+        # Τη μορφοποίηση την κάνουν τα render processes
+        rendered = chunks = None
+        generator.report_parts()
+    else:
+        rendered = generator.render_filled_dataframe()
+        chunks = generator.break_into_parts(rendered)
+
+    # Το .xlsx γράφεται σε δικό του thread όσο γράφεται το CSV (τα chunks μόνο διαβάζονται)
+    xlsx_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xlsx-output") if xlsx else None
+    try:
+        xlsx_future = xlsx_pool.submit(assembler.assemble_xlsx, chunks, zero_dfs, numeric) if xlsx else None
+
+        if parallel:
+            assembler.assemble_in_parallel(generator.filled_df, zero_dfs, generator.precision,
+                                           generator.fixed_point, numeric, render_workers)
+        elif in_memory:
+            assembler.assemble_in_memory(rendered, zero_dfs, numeric)
+        else:
+            generator.save_parts_to_csv(chunks)
+            assembler.assemble_final_csv(zero_dfs)
+
+        if xlsx_future is not None:
+            xlsx_future.result()
+    finally:
+        if xlsx_pool is not None:
+            xlsx_pool.shutdown(wait=True)
 
     return assembler.output_path
 
@@ -8,36 +8,23 @@ from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.cell import column_index_from_string
 
-import config
+try:
+    from .columns import get_header_resolver
+    from .ph_form import FormTemplateError, load_form_template
+except ImportError:
+    from modules.columns import get_header_resolver
+    from modules.ph_form import FormTemplateError, load_form_template
 
 
 class PHHandler:
     def __init__(self, df: pd.DataFrame, aa_col: str = "a/a", ph_col: str = "pH"):
-        self.df = df.copy()
         self.aa_col = aa_col
         self.ph_col = ph_col
-        self.df.columns = self.df.columns.astype(str).str.strip()
-        self.df = self.df.loc[:, ~self.df.columns.duplicated(keep="first")]
-
-        # normalize column names for pH (PH/ph/pH -> pH)
-        self._normalize_columns()
+        # Κανονικά ονόματα στηλών (PH/ph/"pH " -> pH, διπλές στήλες -> η πρώτη)
+        self.df = get_header_resolver().resolve(df.columns).apply(df)
 
         self.pairs_df = self._extract_pairs()
 
-
-    def _normalize_columns(self):
-        cols = {c.strip(): c for c in self.df.columns}  # map stripped -> original
-
-        # normalize a/a if needed (optional: keep yours simple)
-        # if self.aa_col not in self.df.columns and "a/a" in cols:
-        #     self.df = self.df.rename(columns={cols["a/a"]: self.aa_col})
-
-        # normalize pH variants to self.ph_col
-        for candidate in ["pH", "PH", "ph", "Ph", "pH "]:
-            if candidate in cols and self.ph_col not in self.df.columns:
-                self.df = self.df.rename(columns={cols[candidate]: self.ph_col})
-                break
-
     def _extract_pairs(self) -> pd.DataFrame:
         if self.aa_col not in self.df.columns or self.ph_col not in self.df.columns:
             raise KeyError(f"Λείπει στήλη: '{self.aa_col}' ή '{self.ph_col}'")
@@ -82,6 +69,14 @@ class PHHandler:
         col_idx = start_col_idx + block * col_step
         return f"{get_column_letter(col_idx)}{row}"
 
+    @staticmethod
+    def _aa_cell(ph_cell: str, aa_col_offset: int) -> str:
+        """Το κελί του a/a δίπλα στο κελί του pH (A3 -> B3 για offset 1)"""
+        col_letters = "".join(ch for ch in ph_cell if ch.isalpha())
+        row_numbers = int("".join(ch for ch in ph_cell if ch.isdigit()))
+        ph_col_idx = column_index_from_string(col_letters)
+        return f"{get_column_letter(ph_col_idx + aa_col_offset)}{row_numbers}"
+
     def fill_form(
         self,
         template_path: str,
@@ -94,12 +89,16 @@ class PHHandler:
         col_step: int = 3,           # A, D, G
         write_aa: bool = True,
         aa_col_offset: int = 1,      # δίπλα δεξιά: A->B, D->E, G->H
-        strict_missing_ph: bool = True
+        strict_missing_ph: bool = True,
+        fast: bool = True            # sheet XML από μεταγλωττισμένο template (modules/ph_form.py)
     ) -> list[str]:
         """
         Αν τα δείγματα > max_per_form, δημιουργεί πολλαπλά αρχεία φόρμας
         και κάθε νέα φόρμα ξεκινά πάλι από A3.
 
+        Με fast=True το template μεταγλωττίζεται μία φορά και κάθε φόρμα γράφεται
+        απευθείας ως zip· αν το template δεν υποστηρίζεται, η εγγραφή γίνεται με openpyxl.
+
         Επιστρέφει λίστα με paths των αρχείων που δημιουργήθηκαν.
         """
         missing = self.missing_ph_aas()
@@ -125,32 +124,45 @@ class PHHandler:
         base, ext = os.path.splitext(out_path)
         out_paths: list[str] = []
 
+        # κελιά pH (και a/a) για κάθε slot μιας φόρμας
+        slot_cells = []
+        for slot in range(1, max_per_form + 1):
+            ph_cell = self._slot_to_form_cell(
+                slot=slot,
+                start_row=start_row,
+                block_size=block_size,
+                start_col_idx=ph_start_col,
+                col_step=col_step
+            )
+            slot_cells.append((ph_cell, self._aa_cell(ph_cell, aa_col_offset) if write_aa else None))
+
+        template = None
+        if fast:
+            try:
+                cells = [c for pair in slot_cells for c in pair if c is not None]
+                template = load_form_template(template_path, sheet_name, cells)
+            except FormTemplateError as e:
+                print(f"⚠️ Φόρμα pH με openpyxl ({e})")
+
         for part_idx, chunk in enumerate(chunks, start=1):
             # φτιάχνουμε νέο output path για κάθε φόρμα
             part_path = out_path if len(chunks) == 1 else f"{base}_part{part_idx}{ext}"
 
-            wb = load_workbook(template_path)
-            ws = wb[sheet_name] if sheet_name else wb.active
-
             # γράφουμε chunk με slot index που ξεκινά από 1
-            for slot, (aa, ph) in enumerate(chunk, start=1):
-                ph_cell = self._slot_to_form_cell(
-                    slot=slot,
-                    start_row=start_row,
-                    block_size=block_size,
-                    start_col_idx=ph_start_col,
-                    col_step=col_step
-                )
-                ws[ph_cell].value = round(ph, 2)
-
-                if write_aa:
-                    col_letters = "".join(ch for ch in ph_cell if ch.isalpha())
-                    row_numbers = int("".join(ch for ch in ph_cell if ch.isdigit()))
-                    ph_col_idx = column_index_from_string(col_letters)
-                    aa_cell = f"{get_column_letter(ph_col_idx + aa_col_offset)}{row_numbers}"
-                    ws[aa_cell].value = aa
-
-            wb.save(part_path)
+            values = {}
+            for (ph_cell, aa_cell), (aa, ph) in zip(slot_cells, chunk):
+                values[ph_cell] = round(ph, 2)
+                if aa_cell is not None:
+                    values[aa_cell] = aa
+
+            if template is not None:
+                template.write(part_path, values)
+            else:
+                wb = load_workbook(template_path)
+                ws = wb[sheet_name] if sheet_name else wb.active
+                for cell, value in values.items():
+                    ws[cell].value = value
+                wb.save(part_path)
             out_paths.append(part_path)
 
         return out_paths
@@ -0,0 +1,294 @@
+"""
+Module για γρήγορη εγγραφή των φορμών pH χωρίς το object model του openpyxl
+
+Το ph_template.xlsx ανοίγεται μία φορά: το sheet.xml του φύλλου της φόρμας
+μεταγλωττίζεται σε template με θέσεις (slots) για τα κελιά pH (A/D/G) και a/a (B/E/H).
+Κάθε φόρμα γράφεται ως νέο zip: τα υπόλοιπα μέλη του workbook αντιγράφονται αυτούσια
+(ίδια bytes) και μόνο το sheet.xml αποδίδεται από το template.
+
+Όπως και με το openpyxl, τα slots χωρίς τιμή κρατούν το περιεχόμενο του template.
+Templates που δεν μπορούν να μεταγλωττιστούν με ασφάλεια (τύποι στα κελιά της φόρμας,
+κελιά χωρίς r="...", φύλλο με namespace prefix) δίνουν FormTemplateError· ο PHHandler
+τότε γράφει τη φόρμα με openpyxl.
+"""
+import os
+import posixpath
+import re
+import threading
+import zipfile
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+
+try:
+    from .workspace import atomic_output
+except ImportError:
+    from modules.workspace import atomic_output
+
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_SHEET_DATA_RE = re.compile(r"<sheetData(\s[^>]*)?(?:/>|>(.*?)</sheetData>)", re.S)
+_ROW_RE = re.compile(r"<row\b([^>]*?)(?:/>|>(.*?)</row>)", re.S)
+_CELL_RE = re.compile(r"<c\b([^>]*?)(?:/>|>(.*?)</c>)", re.S)
+_ROW_NUMBER_RE = re.compile(r'\sr="(\d+)"')
+_CELL_REF_RE = re.compile(r'\sr="([A-Z]+)(\d+)"')
+_STYLE_RE = re.compile(r'\ss="(\d+)"')
+_SPANS_RE = re.compile(r'\sspans="[^"]*"')
+_DIMENSION_RE = re.compile(r'(<dimension\s+ref=")([^"]*)(")')
+_CALC_PR_RE = re.compile(r"<calcPr\b([^>]*?)(/?>)")
+# Στοιχεία του workbook.xml που ακολουθούν το <calcPr> (σειρά του CT_Workbook)
+_AFTER_CALC_PR_RE = re.compile(
+    r"<(?:oleSize|customWorkbookViews|pivotCaches|smartTagPr|smartTagTypes|webPublishing|"
+    r"fileRecoveryPr|webPublishObjects|extLst)\b|</workbook>"
+)
+
+Value = Union[int, float]
+
+
+class FormTemplateError(ValueError):
+    """Το template δεν μπορεί να αποδοθεί χωρίς openpyxl"""
+
+
+class _Slot(NamedTuple):
+    """Κελί της φόρμας: διεύθυνση, style attribute και το αρχικό XML του template (αν υπάρχει)"""
+    ref: str
+    style: str
+    original: str
+
+
+def _sheet_member(zf: zipfile.ZipFile, sheet_name: Optional[str]) -> Tuple[str, str]:
+    """
+    Το μέλος του zip για το φύλλο της φόρμας (όνομα ή, όπως το wb.active, το ενεργό φύλλο)
+
+    Returns:
+        (μέλος zip, όνομα φύλλου)
+    """
+    try:
+        workbook = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    except (KeyError, ElementTree.ParseError) as e:
+        raise FormTemplateError(f"Μη αναγνώσιμο workbook: {e}") from e
+
+    sheets = workbook.findall(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet")
+    if not sheets:
+        raise FormTemplateError("Το workbook δεν έχει φύλλα")
+    if sheet_name is None:
+        view = workbook.find(f"{_MAIN_NS}bookViews/{_MAIN_NS}workbookView")
+        active = int(view.get("activeTab", 0)) if view is not None else 0
+        sheet = sheets[active] if active < len(sheets) else sheets[0]
+    else:
+        sheet = next((s for s in sheets if s.get("name") == sheet_name), None)
+        if sheet is None:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+    targets = {r.get("Id"): r.get("Target") for r in rels.iter(f"{_PKG_REL_NS}Relationship")}
+    target = targets.get(sheet.get(f"{_REL_NS}id"))
+    if target is None:
+        raise FormTemplateError(f"Δεν βρέθηκε το αρχείο του φύλλου {sheet.get('name')}")
+    member = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+    return member, sheet.get("name")
+
+
+def _cell_xml(slot: _Slot, value: Value) -> str:
+    """Αριθμητικό κελί με το style του template (όπως το γράφει το openpyxl)"""
+    # Ίδια μορφή με το safe_string του openpyxl (5.0 -> "5", 6.61 -> "6.61")
+    return f'<c r="{slot.ref}"{slot.style}><v>{"%.16g" % value}</v></c>'
+
+
+def _expand_dimension(ref: str, rows: Iterable[int], cols: Iterable[int]) -> str:
+    """Το <dimension> του φύλλου ώστε να καλύπτει και τα slots"""
+    bounds = [coordinate_from_string(part) for part in ref.split(":")]
+    col_idx = [column_index_from_string(c) for c, _ in bounds] + list(cols)
+    row_idx = [r for _, r in bounds] + list(rows)
+    return (f"{get_column_letter(min(col_idx))}{min(row_idx)}:"
+            f"{get_column_letter(max(col_idx))}{max(row_idx)}")
+
+
+def _compile_sheet(xml: str, cells: Iterable[str]) -> List[Union[str, _Slot]]:
+    """
+    Μεταγλωττίζει το sheet.xml σε κομμάτια κειμένου και slots (με τη σειρά του εγγράφου)
+
+    Args:
+        xml: Το sheet.xml του template
+        cells: Οι διευθύνσεις των κελιών της φόρμας (π.χ. "A3", "B3", ...)
+    """
+    wanted: Dict[int, Dict[int, str]] = {}
+    for ref in cells:
+        col, row = coordinate_from_string(ref)
+        wanted.setdefault(row, {})[column_index_from_string(col)] = f"{col}{row}"
+    if not wanted:
+        raise FormTemplateError("Δεν δόθηκαν κελιά φόρμας")
+
+    data = _SHEET_DATA_RE.search(xml)
+    if data is None:
+        raise FormTemplateError("Δεν βρέθηκε <sheetData> (φύλλο με namespace prefix;)")
+
+    prefix, suffix = xml[:data.start()], xml[data.end():]
+    dimension = _DIMENSION_RE.search(prefix)
+    if dimension:
+        new_ref = _expand_dimension(
+            dimension.group(2), wanted, (c for cols in wanted.values() for c in cols)
+        )
+        prefix = prefix[:dimension.start(2)] + new_ref + prefix[dimension.end(2):]
+
+    pieces: List[Union[str, _Slot]] = [prefix, f"<sheetData{data.group(1) or ''}>"]
+
+    def add_row(number: int, attrs: str, body: str):
+        # Οι slots της γραμμής μπαίνουν στη θέση του υπάρχοντος κελιού ή με σειρά στήλης
+        slots = dict(wanted.get(number, {}))
+        pieces.append(f"<row{_SPANS_RE.sub('', attrs)}>")
+        for cell in _CELL_RE.finditer(body):
+            ref = _CELL_REF_RE.search(cell.group(1))
+            if ref is None:
+                raise FormTemplateError(f"Κελί χωρίς διεύθυνση στη γραμμή {number}")
+            col = column_index_from_string(ref.group(1))
+            for pending in sorted(c for c in slots if c < col):
+                pieces.append(_Slot(slots.pop(pending), "", ""))
+            if col in slots:
+                if cell.group(2) and "<f" in cell.group(2):
+                    raise FormTemplateError(f"Τύπος στο κελί φόρμας {ref.group(1)}{number}")
+                style = _STYLE_RE.search(cell.group(1))
+                pieces.append(_Slot(slots.pop(col), style.group(0) if style else "", cell.group(0)))
+            else:
+                pieces.append(cell.group(0))
+        for pending in sorted(slots):
+            pieces.append(_Slot(slots[pending], "", ""))
+        pieces.append("</row>")
+
+    remaining = sorted(wanted)
+    for row in _ROW_RE.finditer(data.group(2) or ""):
+        number = _ROW_NUMBER_RE.search(row.group(1))
+        if number is None:
+            raise FormTemplateError("Γραμμή χωρίς αριθμό (r) στο φύλλο της φόρμας")
+        number = int(number.group(1))
+        while remaining and remaining[0] < number:
+            missing = remaining.pop(0)
+            add_row(missing, f' r="{missing}"', "")
+        if remaining and remaining[0] == number:
+            remaining.pop(0)
+            add_row(number, row.group(1), row.group(2) or "")
+        else:
+            pieces.append(row.group(0))
+    for number in remaining:
+        add_row(number, f' r="{number}"', "")
+    pieces.extend(["</sheetData>", suffix])
+
+    # Συγχώνευση διαδοχικών κομματιών κειμένου (λιγότερα joins στην απόδοση)
+    merged: List[Union[str, _Slot]] = []
+    for piece in pieces:
+        if isinstance(piece, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += piece
+        else:
+            merged.append(piece)
+    return merged
+
+
+def _full_calc_on_load(workbook_xml: str) -> str:
+    """workbook.xml με <calcPr fullCalcOnLoad="1"> (όπως το γράφει το openpyxl)"""
+    calc = _CALC_PR_RE.search(workbook_xml)
+    if calc is not None:
+        if "fullCalcOnLoad=" in calc.group(1):
+            attrs = re.sub(r'fullCalcOnLoad="[^"]*"', 'fullCalcOnLoad="1"', calc.group(1))
+        else:
+            attrs = calc.group(1) + ' fullCalcOnLoad="1"'
+        return workbook_xml[:calc.start()] + f"<calcPr{attrs}{calc.group(2)}" + workbook_xml[calc.end():]
+    anchor = _AFTER_CALC_PR_RE.search(workbook_xml)
+    return workbook_xml[:anchor.start()] + '<calcPr fullCalcOnLoad="1"/>' + workbook_xml[anchor.start():]
+
+
+class FormTemplate:
+    """Μεταγλωττισμένο template φόρμας pH (ένα ανά αρχείο / φύλλο / σύνολο κελιών)"""
+
+    def __init__(self, template_path: str, sheet_name: str = None, cells: Iterable[str] = ()):
+        """
+        Args:
+            template_path: Το ph_template.xlsx
+            sheet_name: Φύλλο της φόρμας (default: το ενεργό, όπως το wb.active)
+            cells: Διευθύνσεις όλων των κελιών που μπορεί να γραφτούν
+        """
+        self.template_path = str(template_path)
+        try:
+            zf = zipfile.ZipFile(self.template_path)
+        except zipfile.BadZipFile as e:
+            raise FormTemplateError(f"Μη αναγνώσιμο template: {e}") from e
+        with zf:
+            self.sheet_member, self.sheet_name = _sheet_member(zf, sheet_name)
+            # Όλα τα μέλη στη μνήμη, με τη σειρά του αρχικού zip
+            self.members: List[Tuple[zipfile.ZipInfo, bytes]] = [
+                (info, zf.read(info)) for info in zf.infolist()
+            ]
+
+        contents = {info.filename: data for info, data in self.members}
+        if self.sheet_member not in contents:
+            raise FormTemplateError(f"Λείπει το {self.sheet_member} από το template")
+        sheet_xml = contents[self.sheet_member].decode("utf-8")
+        self.pieces = _compile_sheet(sheet_xml, cells)
+
+        # Οι τύποι του workbook υπολογίζονται ξανά στο άνοιγμα (οι αποθηκευμένες
+        # τιμές τους αφορούν το κενό template)
+        if any(b"<f" in data for name, data in contents.items()
+               if name.startswith("xl/worksheets/") and name.endswith(".xml")):
+            patched = _full_calc_on_load(contents["xl/workbook.xml"].decode("utf-8")).encode("utf-8")
+            self.members = [
+                (info, patched if info.filename == "xl/workbook.xml" else data)
+                for info, data in self.members
+            ]
+
+    def render_sheet(self, values: Dict[str, Value]) -> bytes:
+        """Το sheet.xml με τις τιμές στα slots (τα υπόλοιπα slots όπως στο template)"""
+        out = []
+        for piece in self.pieces:
+            if piece.__class__ is str:
+                out.append(piece)
+            else:
+                value = values.get(piece.ref)
+                out.append(piece.original if value is None else _cell_xml(piece, value))
+        return "".join(out).encode("utf-8")
+
+    def write(self, out_path: str, values: Dict[str, Value]):
+        """
+        Γράφει μία φόρμα
+
+        Args:
+            out_path: Αρχείο εξόδου (.xlsx)
+            values: Διεύθυνση κελιού -> τιμή (μόνο αριθμοί: pH / a/a)
+        """
+        unknown = set(values) - {p.ref for p in self.pieces if not isinstance(p, str)}
+        if unknown:
+            raise KeyError(f"Κελιά εκτός template: {', '.join(sorted(unknown)[:10])}")
+
+        sheet = self.render_sheet(values)
+        with atomic_output(out_path, binary=True) as fout, zipfile.ZipFile(fout, "w") as zf:
+            for info, data in self.members:
+                # Νέο ZipInfo ανά εγγραφή (το writestr συμπληρώνει offsets / CRC)
+                clone = zipfile.ZipInfo(info.filename, info.date_time)
+                clone.compress_type = info.compress_type
+                clone.external_attr = info.external_attr
+                clone.create_system = info.create_system
+                zf.writestr(clone, sheet if info.filename == self.sheet_member else data)
+
+
+# Cache ανά (διαδρομή, φύλλο, κελιά) με έλεγχο mtime: το template μεταγλωττίζεται
+# μία φορά ανά εκτέλεση / worker και όχι ανά φόρμα
+_TEMPLATE_CACHE: Dict[Tuple[str, Optional[str], Tuple[str, ...]], Tuple[int, FormTemplate]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_form_template(template_path: str, sheet_name: str = None,
+                       cells: Iterable[str] = ()) -> FormTemplate:
+    """Επιστρέφει (από cache αν δεν άλλαξε το αρχείο) το μεταγλωττισμένο template"""
+    template_path = str(template_path)
+    key = (os.path.abspath(template_path), sheet_name, tuple(cells))
+    mtime = os.stat(template_path).st_mtime_ns
+    with _CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    template = FormTemplate(template_path, sheet_name, key[2])
+    with _CACHE_LOCK:
+        _TEMPLATE_CACHE[key] = (mtime, template)
+    return template
@@ -0,0 +1,194 @@
+"""
+Module για headless εκτέλεση όλου του pipeline (χωρίς input() / GUI)
+Χρησιμοποιείται από το GUI, το merge mode και τα batch εργαλεία.
+"""
+from datetime import datetime
+from typing import Callable
+
+import pandas as pd
+
+try:
+    from .settings import DATE_FROM_PROTOCOL, DATE_TODAY, AppSettings, get_settings
+    from .data_processor import process_data
+    from .time_handler import TimeHandler, MetadataGenerator
+    from .zero_manager import prepare_zero_data
+    from .output_generator import generate_output, zero_nutrient_mask
+    from .qc import evaluate_qc, format_qc_report, qc_remarks, qc_summary
+    from .workspace import JobWorkspace
+    from .archive import archive_run
+    from .memprofile import MemoryProfiler
+except ImportError:
+    from modules.settings import DATE_FROM_PROTOCOL, DATE_TODAY, AppSettings, get_settings
+    from modules.data_processor import process_data
+    from modules.time_handler import TimeHandler, MetadataGenerator
+    from modules.zero_manager import prepare_zero_data
+    from modules.output_generator import generate_output, zero_nutrient_mask
+    from modules.qc import evaluate_qc, format_qc_report, qc_remarks, qc_summary
+    from modules.workspace import JobWorkspace
+    from modules.archive import archive_run
+    from modules.memprofile import MemoryProfiler
+
+
+def format_analysis_date(date: str) -> str:
+    """
+    Μετατρέπει ημερομηνία DD-MM σε DD/MM/YYYY (τρέχον έτος)
+
+    Args:
+        date: Ημερομηνία σε μορφή DD-MM (ή ήδη DD/MM/YYYY)
+    """
+    date = date.strip()
+    try:
+        return datetime.strptime(date, "%d/%m/%Y").strftime("%d/%m/%Y")
+    except ValueError:
+        pass
+    parsed = datetime.strptime(date, "%d-%m")
+    return parsed.replace(year=datetime.now().year).strftime("%d/%m/%Y")
+
+
+def analysis_date_for(csv_first_4: str, date: str = None, settings: AppSettings = None,
+                      log: Callable[[str], None] = print) -> str:
+    """
+    Ημερομηνία ανάλυσης DD-MM για εκτελέσεις χωρίς χρήστη (watcher, batch, υπηρεσία)
+
+    Η ρητή ημερομηνία (--date / αίτημα) έχει προτεραιότητα· αλλιώς ισχύει το
+    DEFAULT_DATE: σταθερή DD-MM, "today" ή "protocol" (τα ψηφία DDMM του πρωτοκόλλου).
+    Η πηγή γράφεται πάντα στο log.
+
+    Raises:
+        ValueError: Χωρίς ημερομηνία και χωρίς DEFAULT_DATE, ή μη έγκυρη ημερομηνία
+            (π.χ. πρωτόκολλο που τα ψηφία του δεν είναι ημερομηνία)
+    """
+    settings = settings or get_settings()
+    default = settings.default_date.strip()
+    if date and date.strip():
+        date, source = date.strip(), "ρητή"
+    elif not default:
+        raise ValueError("Δεν ορίστηκε ημερομηνία ανάλυσης: δώστε --date ή ορίστε "
+                         "DEFAULT_DATE (DD-MM, today ή protocol)")
+    elif default.lower() == DATE_TODAY:
+        date, source = datetime.now().strftime("%d-%m"), "DEFAULT_DATE=today"
+    elif default.lower() == DATE_FROM_PROTOCOL:
+        date, source = f"{csv_first_4[:2]}-{csv_first_4[2:4]}", f"DEFAULT_DATE=protocol ({csv_first_4})"
+    else:
+        date, source = default, "DEFAULT_DATE"
+
+    try:
+        format_analysis_date(date)
+    except ValueError:
+        raise ValueError(f"Μη έγκυρη ημερομηνία ανάλυσης '{date}' ({source}): αναμένεται DD-MM")
+    log(f"📅 Ημερομηνία ανάλυσης {date} ({source})")
+    return date
+
+
+def run_pipeline(excel_df: pd.DataFrame, protocol_number: str, csv_first_4: str,
+                 dash_part: str, date: str, initial_time: str,
+                 drop_zero_nutrients: bool = None, settings: AppSettings = None,
+                 log: Callable[[str], None] = print) -> dict:
+    """
+    Τρέχει επεξεργασία, timestamps, zero blocks και τελικό output σε ένα πέρασμα
+
+    Args:
+        excel_df: Το αρχικό DataFrame (ένα αρχείο ή συγχωνευμένα)
+        protocol_number: Όνομα τελικού αρχείου (π.χ. "1605-6")
+        csv_first_4: Πρώτα 4 ψηφία για τα Sample IDs
+        dash_part: Dash part για τα Sample IDs
+        date: Ημερομηνία ανάλυσης (DD-MM ή DD/MM/YYYY)
+        initial_time: Αρχική ώρα HH:MM
+        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από τις ρυθμίσεις
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        log: Συνάρτηση για μηνύματα προόδου
+
+    Returns:
+        dict: {'final_path', 'processed_df', 'samples', 'qc_flags', 'qc_summary', 'memory'}
+        ('memory': σύνοψη του προφίλ μνήμης με MEMORY_PROFILE, αλλιώς None)
+    """
+    settings = settings or get_settings()
+    if drop_zero_nutrients is None:
+        drop_zero_nutrients = settings.drop_zero_nutrients
+    profiler = MemoryProfiler(enabled=settings.memory_profile, label=protocol_number)
+    try:
+        result = _run_stages(excel_df, protocol_number, csv_first_4, dash_part, date,
+                             initial_time, drop_zero_nutrients, settings, log, profiler)
+    finally:
+        profiler.stop()
+
+    report = profiler.finish(settings, samples=result['samples'])
+    result['memory'] = None
+    if report is not None:
+        log(report.format())
+        result['memory'] = report.summary()
+    return result
+
+
+def _run_stages(excel_df, protocol_number, csv_first_4, dash_part, date, initial_time,
+                drop_zero_nutrients, settings, log, profiler) -> dict:
+    log("⚙️ Επεξεργασία δεδομένων...")
+    with profiler.stage("process_data"):
+        processed_df = process_data(excel_df, settings)
+    num_samples = len(processed_df)
+
+    log("🔬 Έλεγχος ποιότητας...")
+    with profiler.stage("qc"):
+        qc_flags = evaluate_qc(processed_df)
+        qc_table = qc_summary(qc_flags)
+    log(format_qc_report(qc_flags, qc_table))
+
+    # Sample IDs με βάση τη θέση στο αρχικό αρχείο (κρατιούνται και μετά το φιλτράρισμα)
+    time_handler = TimeHandler(num_samples, settings)
+    sample_ids = time_handler.generate_sample_ids(csv_first_4, dash_part)
+
+    # Οι μηδενικές γραμμές αφαιρούνται πριν το layout, ώστε timestamps, zero blocks
+    # και parts να υπολογίζονται για τις γραμμές που πράγματι γράφονται
+    output_df = processed_df
+    remarks_flags = qc_flags
+    if drop_zero_nutrients:
+        with profiler.stage("drop_zero_nutrients"):
+            drop_mask = zero_nutrient_mask(processed_df)
+            if drop_mask is not None and drop_mask.any():
+                keep = ~drop_mask
+                log(f"🔍 Αφαιρούνται {int(drop_mask.sum())} γραμμές με μηδενικά nutrients")
+                output_df = processed_df.loc[keep].reset_index(drop=True)
+                sample_ids = [sid for sid, k in zip(sample_ids, keep) if k]
+                remarks_flags = qc_flags[keep].reset_index(drop=True)
+    num_rows = len(output_df)
+
+    log("🕐 Δημιουργία timestamps...")
+    formatted_date = format_analysis_date(date)
+    with profiler.stage("timestamps"):
+        time_handler = TimeHandler(num_rows, settings)
+        sample_times, zero_times = time_handler.generate_sample_times(initial_time)
+
+    log("📝 Δημιουργία metadata...")
+    with profiler.stage("metadata"):
+        metadata = MetadataGenerator.generate_metadata(num_rows, formatted_date, settings)
+    metadata["protocol_number"] = protocol_number
+    metadata['sample_ids'] = sample_ids
+    metadata['sample_times'] = sample_times
+    metadata['zero_times'] = zero_times
+    if settings.qc_write_remarks:
+        metadata['remark'] = qc_remarks(remarks_flags, existing=metadata['remark'])
+
+    # Parts και zero.csv σε δικό της φάκελο ανά εκτέλεση (ασφαλές για παράλληλα jobs)
+    with JobWorkspace(settings, label=protocol_number) as workspace:
+        log("0️⃣ Προετοιμασία zero data...")
+        with profiler.stage("zero_data"):
+            zero_dfs = prepare_zero_data(num_rows, formatted_date, zero_times, workspace.settings)
+
+        log("💾 Δημιουργία τελικού αρχείου...")
+        with profiler.stage("output"):
+            final_path = generate_output(
+                output_df, metadata, zero_dfs,
+                drop_zero_nutrients=False, settings=workspace.settings
+            )
+
+    with profiler.stage("archive"):
+        archive_run(protocol_number, formatted_date, output_df, sample_ids, sample_times,
+                    qc_flags=remarks_flags, final_path=final_path, settings=settings)
+
+    return {
+        'final_path': final_path,
+        'processed_df': processed_df,
+        'samples': num_samples,
+        'qc_flags': qc_flags,
+        'qc_summary': qc_table,
+    }
@@ -0,0 +1,265 @@
+"""
+Module για dry-run εκτίμηση (plan) της εξόδου από τις διαστάσεις του Excel
+
+Διαβάζει μόνο μεταδεδομένα του workbook (το <dimension> του πρώτου φύλλου στα .xlsx,
+το πλήθος γραμμών στα .xls, τις αλλαγές γραμμής στα CSV/TSV) και τις ρυθμίσεις,
+χωρίς ανάγνωση κελιών. Αναφέρει:
+    - δείγματα, zero blocks και γραμμές του τελικού CSV
+    - αρχική / τελική ώρα δειγμάτων
+    - πλήθος φορμών pH
+    - εκτιμώμενο χρόνο επεξεργασίας από το ιστορικό του telemetry
+
+Οι γραμμές μετρώνται όπως τις δηλώνει το αρχείο: κενές ή μηδενικές γραμμές
+(που θα αφαιρούνταν στην επεξεργασία) μετρώνται ως δείγματα. Για ακριβή αριθμό
+χρησιμοποιήστε το preflight.
+
+Εκτέλεση:
+    python -m modules.plan [--time 10:30] αρχείο1.xlsx 1605-7 ...
+"""
+import argparse
+import json
+import math
+import os
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import List, Optional
+from xml.etree import ElementTree
+
+try:
+    from .settings import AppSettings, get_settings
+    from .time_handler import TimeHandler
+    from .zero_manager import ZeroDataManager
+    from .preflight import PH_FORM_CAPACITY
+    from .catalog import DELIMITED_EXTENSIONS
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.time_handler import TimeHandler
+    from modules.zero_manager import ZeroDataManager
+    from modules.preflight import PH_FORM_CAPACITY
+    from modules.catalog import DELIMITED_EXTENSIONS
+
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="[A-Z]+\d+(?::[A-Z]+(\d+))?"')
+_ROW_RE = re.compile(rb'<(?:\w+:)?row\s[^>]*?r="(\d+)"')
+_SHEET_DATA_RE = re.compile(rb"<(?:\w+:)?sheetData")
+_CHUNK = 64 * 1024
+
+# Πόσες πρόσφατες εκτελέσεις του telemetry λαμβάνονται υπόψη στην εκτίμηση χρόνου
+THROUGHPUT_HISTORY = 20
+
+
+def _first_sheet_member(zf: zipfile.ZipFile) -> str:
+    """Το μέλος του zip για το πρώτο φύλλο (μέσω workbook.xml και των relationships)"""
+    try:
+        workbook = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+        sheet = workbook.find(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet")
+        rels = ElementTree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        targets = {r.get("Id"): r.get("Target") for r in rels.iter(f"{_PKG_REL_NS}Relationship")}
+        target = targets[sheet.get(f"{_REL_NS}id")]
+    except (KeyError, AttributeError, ElementTree.ParseError):
+        return "xl/worksheets/sheet1.xml"
+    return target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+
+
+def _xlsx_last_row(path: str) -> int:
+    with zipfile.ZipFile(path) as zf, zf.open(_first_sheet_member(zf)) as sheet:
+        # Το <dimension> βρίσκεται πριν το <sheetData>: συνήθως αρκεί το πρώτο chunk
+        head = b""
+        while True:
+            chunk = sheet.read(_CHUNK)
+            head += chunk
+            match = _DIMENSION_RE.search(head)
+            if match:
+                return int(match.group(1) or 1)
+            if not chunk or _SHEET_DATA_RE.search(head):
+                break
+
+        # Χωρίς <dimension> (ορισμένοι writers το παραλείπουν): ο αριθμός της τελευταίας
+        # <row>, με σάρωση των tags χωρίς ανάλυση κελιών
+        last, tail = 0, head
+        while True:
+            rows = _ROW_RE.findall(tail)
+            if rows:
+                last = int(rows[-1])
+            chunk = sheet.read(_CHUNK)
+            if not chunk:
+                return last
+            tail = tail[-256:] + chunk
+
+
+def _xls_last_row(path: str) -> int:
+    import xlrd
+
+    # on_demand: φορτώνεται μόνο το πρώτο φύλλο
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        return book.sheet_by_index(0).nrows
+    finally:
+        book.release_resources()
+
+
+def _delimited_last_row(path: str) -> int:
+    # Μέτρηση αλλαγών γραμμής σε blocks (χωρίς ανάλυση πεδίων)
+    lines, last = 0, b"\n"
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return lines + (last != b"\n")
+
+
+def workbook_rows(path: str) -> int:
+    """Γραμμές δεδομένων του πρώτου φύλλου (χωρίς την επικεφαλίδα), από τα μεταδεδομένα"""
+    lower = path.lower()
+    if lower.endswith(DELIMITED_EXTENSIONS):
+        last_row = _delimited_last_row(path)
+    elif lower.endswith(".xls"):
+        last_row = _xls_last_row(path)
+    else:
+        last_row = _xlsx_last_row(path)
+    return max(0, last_row - 1)
+
+
+def load_throughput(telemetry_file: str = None, settings: AppSettings = None) -> Optional[float]:
+    """
+    Δευτερόλεπτα ανά δείγμα από τις πρόσφατες εκτελέσεις του telemetry
+
+    Returns:
+        float ή None αν δεν υπάρχει ιστορικό με διάρκεια
+    """
+    settings = settings or get_settings()
+    telemetry_file = telemetry_file or os.path.join(settings.app_path, "gui", "usage_stats.json")
+    try:
+        with open(telemetry_file, "r", encoding="utf-8") as f:
+            history = json.load(f).get("processing_history", [])
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    records = [
+        r for r in history
+        if r.get("duration_sec") and r.get("samples")
+    ][-THROUGHPUT_HISTORY:]
+    samples = sum(r["samples"] for r in records)
+    if not samples:
+        return None
+    return sum(r["duration_sec"] for r in records) / samples
+
+
+@dataclass
+class LayoutPlan:
+    """Εκτίμηση εξόδου για ένα αρχείο"""
+    path: str
+    samples: int
+    zero_count: int
+    last_batch_samples: int
+    timed_rows: int
+    output_lines: int
+    first_time: str
+    last_time: str
+    ph_form_parts: int
+    estimated_seconds: Optional[float]
+
+    def format(self) -> str:
+        """Κείμενο αναφοράς (για CLI / GUI)"""
+        lines = [
+            f"🗺️ Plan: {os.path.basename(self.path)}",
+            f"📊 Δείγματα: {self.samples} (τελευταίο batch: {self.last_batch_samples})",
+            f"0️⃣ Zero blocks: {self.zero_count}",
+            f"📄 Γραμμές CSV: {self.output_lines} ({self.timed_rows} χρονισμένες)",
+        ]
+        if self.samples:
+            lines.append(f"🕐 Ώρες: {self.first_time} → {self.last_time}")
+        lines.append(f"🧪 Φόρμες pH: {self.ph_form_parts}")
+        if self.estimated_seconds is None:
+            lines.append("⏱️ Εκτίμηση χρόνου: — (χωρίς ιστορικό)")
+        else:
+            lines.append(f"⏱️ Εκτίμηση χρόνου: ~{self.estimated_seconds:.1f}s")
+        return "\n".join(lines)
+
+
+def plan_layout(path: str, settings: AppSettings = None, initial_time: str = None,
+                seconds_per_sample: float = None, zero_rows: int = None) -> LayoutPlan:
+    """
+    Dry-run: τι θα παραχθεί από το αρχείο, χωρίς ανάγνωση δεδομένων
+
+    Args:
+        path: Αρχείο εισόδου (.xls / .xlsx / CSV / TSV)
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        initial_time: Αρχική ώρα HH:MM (default: DEFAULT_TIME)
+        seconds_per_sample: Throughput για την εκτίμηση (default: από το telemetry)
+        zero_rows: Γραμμές του zero template (default: από τα μεταδεδομένα του ZERO_PATH)
+    """
+    settings = settings or get_settings()
+    initial_time = initial_time or settings.default_time
+    samples = workbook_rows(path)
+
+    zero_info = ZeroDataManager(settings=settings).calculate_zero_count(samples)
+    if zero_rows is None:
+        zero_rows = workbook_rows(str(settings.zero_path))
+
+    time_handler = TimeHandler(samples, settings)
+    sample_times, _ = time_handler.generate_sample_times(initial_time)
+
+    if seconds_per_sample is None:
+        seconds_per_sample = load_throughput(settings=settings)
+
+    return LayoutPlan(
+        path=path,
+        samples=samples,
+        zero_count=zero_info["zero_count"],
+        last_batch_samples=zero_info["sample_remainder"],
+        timed_rows=zero_info["total_rows"],
+        # Επικεφαλίδα + δείγματα + κάθε zero block με τη δική του επικεφαλίδα
+        output_lines=(1 + samples + zero_info["zero_count"] * (zero_rows + 1)) if samples else 0,
+        first_time=sample_times[0] if sample_times else "",
+        last_time=sample_times[-1] if sample_times else "",
+        ph_form_parts=math.ceil(samples / PH_FORM_CAPACITY),
+        estimated_seconds=None if seconds_per_sample is None else samples * seconds_per_sample,
+    )
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Dry-run εκτίμηση εξόδου από τις διαστάσεις του Excel")
+    parser.add_argument("files", nargs="+", help="Αρχεία .xls / .xlsx ή αριθμοί πρωτοκόλλου")
+    parser.add_argument("--time", default=None, help="Αρχική ώρα HH:MM (default: DEFAULT_TIME)")
+    args = parser.parse_args(argv)
+
+    try:
+        from .catalog import get_catalog
+    except ImportError:
+        from modules.catalog import get_catalog
+
+    settings = get_settings()
+    seconds_per_sample = load_throughput(settings=settings)
+    zero_rows = workbook_rows(str(settings.zero_path))
+    failed = 0
+    for name in args.files:
+        path = name
+        if not os.path.exists(path):
+            entry = get_catalog(settings).lookup(name)
+            if entry is None:
+                print(f"❌ Δεν βρέθηκε: {name}")
+                failed += 1
+                continue
+            path = entry.path
+        try:
+            plan = plan_layout(path, settings, args.time, seconds_per_sample, zero_rows)
+        except Exception as e:
+            print(f"❌ {os.path.basename(path)}: {e}")
+            failed += 1
+            continue
+        print(plan.format())
+        print()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+"""
+Module για προφόρτωση (prefetch) του επόμενου πιθανού Excel στο παρασκήνιο
+
+Οι χειριστές επεξεργάζονται συνήθως τα πρωτόκολλα με τη σειρά (1605-6, 1605-7, ...).
+Μετά από μια επιτυχημένη εκτέλεση διαβάζεται στο παρασκήνιο το επόμενο πιθανό
+αρχείο, ώστε η επόμενη φόρτωση να βρει το DataFrame έτοιμο.
+
+Ο WorkbookPrefetcher ζει μέσα στον worker process του pipeline (modules.worker) μαζί
+με την cache του: η ανάγνωση του Excel δεν μοιράζεται το GIL με το Tk loop, και το
+GUI μόνο ζητά το έτοιμο DataFrame (PipelineWorker.request_prefetched). Η ανάγνωση
+ενός αρχείου (read_input) δεν διακόπτεται: η ακύρωση σταματά μόνο τις αναγνώσεις που
+δεν έχουν ξεκινήσει, και όσο διαβάζεται ήδη ολοκληρώνεται και μπαίνει στην cache.
+Γι' αυτό ο worker, πριν από κάθε job, ακυρώνει το prefetch και περιμένει να τελειώσει
+η ανάγνωση σε εξέλιξη (cancel(wait=True)), ώστε το pipeline να μην τρέχει ποτέ
+ταυτόχρονα με ανάγνωση και να μη μοιράζεται μαζί της το GIL. Η cache έχει όριο
+πλήθους και μνήμης.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+try:
+    from .settings import AppSettings, get_settings
+    from .catalog import FileCatalog, get_catalog
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.catalog import FileCatalog, get_catalog
+
+
+MAX_ENTRIES = 2
+MAX_BYTES = 200 * 1024 * 1024
+# Καθυστέρηση πριν ξεκινήσει το prefetch (ο χρήστης συνήθως κοιτά πρώτα τα αποτελέσματα)
+START_DELAY = 2.0
+# Μέγιστη αναμονή του take() για ανάγνωση του ίδιου αρχείου που είναι σε εξέλιξη
+TAKE_WAIT = 30.0
+
+
+def next_protocols(protocol: str, catalog: FileCatalog, settings: AppSettings = None,
+                   limit: int = 2) -> List[str]:
+    """
+    Τα πιθανά επόμενα πρωτόκολλα που υπάρχουν στον κατάλογο
+
+    Πρώτα τα επόμενα dash numbers (1605-6 -> 1605-7, 1605-8), μετά τα πιο πρόσφατα
+    αρχεία του φακέλου που δεν έχουν ακόμη τελικό CSV στο OUTPUT_PATH.
+    """
+    settings = settings or get_settings()
+    out: List[str] = []
+    match = re.fullmatch(r"\s*(\d{4})-(\d+)\s*", protocol or "")
+    if match:
+        first_4, dash = match.group(1), int(match.group(2))
+        for step in (1, 2):
+            candidate = f"{first_4}-{dash + step}"
+            if catalog.lookup(candidate, refresh=False) is not None:
+                out.append(candidate)
+    if len(out) < limit:
+        for entry in catalog.newest(limit * 5):
+            if entry.protocol in out or entry.protocol == (protocol or "").strip():
+                continue
+            if not os.path.exists(os.path.join(settings.output_path, f"{entry.protocol}.csv")):
+                out.append(entry.protocol)
+            if len(out) >= limit:
+                break
+    return out[:limit]
+
+
+class WorkbookPrefetcher:
+    """Cache προφορτωμένων Excel με ένα background thread"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES,
+                 reader: Callable[[str], object] = None):
+        """
+        Args:
+            max_entries: Μέγιστο πλήθος DataFrames στην cache
+            max_bytes: Μέγιστη συνολική μνήμη της cache
+            reader: Συνάρτηση ανάγνωσης (default: data_loader.read_input)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._reader = reader
+        # path -> (mtime, size, DataFrame, bytes), με σειρά LRU
+        self._cache: "OrderedDict[str, Tuple[float, int, object, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # (path, Event που τίθεται όταν τελειώσει η ανάγνωσή του)
+        self._current: Optional[Tuple[str, threading.Event]] = None
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- ΠΡΟΓΡΑΜΜΑΤΙΣΜΟΣ ----------
+
+    def schedule(self, protocol: str, settings: AppSettings = None, delay: float = START_DELAY,
+                 on_cached: Callable[[str], None] = None):
+        """
+        Ξεκινά prefetch για τα επόμενα πιθανά αρχεία μετά το protocol
+
+        Args:
+            protocol: Το πρωτόκολλο που μόλις επεξεργάστηκε
+            settings: Ρυθμίσεις (για BASE_PATH / OUTPUT_PATH)
+            delay: Δευτερόλεπτα αναμονής πριν την πρώτη ανάγνωση
+            on_cached: Callback(protocol) μετά από κάθε αρχείο (καλείται από το thread)
+        """
+        self.cancel()
+        self._cancel = cancel = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(protocol, settings or get_settings(), delay, cancel, on_cached),
+            name="workbook-prefetch", daemon=True,
+        )
+        self._thread.start()
+
+    def cancel(self, wait: bool = False):
+        """
+        Ακυρώνει το prefetch: δεν ξεκινά άλλη ανάγνωση
+
+        Η ανάγνωση σε εξέλιξη δεν διακόπτεται· με wait=True η κλήση περιμένει να
+        τελειώσει (και να μπει στην cache) πριν επιστρέψει.
+        """
+        self._cancel.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def _run(self, protocol: str, settings: AppSettings, delay: float,
+             cancel: threading.Event, on_cached):
+        if cancel.wait(delay):
+            return
+        catalog = get_catalog(settings)
+        catalog.refresh()
+        for candidate in next_protocols(protocol, catalog, settings):
+            if cancel.is_set():
+                return
+            entry = catalog.lookup(candidate, refresh=False)
+            if entry is None or self._is_cached(entry.path, entry.mtime, entry.size):
+                continue
+            self._current = current = (entry.path, threading.Event())
+            try:
+                df = self._read(entry.path, settings)
+                # Αποθήκευση (και μετά από ακύρωση: η ανάγνωση έχει ήδη πληρωθεί) πριν
+                # το Event, ώστε το take() που περιμένει να τη βρει
+                self._store(entry.path, entry.mtime, entry.size, df)
+                if cancel.is_set():
+                    return
+            except Exception as e:
+                print(f"⚠️ Prefetch {candidate}: {e}")
+                continue
+            finally:
+                self._current = None
+                current[1].set()
+            if on_cached is not None:
+                on_cached(candidate)
+
+    def _read(self, path: str, settings: AppSettings):
+        if self._reader is not None:
+            return self._reader(path)
+        try:
+            from .data_loader import read_input
+        except ImportError:
+            from modules.data_loader import read_input
+        return read_input(path, settings)
+
+    # ---------- CACHE ----------
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[float, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime, st.st_size
+
+    def _is_cached(self, path: str, mtime: float, size: int) -> bool:
+        with self._lock:
+            cached = self._cache.get(path)
+        return cached is not None and cached[:2] == (mtime, size)
+
+    def _store(self, path: str, mtime: float, size: int, df):
+        try:
+            nbytes = int(df.memory_usage(deep=True).sum())
+        except AttributeError:
+            nbytes = 0
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            self._cache[path] = (mtime, size, df, nbytes)
+            self._cache.move_to_end(path)
+            while (len(self._cache) > self.max_entries
+                   or sum(item[3] for item in self._cache.values()) > self.max_bytes):
+                self._cache.popitem(last=False)
+
+    def take(self, path: str, timeout: float = TAKE_WAIT):
+        """
+        Επιστρέφει (και αφαιρεί από την cache) το DataFrame του path, αν είναι ακόμη έγκυρο
+
+        Αν το ίδιο αρχείο διαβάζεται αυτή τη στιγμή, περιμένει να ολοκληρωθεί (έως
+        timeout δευτερόλεπτα)· αλλιώς ακυρώνει το prefetch, ώστε να μη ανταγωνίζεται
+        τη φόρτωση του χρήστη.
+
+        Returns:
+            DataFrame ή None (cache miss)
+        """
+        current = self._current
+        if current is not None and os.path.normcase(current[0]) == os.path.normcase(path):
+            current[1].wait(timeout)
+        self.cancel()
+
+        with self._lock:
+            cached = self._cache.pop(path, None)
+        if cached is not None and self._stat(path) == cached[:2]:
+            self.hits += 1
+            return cached[2]
+        self.misses += 1
+        return None
+
+    def clear(self):
+        self.cancel()
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def reading(self) -> bool:
+        """True όσο διαβάζεται κάποιο αρχείο"""
+        return self._current is not None
+
+    @property
+    def cached_paths(self) -> List[str]:
+        with self._lock:
+            return list(self._cache)
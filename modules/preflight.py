@@ -0,0 +1,276 @@
+"""
+Module για γρήγορο προέλεγχο (preflight) ενός Excel πριν την πλήρη επεξεργασία
+
+Διαβάζει μόνο τις στήλες a/a, Fat/Protein/Lactose και pH (openpyxl read-only για
+.xlsx, xlrd ανά στήλη για .xls, ο parser του data_loader για CSV/TSV) και αναφέρει:
+    - κενά στην αρίθμηση a/a (όπως το MissingRowHandler.find_missing_aa_rows)
+    - δείγματα χωρίς pH (αυτά θα σταματούσαν τη φόρμα pH στο τέλος)
+    - γραμμές με μηδενικά nutrients
+    - την αναμενόμενη διάταξη (BatchLayout): δείγματα, zero blocks, parts, ώρες
+
+Εκτέλεση:
+    python -m modules.preflight [--time 10:30] αρχείο1.xlsx αρχείο2.xls ...
+"""
+import argparse
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+    from .columns import AA_COLUMN, get_header_resolver
+    from .layout import BatchLayout, _format_times
+    from .missing_row import MissingRowHandler
+    from .output_generator import NUTRIENT_COLUMNS
+    from .catalog import DELIMITED_EXTENSIONS
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.columns import AA_COLUMN, get_header_resolver
+    from modules.layout import BatchLayout, _format_times
+    from modules.missing_row import MissingRowHandler
+    from modules.output_generator import NUTRIENT_COLUMNS
+    from modules.catalog import DELIMITED_EXTENSIONS
+
+
+PREFLIGHT_COLUMNS = (AA_COLUMN,) + NUTRIENT_COLUMNS + ("pH",)
+# Δείγματα ανά φόρμα pH (PHHandler.fill_form: 3 blocks των 50)
+PH_FORM_CAPACITY = 150
+
+
+@dataclass
+class PreflightReport:
+    """Αποτέλεσμα προελέγχου ενός αρχείου"""
+    path: str
+    rows: int = 0                                   # γραμμές με a/a
+    missing_columns: List[str] = field(default_factory=list)
+    missing_aa: List[int] = field(default_factory=list)
+    duplicate_aa: List[int] = field(default_factory=list)
+    missing_ph: List[int] = field(default_factory=list)
+    zero_nutrient_aa: List[int] = field(default_factory=list)
+    layout: Optional[BatchLayout] = None
+    ph_form_parts: int = 0
+    first_time: str = ""
+    last_time: str = ""
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True αν η πλήρης επεξεργασία δεν θα σταματήσει σε γνωστό πρόβλημα"""
+        return not (self.missing_columns or self.missing_aa or self.missing_ph)
+
+    def format(self) -> str:
+        """Κείμενο αναφοράς (για GUI / CLI)"""
+        def sample(values: List[int], limit: int = 15) -> str:
+            text = ", ".join(str(v) for v in values[:limit])
+            return text + (f" ... (+{len(values) - limit})" if len(values) > limit else "")
+
+        lines = [f"🩺 Προέλεγχος: {os.path.basename(self.path)} ({self.elapsed:.2f}s)"]
+        if self.missing_columns:
+            lines.append(f"❌ Λείπουν στήλες: {', '.join(self.missing_columns)}")
+        lines.append(f"📊 Γραμμές με a/a: {self.rows}")
+        if self.missing_aa:
+            lines.append(f"⚠️ Κενά στην αρίθμηση a/a ({len(self.missing_aa)}): {sample(self.missing_aa)}")
+        if self.duplicate_aa:
+            lines.append(f"⚠️ Διπλά a/a ({len(self.duplicate_aa)}): {sample(self.duplicate_aa)}")
+        if self.missing_ph:
+            lines.append(f"❌ Χωρίς pH ({len(self.missing_ph)}): {sample(self.missing_ph)}")
+        if self.zero_nutrient_aa:
+            lines.append(f"ℹ️ Μηδενικά nutrients ({len(self.zero_nutrient_aa)}): {sample(self.zero_nutrient_aa)}")
+        if self.layout is not None:
+            lines.append(
+                f"🧱 Διάταξη: {self.layout.num_samples} δείγματα, {self.layout.num_batches} parts, "
+                f"{self.layout.zero_count} zero blocks, {self.layout.total_rows} χρονισμένες γραμμές"
+            )
+            if self.first_time:
+                lines.append(f"🕐 Ώρες: {self.first_time} → {self.last_time}")
+        lines.append(f"📄 Φόρμες pH: {self.ph_form_parts}")
+        lines.append("✅ Έτοιμο για επεξεργασία" if self.ok else "❌ Διορθώστε το αρχείο πριν την επεξεργασία")
+        return "\n".join(lines)
+
+
+def _positions(header: Sequence, settings: AppSettings) -> Dict[str, int]:
+    """Κανονικό όνομα -> θέση στήλης (μέσω του HeaderResolver, όπως στην επεξεργασία)"""
+    resolution = get_header_resolver(settings).resolve(list(header))
+    return {
+        name: pos for pos, name in zip(resolution.positions, resolution.names)
+        if name in PREFLIGHT_COLUMNS
+    }
+
+
+def _read_xlsx(path: str, settings: AppSettings) -> Tuple[Dict[str, int], Dict[str, list]]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        positions = _positions(header, settings)
+        columns: Dict[str, list] = {name: [] for name in positions}
+        if positions:
+            # Μόνο το εύρος των στηλών που χρειάζονται (όχι κελιά εκτός εύρους)
+            lo, hi = min(positions.values()), max(positions.values())
+            for row in ws.iter_rows(min_row=2, min_col=lo + 1, max_col=hi + 1, values_only=True):
+                for name, pos in positions.items():
+                    idx = pos - lo
+                    columns[name].append(row[idx] if idx < len(row) else None)
+    finally:
+        wb.close()
+    return positions, columns
+
+
+def _read_xls(path: str, settings: AppSettings) -> Tuple[Dict[str, int], Dict[str, list]]:
+    import xlrd
+
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        sheet = book.sheet_by_index(0)
+        header = sheet.row_values(0) if sheet.nrows else []
+        positions = _positions(header, settings)
+        columns = {name: sheet.col_values(pos, start_rowx=1) for name, pos in positions.items()}
+    finally:
+        book.release_resources()
+    return positions, columns
+
+
+def _read_delimited(path: str, settings: AppSettings) -> Tuple[Dict[str, int], Dict[str, list]]:
+    try:
+        from .data_loader import read_delimited
+    except ImportError:
+        from modules.data_loader import read_delimited
+
+    df = read_delimited(path, settings)
+    positions = _positions(df.columns, settings)
+    columns = {name: df.iloc[:, pos].tolist() for name, pos in positions.items()}
+    return positions, columns
+
+
+def read_preflight_columns(path: str, settings: AppSettings = None) -> Dict[str, list]:
+    """
+    Διαβάζει μόνο τις στήλες του προελέγχου
+
+    Returns:
+        Dict[str, list]: κανονικό όνομα -> τιμές (χωρίς την επικεφαλίδα)
+    """
+    settings = settings or get_settings()
+    lower = path.lower()
+    if lower.endswith(DELIMITED_EXTENSIONS):
+        reader = _read_delimited
+    else:
+        reader = _read_xls if lower.endswith(".xls") else _read_xlsx
+    _, columns = reader(path, settings)
+    return columns
+
+
+def _number(value) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        number = float(str(value).strip().replace(",", ".")) if isinstance(value, str) else float(value)
+    except ValueError:
+        return None
+    return None if math.isnan(number) else number
+
+
+def preflight(path: str, settings: AppSettings = None, drop_zero_nutrients: bool = None,
+              initial_time: str = None) -> PreflightReport:
+    """
+    Γρήγορος προέλεγχος αρχείου χωρίς πλήρη φόρτωση / επεξεργασία
+
+    Args:
+        path: Excel αρχείο (.xls / .xlsx)
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+        drop_zero_nutrients: Αν None, από τις ρυθμίσεις (επηρεάζει τη διάταξη)
+        initial_time: Αρχική ώρα HH:MM για τις ώρες της αναφοράς (default: DEFAULT_TIME)
+    """
+    settings = settings or get_settings()
+    if drop_zero_nutrients is None:
+        drop_zero_nutrients = settings.drop_zero_nutrients
+    start = time.perf_counter()
+    report = PreflightReport(path=path)
+
+    columns = read_preflight_columns(path, settings)
+    report.missing_columns = [c for c in PREFLIGHT_COLUMNS if c not in columns]
+    if AA_COLUMN not in columns:
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    aa_values = [_number(v) for v in columns[AA_COLUMN]]
+    rows = [i for i, aa in enumerate(aa_values) if aa is not None]
+    aa = [int(aa_values[i]) for i in rows]
+    report.rows = len(rows)
+
+    report.missing_aa = MissingRowHandler.find_missing_aa_rows(pd.DataFrame({AA_COLUMN: aa}), col=AA_COLUMN)
+    seen, duplicates = set(), set()
+    for value in aa:
+        (duplicates if value in seen else seen).add(value)
+    report.duplicate_aa = sorted(duplicates)
+
+    def column(name):
+        values = columns.get(name)
+        return [_number(values[i]) if values is not None and i < len(values) else None for i in rows]
+
+    ph = column("pH")
+    if "pH" in columns:
+        report.missing_ph = [a for a, p in zip(aa, ph) if p is None]
+    report.ph_form_parts = math.ceil(sum(1 for p in ph if p is not None) / PH_FORM_CAPACITY)
+
+    if all(c in columns for c in NUTRIENT_COLUMNS):
+        nutrients = [column(c) for c in NUTRIENT_COLUMNS]
+        report.zero_nutrient_aa = [
+            a for a, *vals in zip(aa, *nutrients) if all(not v for v in vals)
+        ]
+
+    num_samples = report.rows - (len(report.zero_nutrient_aa) if drop_zero_nutrients else 0)
+    report.layout = BatchLayout.from_settings(num_samples, settings)
+    if num_samples:
+        initial_time = initial_time or settings.default_time
+        offsets = np.array([report.layout.sample_offset(0), report.layout.sample_offset(num_samples - 1)])
+        report.first_time, report.last_time = _format_times(initial_time, offsets)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Γρήγορος προέλεγχος Excel πριν την επεξεργασία")
+    parser.add_argument("files", nargs="+", help="Αρχεία .xls / .xlsx ή αριθμοί πρωτοκόλλου")
+    parser.add_argument("--time", default=None, help="Αρχική ώρα HH:MM (default: DEFAULT_TIME)")
+    parser.add_argument("--keep-zero", action="store_true", help="Διάταξη χωρίς αφαίρεση μηδενικών nutrients")
+    args = parser.parse_args(argv)
+
+    try:
+        from .catalog import get_catalog
+    except ImportError:
+        from modules.catalog import get_catalog
+
+    settings = get_settings()
+    failed = 0
+    for name in args.files:
+        path = name
+        if not os.path.exists(path):
+            entry = get_catalog(settings).lookup(name)
+            if entry is None:
+                print(f"❌ Δεν βρέθηκε: {name}")
+                failed += 1
+                continue
+            path = entry.path
+        try:
+            report = preflight(path, settings, drop_zero_nutrients=False if args.keep_zero else None,
+                               initial_time=args.time)
+        except Exception as e:
+            print(f"❌ {os.path.basename(path)}: {e}")
+            failed += 1
+            continue
+        print(report.format())
+        print()
+        failed += 0 if report.ok else 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""
+Module για έλεγχο ποιότητας (QC) όλων των γραμμών του επεξεργασμένου DataFrame
+
+Οι κανόνες είναι δηλωτικοί (στήλη + όρια) και αξιολογούνται ως NumPy masks σε ένα
+πέρασμα. Κάθε κανόνας έχει ένα bit· το αποτέλεσμα είναι μία στήλη bitmask ανά γραμμή.
+Τα όρια είναι τα ίδια με τον χειροκίνητο έλεγχο του MissingRowHandler.validate_input.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .formatting import FIXED_POINT_ATTR
+except ImportError:
+    from modules.formatting import FIXED_POINT_ATTR
+
+
+QC_COLUMN = "QC"
+
+# (ελάχιστο, μέγιστο) ανά στήλη· None = χωρίς όριο
+QC_LIMITS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "Fat": (0, 10),
+    "Protein": (0, 6),
+    "Lactose": (0, 8),
+    "pH": (3, 6),
+    "FPD": (None, 0),
+}
+
+
+@dataclass(frozen=True)
+class QCRule:
+    """Ένας κανόνας ορίων για μία στήλη"""
+    code: str
+    column: str
+    bit: int
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    @property
+    def flag(self) -> int:
+        return 1 << self.bit
+
+    def describe(self) -> str:
+        if self.minimum is None:
+            return f"{self.column} ≤ {self.maximum:g}"
+        if self.maximum is None:
+            return f"{self.column} ≥ {self.minimum:g}"
+        return f"{self.minimum:g} ≤ {self.column} ≤ {self.maximum:g}"
+
+    def mask(self, values: np.ndarray) -> np.ndarray:
+        """True όπου η τιμή είναι εκτός ορίων (τα NaN δεν σημαίνονται)"""
+        bad = np.zeros(values.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if self.minimum is not None:
+                bad |= values < self.minimum
+            if self.maximum is not None:
+                bad |= values > self.maximum
+        return bad
+
+
+DEFAULT_RULES: Tuple[QCRule, ...] = tuple(
+    QCRule(code=col.upper(), column=col, bit=bit, minimum=lo, maximum=hi)
+    for bit, (col, (lo, hi)) in enumerate(QC_LIMITS.items())
+)
+
+
+def _column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Αριθμητικές τιμές της στήλης ως float (και για fixed-point Int32 στήλες)"""
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    decimals = (df.attrs.get(FIXED_POINT_ATTR) or {}).get(column)
+    if decimals is not None:
+        values = values / (10 ** decimals)
+    return values
+
+
+def evaluate_qc(df: pd.DataFrame, rules: Sequence[QCRule] = DEFAULT_RULES) -> pd.Series:
+    """
+    Αξιολογεί όλους τους κανόνες σε όλες τις γραμμές
+
+    Args:
+        df: Επεξεργασμένο DataFrame
+        rules: Κανόνες (default: DEFAULT_RULES)
+
+    Returns:
+        pd.Series: uint8/uint16 bitmask ανά γραμμή (0 = καμία παρατήρηση)
+    """
+    dtype = np.uint8 if max((r.bit for r in rules), default=0) < 8 else np.uint16
+    flags = np.zeros(len(df), dtype=dtype)
+    for rule in rules:
+        if rule.column in df.columns:
+            flags[rule.mask(_column_values(df, rule.column))] |= rule.flag
+    return pd.Series(flags, index=df.index, name=QC_COLUMN)
+
+
+def qc_summary(flags: pd.Series, rules: Sequence[QCRule] = DEFAULT_RULES) -> pd.DataFrame:
+    """
+    Πίνακας σύνοψης: πόσες γραμμές παραβιάζουν κάθε κανόνα
+
+    Returns:
+        pd.DataFrame: Στήλες ['Κανόνας', 'Όριο', 'Γραμμές']
+    """
+    values = flags.to_numpy()
+    return pd.DataFrame({
+        'Κανόνας': [r.code for r in rules],
+        'Όριο': [r.describe() for r in rules],
+        'Γραμμές': [int(np.count_nonzero(values & r.flag)) for r in rules],
+    })
+
+
+def qc_remarks(flags: pd.Series, rules: Sequence[QCRule] = DEFAULT_RULES,
+               existing: Sequence[str] = None) -> List[str]:
+    """
+    Κείμενο για τη στήλη Remark (π.χ. "QC:FAT,PH"), ενωμένο με τυχόν υπάρχον remark
+
+    Args:
+        flags: Αποτέλεσμα του evaluate_qc
+        rules: Κανόνες
+        existing: Υπάρχοντα remarks (ίδιο μήκος)
+    """
+    values = flags.to_numpy()
+    codes = np.full(len(values), "", dtype=object)
+    for rule in rules:
+        hit = (values & rule.flag) != 0
+        codes[hit] = codes[hit] + np.where(codes[hit] == "", "", ",") + rule.code
+
+    text = np.where(codes == "", "", "QC:" + codes)
+    if existing is None:
+        return text.tolist()
+
+    existing = np.asarray(existing, dtype=object)
+    joined = np.where((existing == "") | (text == ""), existing + text, existing + " " + text)
+    return joined.tolist()
+
+
+def format_qc_report(flags: pd.Series, summary: pd.DataFrame) -> str:
+    """Σύντομη αναφορά για log"""
+    total = len(flags)
+    flagged = summary[summary['Γραμμές'] > 0]
+    if flagged.empty:
+        return f"✅ QC: καμία παρατήρηση σε {total} γραμμές"
+    lines = [f"⚠️ QC: {int(np.count_nonzero(flags.to_numpy()))}/{total} γραμμές με παρατηρήσεις"]
+    for _, row in flagged.iterrows():
+        lines.append(f"   {row['Κανόνας']:<8} {row['Όριο']:<20} {row['Γραμμές']}")
+    return "\n".join(lines)
@@ -0,0 +1,442 @@
+"""
+Τοπική HTTP/JSON υπηρεσία για υποβολή αρχείων στο pipeline
+
+Ένα δυνατό μηχάνημα του εργαστηρίου τρέχει την υπηρεσία και οι υπόλοιποι σταθμοί
+ανεβάζουν τα Excel τους. Τα jobs μπαίνουν σε WorkerPool με περιορισμένο πλήθος
+workers, με όριο ενεργών jobs ανά client και συνολικό όριο αναμονής.
+
+Endpoints:
+    POST /jobs?filename=1605-6.xlsx&date=16-05&time=10:30&product=...&drop_zero=1
+         (σώμα: τα bytes του Excel)                    -> 202 {"job": {...}}
+         χωρίς date ισχύει το DEFAULT_DATE· αν δεν έχει οριστεί -> 400
+    GET  /jobs                     jobs του client
+    GET  /jobs/<id>                κατάσταση job
+    GET  /jobs/<id>/output         λήψη του τελικού CSV
+    GET  /health                   workers / ουρά
+
+Client: η IP του σταθμού (client_address)· σε αυτή ελέγχονται τα όρια ενεργών jobs και
+η πρόσβαση σε jobs / outputs. Η κεφαλίδα X-Client-Id είναι μόνο όνομα για εμφάνιση
+(label) και δεν χρησιμοποιείται σε κανέναν έλεγχο.
+
+Εκτέλεση:
+    python -m modules.service --host 0.0.0.0 --port 8765 --workers 2 --per-client 2
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+try:
+    from .settings import AppSettings, get_settings
+    from .data_loader import parse_protocol_number
+    from .pipeline import analysis_date_for
+    from .worker import WorkerPool
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.data_loader import parse_protocol_number
+    from modules.pipeline import analysis_date_for
+    from modules.worker import WorkerPool
+
+
+DEFAULT_PORT = 8765
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+ALLOWED_EXTENSIONS = (".xls", ".xlsx", ".csv", ".tsv", ".txt")
+POLL_INTERVAL = 0.1
+# Ολοκληρωμένα jobs που κρατιούνται (με τα αρχεία τους) πριν διαγραφούν τα παλαιότερα
+MAX_FINISHED_JOBS = 500
+LOG_TAIL = 20
+
+
+class ServiceError(Exception):
+    """Σφάλμα αιτήματος με HTTP status για την απάντηση"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class ServiceJob:
+    """Κατάσταση ενός job της υπηρεσίας"""
+    job_id: str
+    client: str                     # IP του σταθμού (όρια και πρόσβαση)
+    filename: str
+    protocol_number: str
+    date: str
+    time: str
+    product: str
+    drop_zero_nutrients: bool
+    status: str = "queued"          # queued / running / done / error
+    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    started: Optional[str] = None
+    finished: Optional[str] = None
+    samples: Optional[int] = None
+    error: Optional[str] = None
+    log: List[str] = field(default_factory=list)
+    upload_path: str = ""
+    output_dir: str = ""
+    final_path: Optional[str] = None
+    label: str = ""                 # X-Client-Id, μόνο για εμφάνιση
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        for key in ("upload_path", "output_dir", "final_path"):
+            data.pop(key)
+        data["output_url"] = f"/jobs/{self.job_id}/output" if self.status == "done" else None
+        return data
+
+
+class JobService:
+    """Ουρά jobs πάνω σε WorkerPool (thread-safe, για χρήση από τον HTTP server)"""
+
+    def __init__(self, settings: AppSettings = None, root: str = None,
+                 max_workers: int = 2, per_client: int = 2, max_queued: int = 50,
+                 max_jobs_per_worker: int = 20):
+        """
+        Args:
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+            root: Φάκελος για uploads και outputs (default: OUTPUT_PATH/service)
+            max_workers: Παράλληλα jobs
+            per_client: Μέγιστα ενεργά jobs (σε αναμονή ή εκτέλεση) ανά client
+            max_queued: Μέγιστα ενεργά jobs συνολικά
+            max_jobs_per_worker: Ανακύκλωση worker μετά από τόσα jobs
+        """
+        self.settings = settings or get_settings()
+        self.root = root or os.path.join(self.settings.output_path, "service")
+        self.per_client = per_client
+        self.max_queued = max_queued
+        self.pool = WorkerPool(max_workers=max_workers, max_jobs_per_worker=max_jobs_per_worker)
+        self.jobs: Dict[str, ServiceJob] = {}
+        self._pool_ids: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pump = threading.Thread(target=self._pump_events, name="service-events", daemon=True)
+
+    # ---------- ΚΥΚΛΟΣ ΖΩΗΣ ----------
+
+    def start(self):
+        os.makedirs(os.path.join(self.root, "uploads"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "outputs"), exist_ok=True)
+        with self._lock:
+            self.pool.start()
+        self._pump.start()
+
+    def shutdown(self, drain: bool = True, timeout: float = 60.0):
+        """Σταματά την παραλαβή events και τερματίζει τους workers"""
+        self._stop.set()
+        if self._pump.is_alive():
+            self._pump.join(2)
+        with self._lock:
+            self._apply_events(self.pool.shutdown(drain=drain, timeout=timeout))
+
+    def _pump_events(self):
+        while not self._stop.is_set():
+            with self._lock:
+                self._apply_events(self.pool.poll_events())
+            time.sleep(POLL_INTERVAL)
+
+    def _apply_events(self, events):
+        for kind, pool_id, payload in events:
+            job = self.jobs.get(self._pool_ids.get(pool_id, ""))
+            if job is None:
+                continue
+            if kind == "log":
+                if job.status == "queued":
+                    job.status = "running"
+                    job.started = datetime.now().isoformat(timespec="seconds")
+                job.log = (job.log + [str(payload)])[-LOG_TAIL:]
+            elif kind in ("done", "error"):
+                job.finished = datetime.now().isoformat(timespec="seconds")
+                if kind == "done":
+                    job.status = "done"
+                    job.final_path = payload["final_path"]
+                    job.samples = payload["samples"]
+                else:
+                    job.status = "error"
+                    job.error = payload.splitlines()[0] if payload else "Άγνωστο σφάλμα"
+                del self._pool_ids[pool_id]
+                self._remove_file(job.upload_path)
+                self._prune_finished()
+
+    # ---------- JOBS ----------
+
+    def submit(self, client: str, filename: str, data, size: int, date: str = None,
+               initial_time: str = None, product: str = None,
+               drop_zero_nutrients: bool = None, label: str = None) -> ServiceJob:
+        """
+        Αποθηκεύει το upload και το βάζει στην ουρά
+
+        Args:
+            client: Διεύθυνση του σταθμού (κλειδί για τα όρια και την πρόσβαση)
+            filename: Όνομα αρχείου (NNNN-NN.xls/.xlsx)
+            data: Stream με τα bytes του αρχείου
+            size: Μέγεθος σε bytes
+            label: Όνομα σταθμού για εμφάνιση (default: client)
+
+        Raises:
+            ServiceError: Μη έγκυρο αίτημα ή υπέρβαση ορίων
+        """
+        filename = os.path.basename(filename or "").strip()
+        protocol, ext = os.path.splitext(filename)
+        if ext.lower() not in ALLOWED_EXTENSIONS:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Επιτρέπονται μόνο αρχεία .xls/.xlsx/.csv/.tsv/.txt")
+        try:
+            csv_first_4, dash_part = parse_protocol_number(protocol)
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, str(e))
+        if size <= 0:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Κενό αρχείο")
+        if size > MAX_UPLOAD_BYTES:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                               f"Το αρχείο ξεπερνά τα {MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+
+        try:
+            date = analysis_date_for(csv_first_4, date, self.settings,
+                                     log=lambda text: print(f"🌐 {filename}: {text}"))
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, str(e))
+        initial_time = (initial_time or self.settings.default_time).strip()
+        try:
+            datetime.strptime(initial_time, "%H:%M")
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Μη έγκυρη ώρα (HH:MM)")
+        if drop_zero_nutrients is None:
+            drop_zero_nutrients = self.settings.drop_zero_nutrients
+
+        with self._lock:
+            active = [j for j in self.jobs.values() if j.active]
+            if sum(1 for j in active if j.client == client) >= self.per_client:
+                raise ServiceError(HTTPStatus.TOO_MANY_REQUESTS,
+                                   f"Μέγιστο {self.per_client} ενεργά jobs ανά σταθμό")
+            if len(active) >= self.max_queued:
+                raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "Η ουρά είναι γεμάτη")
+            job_id = uuid.uuid4().hex[:12]
+            job = ServiceJob(
+                job_id=job_id, client=client, label=(label or client).strip()[:64],
+                filename=filename, protocol_number=protocol,
+                date=date, time=initial_time, product=(product or self.settings.default_product).strip(),
+                drop_zero_nutrients=bool(drop_zero_nutrients),
+                upload_path=os.path.join(self.root, "uploads", job_id + ext.lower()),
+                output_dir=os.path.join(self.root, "outputs", job_id),
+            )
+            # Κράτηση θέσης πριν την (αργή) λήψη του αρχείου
+            self.jobs[job_id] = job
+
+        try:
+            self._receive(data, size, job.upload_path)
+        except Exception:
+            with self._lock:
+                self.jobs.pop(job_id, None)
+            self._remove_file(job.upload_path)
+            raise
+
+        # Κάθε job γράφει σε δικό του φάκελο: ίδιο πρωτόκολλο από δύο σταθμούς δεν συγκρούεται
+        os.makedirs(job.output_dir, exist_ok=True)
+        job_settings = replace(self.settings, output_path=job.output_dir,
+                               default_product=job.product)
+        with self._lock:
+            pool_id = self.pool.submit_file(
+                job.upload_path,
+                protocol_number=protocol,
+                csv_first_4=csv_first_4,
+                dash_part=dash_part,
+                date=date,
+                initial_time=initial_time,
+                drop_zero_nutrients=job.drop_zero_nutrients,
+                settings=job_settings,
+            )
+            self._pool_ids[pool_id] = job_id
+        return job
+
+    @staticmethod
+    def _receive(data, size: int, path: str, chunk: int = 1024 * 1024):
+        remaining = size
+        with open(path, "wb") as f:
+            while remaining > 0:
+                block = data.read(min(chunk, remaining))
+                if not block:
+                    raise ServiceError(HTTPStatus.BAD_REQUEST, "Το upload διακόπηκε")
+                f.write(block)
+                remaining -= len(block)
+
+    def get(self, job_id: str, client: str = None) -> ServiceJob:
+        with self._lock:
+            job = self.jobs.get(job_id)
+        if job is None or (client is not None and job.client != client):
+            raise ServiceError(HTTPStatus.NOT_FOUND, "Το job δεν βρέθηκε")
+        return job
+
+    def list_jobs(self, client: str = None) -> List[dict]:
+        with self._lock:
+            return [j.to_dict() for j in self.jobs.values() if client is None or j.client == client]
+
+    def health(self) -> dict:
+        with self._lock:
+            active = [j for j in self.jobs.values() if j.active]
+            return {
+                "workers": [{"name": w.name, "alive": w.is_alive(), "busy": w.busy,
+                             "jobs_done": w.jobs_done, "restarts": w.restarts}
+                            for w in self.pool.workers],
+                "queued": sum(1 for j in active if j.status == "queued"),
+                "running": sum(1 for j in active if j.status == "running"),
+                "max_queued": self.max_queued,
+                "per_client": self.per_client,
+            }
+
+    # ---------- ΚΑΘΑΡΙΣΜΟΣ ----------
+
+    def _prune_finished(self):
+        finished = [j for j in self.jobs.values() if not j.active]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            shutil.rmtree(job.output_dir, ignore_errors=True)
+            del self.jobs[job.job_id]
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """HTTP handler· το server.service είναι το JobService"""
+
+    server_version = "CSVLab/1.0"
+
+    @property
+    def service(self) -> JobService:
+        return self.server.service
+
+    def _client(self) -> str:
+        """Η IP του σταθμού: κλειδί για τα όρια και την πρόσβαση στα jobs"""
+        return self.client_address[0]
+
+    def _label(self) -> str:
+        """Όνομα σταθμού για εμφάνιση (X-Client-Id, δεν ελέγχεται)"""
+        return (self.headers.get("X-Client-Id") or self._client()).strip()[:64]
+
+    def _send_json(self, status: HTTPStatus, payload):
+        body = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, method: str):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if method == "POST" and parts == ["jobs"]:
+                return self._submit(parse_qs(url.query))
+            if method == "GET" and parts == ["health"]:
+                return self._send_json(HTTPStatus.OK, self.service.health())
+            if method == "GET" and parts == ["jobs"]:
+                return self._send_json(HTTPStatus.OK, {"jobs": self.service.list_jobs(self._client())})
+            if method == "GET" and len(parts) == 2 and parts[0] == "jobs":
+                job = self.service.get(parts[1], self._client())
+                return self._send_json(HTTPStatus.OK, {"job": job.to_dict()})
+            if method == "GET" and len(parts) == 3 and parts[0] == "jobs" and parts[2] == "output":
+                return self._download(self.service.get(parts[1], self._client()))
+            raise ServiceError(HTTPStatus.NOT_FOUND, "Άγνωστο endpoint")
+        except ServiceError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+
+    def _submit(self, query: Dict[str, List[str]]):
+        def arg(name):
+            values = query.get(name)
+            return values[0] if values else None
+
+        try:
+            size = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            raise ServiceError(HTTPStatus.LENGTH_REQUIRED, "Απαιτείται Content-Length")
+        drop = arg("drop_zero")
+        job = self.service.submit(
+            client=self._client(),
+            label=self._label(),
+            filename=arg("filename") or self.headers.get("X-Filename"),
+            data=self.rfile,
+            size=size,
+            date=arg("date"),
+            initial_time=arg("time"),
+            product=arg("product"),
+            drop_zero_nutrients=None if drop is None else drop.strip().lower() in ("1", "true", "yes", "on"),
+        )
+        self._send_json(HTTPStatus.ACCEPTED, {"job": job.to_dict()})
+
+    def _download(self, job: ServiceJob):
+        if job.status != "done" or not job.final_path or not os.path.exists(job.final_path):
+            raise ServiceError(HTTPStatus.CONFLICT, f"Το job δεν έχει output (κατάσταση: {job.status})")
+        size = os.path.getsize(job.final_path)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition",
+                         f'attachment; filename="{os.path.basename(job.final_path)}"')
+        self.end_headers()
+        with open(job.final_path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} {format % args}")
+
+
+def create_server(service: JobService, host: str = "127.0.0.1",
+                  port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """HTTP server δεμένος στο service (ξεκινά με serve_forever)"""
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP υπηρεσία υποβολής αρχείων στο pipeline")
+    parser.add_argument("--host", default="127.0.0.1", help="Διεύθυνση (0.0.0.0 για όλο το δίκτυο)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Θύρα")
+    parser.add_argument("--workers", type=int, default=2, help="Παράλληλα jobs")
+    parser.add_argument("--per-client", type=int, default=2, help="Ενεργά jobs ανά σταθμό")
+    parser.add_argument("--max-queued", type=int, default=50, help="Μέγιστα ενεργά jobs συνολικά")
+    parser.add_argument("--root", help="Φάκελος uploads/outputs (default: OUTPUT_PATH/service)")
+    args = parser.parse_args()
+
+    service = JobService(root=args.root, max_workers=args.workers,
+                         per_client=args.per_client, max_queued=args.max_queued)
+    service.start()
+    server = create_server(service, args.host, args.port)
+    print(f"🌐 Η υπηρεσία ακούει στο http://{args.host}:{args.port} "
+          f"({args.workers} workers, {args.per_client} jobs/σταθμό)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Τερματισμός υπηρεσίας...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
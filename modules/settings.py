@@ -0,0 +1,277 @@
+"""
+Module για τις ρυθμίσεις της εφαρμογής
+Typed settings object που φορτώνεται μία φορά από settings.json (με cache βάσει mtime)
+και περνάει ρητά σε όλο το pipeline.
+
+Οι προεπιλεγμένες τιμές έρχονται από το config.py. Το settings.json κρατά μόνο
+όσα άλλαξε ο χρήστης από το παράθυρο ρυθμίσεων.
+"""
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# Import config με fallback
+try:
+    from . import config
+except ImportError:
+    import config
+
+
+SETTINGS_FILE = os.path.join(str(config.APP_PATH), "settings.json")
+
+# Τιμές του DEFAULT_DATE εκτός από σταθερή DD-MM
+DATE_TODAY = "today"
+DATE_FROM_PROTOCOL = "protocol"
+DATE_SOURCES = (DATE_TODAY, DATE_FROM_PROTOCOL)
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """Αμετάβλητες ρυθμίσεις επεξεργασίας (ένα snapshot ανά εκτέλεση)"""
+
+    # Διαδρομές
+    app_path: str
+    base_path: str
+    output_path: str
+    parts_path: str
+    zero_path: str
+    ph_form_template_path: str
+    archive_path: str
+    zero_remote_url: str
+
+    # Επεξεργασία
+    two_decimal_cols: Tuple[str, ...]
+    four_decimal_cols: Tuple[str, ...]
+    cols_to_delete: Tuple[str, ...]
+    drop_zero_nutrients: bool
+    fixed_point_nutrients: bool
+    qc_write_remarks: bool
+    archive_samples: bool
+    memory_profile: bool
+    column_renames: Dict[str, str]
+
+    # Χρονισμός
+    batch_size: int
+    t_sample_increment: int
+    t_zero_increment: int
+    zero_block_rows: int
+    zero_row_index: Tuple[int, ...]
+
+    # Προεπιλογές
+    default_product: str
+    default_time: str
+    default_date: str
+    default_rep: int
+
+    # Output
+    target_column_order: Tuple[str, ...]
+    output_dialect: str
+    output_xlsx: bool
+    output_in_memory: bool
+    render_workers: int
+
+    @property
+    def final_output_path(self) -> str:
+        """Προεπιλεγμένο τελικό CSV μέσα στο output_path"""
+        return os.path.join(self.output_path, "final.csv")
+
+    @classmethod
+    def from_config(cls, module=None) -> "AppSettings":
+        """Δημιουργεί ρυθμίσεις από τις τιμές του config.py"""
+        module = module or config
+        values = {}
+        for f in fields(cls):
+            value = getattr(module, f.name.upper())
+            values[f.name] = _coerce(f.name, value)
+        return cls(**values)
+
+    @classmethod
+    def from_dict(cls, data: dict, base: "AppSettings" = None) -> "AppSettings":
+        """
+        Δημιουργεί ρυθμίσεις από dictionary (κλειδιά όπως στο config.py, π.χ. 'BATCH_SIZE')
+
+        Args:
+            data: Οι τιμές προς εφαρμογή
+            base: Ρυθμίσεις βάσης για όσα κλειδιά λείπουν (default: config.py)
+        """
+        base = base or cls.from_config()
+        known = {f.name for f in fields(cls)}
+        overrides = {}
+        for key, value in data.items():
+            name = key.lower()
+            if name in known:
+                overrides[name] = _coerce(name, value)
+        settings = replace(base, **overrides)
+        settings.validate()
+        return settings
+
+    def to_dict(self) -> dict:
+        """Επιστρέφει τις ρυθμίσεις ως JSON-friendly dictionary"""
+        out = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            out[f.name.upper()] = value
+        return out
+
+    def validate(self):
+        """Ελέγχει τις τιμές και πετά ValueError με όλα τα σφάλματα"""
+        errors = []
+
+        if not str(self.base_path).strip():
+            errors.append("Το BASE_PATH δεν μπορεί να είναι κενό")
+
+        for name in ("batch_size", "t_sample_increment", "t_zero_increment",
+                     "zero_block_rows", "default_rep", "render_workers"):
+            if getattr(self, name) < 1:
+                errors.append(f"{name.upper()} πρέπει να είναι ≥ 1")
+
+        try:
+            datetime.strptime(self.default_time, "%H:%M")
+        except ValueError:
+            errors.append(f"Μη έγκυρη DEFAULT_TIME: {self.default_time} (HH:MM)")
+
+        default_date = self.default_date.strip()
+        if default_date and default_date.lower() not in DATE_SOURCES:
+            try:
+                datetime.strptime(default_date, "%d-%m")
+            except ValueError:
+                errors.append(f"Μη έγκυρη DEFAULT_DATE: {self.default_date} "
+                              f"(DD-MM, {', '.join(DATE_SOURCES)} ή κενό)")
+
+        if len(self.zero_row_index) != self.zero_block_rows:
+            errors.append(
+                f"ZERO_ROW_INDEX έχει {len(self.zero_row_index)} θέσεις "
+                f"αντί για {self.zero_block_rows} (ZERO_BLOCK_ROWS)"
+            )
+
+        try:
+            from .dialect import DIALECTS
+        except ImportError:
+            from modules.dialect import DIALECTS
+        if self.output_dialect not in DIALECTS:
+            errors.append(
+                f"Άγνωστη OUTPUT_DIALECT: {self.output_dialect} (διαθέσιμες: {', '.join(DIALECTS)})"
+            )
+
+        if errors:
+            raise ValueError("Μη έγκυρες ρυθμίσεις: " + "; ".join(errors))
+
+
+_INT_FIELDS = {"batch_size", "t_sample_increment", "t_zero_increment",
+               "zero_block_rows", "default_rep", "render_workers"}
+_BOOL_FIELDS = {"drop_zero_nutrients", "fixed_point_nutrients", "qc_write_remarks",
+                "archive_samples", "memory_profile", "output_xlsx",
+                "output_in_memory"}
+_TUPLE_FIELDS = {"two_decimal_cols", "four_decimal_cols", "cols_to_delete",
+                 "zero_row_index", "target_column_order"}
+
+
+def _coerce(name: str, value):
+    """Μετατρέπει μια τιμή στον τύπο του αντίστοιχου πεδίου"""
+    if name in _INT_FIELDS:
+        return int(value)
+    if name in _BOOL_FIELDS:
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+    if name == "zero_row_index":
+        return tuple(int(v) for v in value)
+    if name in _TUPLE_FIELDS:
+        return tuple(str(v) for v in value)
+    if name == "column_renames":
+        return {str(k): str(v) for k, v in dict(value).items()}
+    return str(value)
+
+
+class SettingsStore:
+    """Φόρτωση/αποθήκευση ρυθμίσεων σε JSON με in-memory cache βάσει mtime"""
+
+    def __init__(self, path: str = None):
+        self.path = str(path or SETTINGS_FILE)
+        self._cached: Optional[AppSettings] = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def _current_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> AppSettings:
+        """
+        Επιστρέφει τις τρέχουσες ρυθμίσεις.
+        Το αρχείο ξαναδιαβάζεται μόνο αν άλλαξε το mtime του.
+        """
+        mtime = self._current_mtime()
+        with self._lock:
+            if self._cached is not None and mtime == self._mtime:
+                return self._cached
+
+            defaults = AppSettings.from_config()
+            settings = defaults
+            if mtime is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        settings = AppSettings.from_dict(json.load(f), base=defaults)
+                except (OSError, ValueError, TypeError) as e:
+                    print(f"⚠️ Μη έγκυρο {self.path}, χρησιμοποιούνται οι προεπιλογές: {e}")
+                    settings = defaults
+
+            self._cached = settings
+            self._mtime = mtime
+            return settings
+
+    def save(self, new_values: dict) -> AppSettings:
+        """
+        Επικυρώνει και αποθηκεύει ατομικά τις νέες τιμές (temp file + os.replace)
+
+        Args:
+            new_values: Dictionary με κλειδιά όπως στο config.py
+
+        Returns:
+            AppSettings: Οι νέες ρυθμίσεις
+        """
+        settings = AppSettings.from_dict(new_values, base=self.load())
+        defaults = AppSettings.from_config().to_dict()
+        changed = {k: v for k, v in settings.to_dict().items() if defaults.get(k) != v}
+
+        folder = os.path.dirname(self.path) or "."
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(changed, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._cached = settings
+            self._mtime = self._current_mtime()
+        return settings
+
+
+_default_store = SettingsStore()
+
+
+def get_settings() -> AppSettings:
+    """Επιστρέφει τις τρέχουσες ρυθμίσεις από το κοινό store"""
+    return _default_store.load()
+
+
+def save_settings(new_values: dict) -> AppSettings:
+    """Αποθηκεύει νέες τιμές στο κοινό store"""
+    return _default_store.save(new_values)
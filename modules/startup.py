@@ -0,0 +1,94 @@
+"""
+Module για γρήγορη εκκίνηση: χρονομέτρηση imports και "ζέσταμα" των βαριών
+βιβλιοθηκών (pandas, numpy, openpyxl, xlrd, requests) σε background thread.
+Το GUI ζεσταίνει μόνο τα GUI_MODULES· τα HEAVY_MODULES τα φορτώνει ο worker.
+"""
+import importlib
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# Με τη σειρά που τα χρειάζεται το pipeline
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "openpyxl",
+    "xlrd",
+    "requests",
+    "modules.data_loader",
+    "modules.data_processor",
+    "modules.time_handler",
+    "modules.zero_manager",
+    "modules.output_generator",
+    "modules.missing_row",
+)
+
+# Το GUI δεν τρέχει πλέον το pipeline (το κάνει ο worker, που φορτώνει τα
+# HEAVY_MODULES μόνος του): ζεσταίνει μόνο όσα χρησιμοποιεί η ίδια η διεργασία Tk
+GUI_MODULES = (
+    "pandas",
+    "modules.data_loader",
+    "modules.missing_row",
+)
+
+# Χρόνος εκκίνησης διεργασίας (όσο πιο νωρίς γίνει import αυτό το module)
+PROCESS_START = time.perf_counter()
+
+
+def timed_imports(names: Iterable[str] = HEAVY_MODULES) -> List[Tuple[str, float]]:
+    """
+    Κάνει import τα modules ένα-ένα και μετρά τον χρόνο του καθενός
+
+    Args:
+        names: Ονόματα modules
+
+    Returns:
+        List[Tuple[str, float]]: (όνομα, δευτερόλεπτα). Όσα ήταν ήδη φορτωμένα έχουν ~0.
+    """
+    timings = []
+    for name in names:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            print(f"⚠️ Αποτυχία import {name}: {e}")
+            continue
+        timings.append((name, time.perf_counter() - start))
+    return timings
+
+
+def warm_imports_async(names: Iterable[str] = HEAVY_MODULES,
+                       on_done: Optional[Callable[[List[Tuple[str, float]]], None]] = None
+                       ) -> threading.Thread:
+    """
+    Ξεκινά daemon thread που φορτώνει τα βαριά modules ενώ το UI είναι ήδη ανοιχτό
+
+    Args:
+        names: Ονόματα modules
+        on_done: Callback με τα timings όταν ολοκληρωθεί (καλείται από το thread)
+    """
+    names = tuple(names)
+
+    def worker():
+        timings = timed_imports(names)
+        if on_done:
+            on_done(timings)
+
+    thread = threading.Thread(target=worker, name="import-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def format_import_report(timings: List[Tuple[str, float]]) -> str:
+    """Μορφοποιεί τα timings σε αναφορά (μεγαλύτερα πρώτα)"""
+    total = sum(sec for _, sec in timings)
+    lines = [f"⏱️ Imports: {total:.2f}s συνολικά"]
+    for name, sec in sorted(timings, key=lambda t: t[1], reverse=True):
+        lines.append(f"   {name:<28} {sec * 1000:8.1f} ms")
+    return "\n".join(lines)
+
+
+def elapsed_since_start() -> float:
+    """Δευτερόλεπτα από την εκκίνηση της διεργασίας"""
+    return time.perf_counter() - PROCESS_START
+
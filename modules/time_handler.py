@@ -4,18 +4,22 @@ Module για τη διαχείριση χρονικών δεδομένων κα
 import datetime
 import random
 from typing import List, Tuple
-# Import config με fallback
+
 try:
-    from . import config
+    from .settings import AppSettings, get_settings
+    from .layout import BatchLayout
 except ImportError:
-    import config
+    from modules.settings import AppSettings, get_settings
+    from modules.layout import BatchLayout
 
 
 class TimeHandler:
     """Κλάση για τη διαχείριση χρονικών δεδομένων"""
     
-    def __init__(self, num_samples: int):
+    def __init__(self, num_samples: int, settings: AppSettings = None):
         self.num_samples = num_samples
+        self.settings = settings or get_settings()
+        self.layout = BatchLayout.from_settings(num_samples, self.settings)
     
     def get_analysis_date(self) -> str:
         """
@@ -43,8 +47,9 @@ class TimeHandler:
         Returns:
             str: Ώρα σε μορφή HH:MM
         """
+        default_time = self.settings.default_time
         user_time_input = input(
-            f"Δώσε αρχική ώρα ή πάτα Enter για προεπιλογή ({config.DEFAULT_TIME}): "
+            f"Δώσε αρχική ώρα ή πάτα Enter για προεπιλογή ({default_time}): "
         )
         
         if not user_time_input:
@@ -64,8 +69,8 @@ class TimeHandler:
             print(f"✅ Αρχική ώρα: {time_str}")
             return time_str
         except ValueError:
-            print(f"❌ Λάθος μορφή. Χρησιμοποιείται προεπιλογή: {config.DEFAULT_TIME}")
-            return config.DEFAULT_TIME
+            print(f"❌ Λάθος μορφή. Χρησιμοποιείται προεπιλογή: {default_time}")
+            return default_time
     
     def generate_sample_ids(self, csv_first_4: str, dash_part: str) -> List[str]:
         """
@@ -95,33 +100,10 @@ class TimeHandler:
         Returns:
             Tuple[List[str], List[str]]: (sample_times, zero_times)
         """
-        current_time = datetime.datetime.strptime(
-            initial_time, "%H:%M"
-        ).replace(year=2000, month=1, day=1)
-        
-        sample_times = []
-        zero_times = []
-        
-        num_full_batches = self.num_samples // config.BATCH_SIZE
-        remaining_samples = self.num_samples % config.BATCH_SIZE
-        
-        # Επεξεργασία πλήρων batches
-        for _ in range(num_full_batches):
-            # Χρόνοι για δείγματα
-            for _ in range(config.BATCH_SIZE):
-                current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
-                sample_times.append(current_time.strftime("%H:%M"))
-            
-            # Χρόνοι για zero block
-            for _ in range(config.ZERO_BLOCK_ROWS):
-                current_time += datetime.timedelta(seconds=config.T_ZERO_INCREMENT)
-                zero_times.append(current_time.strftime("%H:%M"))
-        
-        # Επεξεργασία υπολοίπων δειγμάτων
-        for _ in range(remaining_samples):
-            current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
-            sample_times.append(current_time.strftime("%H:%M"))
-        
+        # Ίδιο layout με τα zero blocks και τον χωρισμό σε parts
+        sample_times = self.layout.sample_times(initial_time)
+        zero_times = self.layout.zero_times(initial_time)
+
         print(f"✅ Δημιουργήθηκαν {len(sample_times)} sample times και "
               f"{len(zero_times)} zero times")
         
@@ -132,27 +114,30 @@ class MetadataGenerator:
     """Κλάση για τη δημιουργία μεταδεδομένων"""
     
     @staticmethod
-    def generate_metadata(num_samples: int, date: str) -> dict:
+    def generate_metadata(num_samples: int, date: str,
+                          settings: AppSettings = None) -> dict:
         """
         Δημιουργεί όλα τα μεταδεδομένα για τα δείγματα
         
         Args:
             num_samples: Αριθμός δειγμάτων
             date: Ημερομηνία ανάλυσης
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
             
         Returns:
             dict: Dictionary με metadata
         """
+        settings = settings or get_settings()
         return {
-            'product': [config.DEFAULT_PRODUCT] * num_samples,
-            'rep': [config.DEFAULT_REP] * num_samples,
+            'product': [settings.default_product] * num_samples,
+            'rep': [settings.default_rep] * num_samples,
             'date': [date] * num_samples,
             'remark': [""] * num_samples
         }
 
 
 def generate_time_metadata(df_length: int, csv_first_4: str, 
-                          dash_part: str) -> dict:
+                          dash_part: str, settings: AppSettings = None) -> dict:
     """
     Wrapper function για δημιουργία όλων των χρονικών μεταδεδομένων
     
@@ -160,11 +145,13 @@ def generate_time_metadata(df_length: int, csv_first_4: str,
         df_length: Αριθμός γραμμών στο DataFrame
         csv_first_4: Πρώτα 4 ψηφία
         dash_part: Dash part
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
         
     Returns:
         dict: Dictionary με όλα τα μεταδεδομένα
     """
-    time_handler = TimeHandler(df_length)
+    settings = settings or get_settings()
+    time_handler = TimeHandler(df_length, settings)
     
     # Λήψη ημερομηνίας και ώρας
     date = time_handler.get_analysis_date()
@@ -175,7 +162,7 @@ def generate_time_metadata(df_length: int, csv_first_4: str,
     sample_times, zero_times = time_handler.generate_sample_times(initial_time)
     
     # Δημιουργία υπόλοιπων metadata
-    metadata = MetadataGenerator.generate_metadata(df_length, date)
+    metadata = MetadataGenerator.generate_metadata(df_length, date, settings)
     
     return {
         'sample_ids': sample_ids,
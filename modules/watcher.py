@@ -0,0 +1,251 @@
+"""
+Module για αυτόματη επεξεργασία νέων αρχείων που εμφανίζονται στο BASE_PATH
+(watch-folder service για headless λειτουργία)
+
+Polling του φακέλου (λειτουργεί και σε Windows / network shares όπου δεν υπάρχει
+inotify), debounce μέχρι να σταθεροποιηθεί το μέγεθος του αρχείου, επεξεργασία σε
+bounded process pool και journal κατάστασης ανά αρχείο στο OUTPUT_PATH.
+
+Εκτέλεση:
+    python -m modules.watcher [--path ΦΑΚΕΛΟΣ] [--workers 2] [--interval 2]
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    from .settings import AppSettings, get_settings
+    from .data_loader import parse_protocol_number
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+    from modules.data_loader import parse_protocol_number
+
+
+WATCH_EXTENSIONS = (".xls", ".xlsx")
+JOURNAL_NAME = ".watch_journal.json"
+
+
+class ProcessingJournal:
+    """Journal κατάστασης ανά αρχείο (JSON, ατομικές εγγραφές)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Μη έγκυρο journal {self.path}, ξεκινά νέο: {e}")
+        return {}
+
+    def _save(self):
+        folder = os.path.dirname(self.path) or "."
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".journal-", suffix=".tmp", dir=folder)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def is_handled(self, name: str, signature: list) -> bool:
+        """
+        True αν το αρχείο με το ίδιο (size, mtime) έχει ήδη επεξεργαστεί ή απέτυχε.
+        Αρχεία σε κατάσταση 'running' (π.χ. μετά από crash) ξαναεπεξεργάζονται.
+        """
+        entry = self.entries.get(name)
+        return (bool(entry) and entry.get("status") in ("done", "error")
+                and entry.get("signature") == signature)
+
+    def update(self, name: str, **fields):
+        with self._lock:
+            entry = self.entries.setdefault(name, {})
+            entry.update(fields)
+            entry["updated"] = datetime.now().isoformat()
+            self._save()
+
+
+def process_file(path: str, settings: AppSettings, date: str = None) -> str:
+    """
+    Επεξεργάζεται ένα αρχείο (τρέχει σε worker process· το run_pipeline χρησιμοποιεί
+    δικό του φάκελο εργασίας ανά job, οπότε οι workers δεν συγκρούονται)
+
+    Args:
+        date: Ημερομηνία ανάλυσης DD-MM (None: DEFAULT_DATE, βλ. analysis_date_for)
+
+    Returns:
+        str: Διαδρομή τελικού αρχείου
+    """
+    try:
+        from .pipeline import analysis_date_for, run_pipeline
+        from .data_loader import read_input
+    except ImportError:
+        from modules.pipeline import analysis_date_for, run_pipeline
+        from modules.data_loader import read_input
+
+    protocol = os.path.splitext(os.path.basename(path))[0].strip()
+    csv_first_4, dash_part = parse_protocol_number(protocol)
+
+    result = run_pipeline(
+        read_input(path, settings), protocol, csv_first_4, dash_part,
+        date=analysis_date_for(csv_first_4, date, settings),
+        initial_time=settings.default_time,
+        settings=settings,
+    )
+    return result['final_path']
+
+
+class FolderWatcher:
+    """Παρακολουθεί φάκελο και στέλνει σταθεροποιημένα αρχεία στο worker pool"""
+
+    def __init__(self, watch_path: str = None, settings: AppSettings = None,
+                 poll_interval: float = 2.0, stable_checks: int = 2, max_workers: int = 2,
+                 date: str = None):
+        """
+        Args:
+            watch_path: Φάκελος παρακολούθησης (default: BASE_PATH)
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+            date: Ημερομηνία ανάλυσης DD-MM για όλα τα αρχεία (default: DEFAULT_DATE)
+            poll_interval: Δευτερόλεπτα μεταξύ σαρώσεων
+            stable_checks: Πόσες διαδοχικές σαρώσεις με ίδιο μέγεθος/mtime πριν την επεξεργασία
+            max_workers: Μέγιστος αριθμός παράλληλων επεξεργασιών
+        """
+        self.settings = settings or get_settings()
+        self.watch_path = watch_path or self.settings.base_path
+        self.poll_interval = poll_interval
+        self.stable_checks = stable_checks
+        self.max_workers = max_workers
+        self.date = date
+        if not (date or self.settings.default_date.strip()):
+            raise ValueError("Η παρακολούθηση χρειάζεται ημερομηνία ανάλυσης: δώστε --date "
+                             "ή ορίστε DEFAULT_DATE (DD-MM, today ή protocol)")
+
+        self.journal = ProcessingJournal(os.path.join(self.settings.output_path, JOURNAL_NAME))
+        self._pending: Dict[str, dict] = {}   # name -> {'signature', 'stable'}
+        self._running: Dict[str, Future] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _scan(self) -> Dict[str, list]:
+        """Επιστρέφει {όνομα: [size, mtime_ns]} για όλα τα Excel του φακέλου"""
+        found = {}
+        try:
+            with os.scandir(self.watch_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("~$") or not name.lower().endswith(WATCH_EXTENSIONS):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    found[name] = [st.st_size, st.st_mtime_ns]
+        except FileNotFoundError:
+            print(f"❌ Ο φάκελος '{self.watch_path}' δεν βρέθηκε.")
+        return found
+
+    def poll_once(self) -> List[str]:
+        """
+        Μία σάρωση: ενημερώνει το debounce και υποβάλλει όσα αρχεία σταθεροποιήθηκαν
+
+        Returns:
+            List[str]: Τα αρχεία που υποβλήθηκαν σε αυτή τη σάρωση
+        """
+        submitted = []
+        current = self._scan()
+
+        for name in list(self._pending):
+            if name not in current:
+                del self._pending[name]
+
+        for name, signature in current.items():
+            if name in self._running or self.journal.is_handled(name, signature):
+                continue
+
+            state = self._pending.get(name)
+            if state is None or state['signature'] != signature or signature[0] == 0:
+                # Νέο ή ακόμη γράφεται
+                self._pending[name] = {'signature': signature, 'stable': 0}
+                continue
+
+            state['stable'] += 1
+            if state['stable'] >= self.stable_checks:
+                del self._pending[name]
+                self._submit(name, signature)
+                submitted.append(name)
+
+        return submitted
+
+    def _submit(self, name: str, signature: list):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        path = os.path.join(self.watch_path, name)
+        self.journal.update(name, signature=signature, status="running", output=None, error=None)
+        print(f"⚡ Επεξεργασία: {name}")
+
+        future = self._pool.submit(process_file, path, self.settings, self.date)
+        self._running[name] = future
+        future.add_done_callback(lambda f, n=name, s=signature: self._on_done(n, s, f))
+
+    def _on_done(self, name: str, signature: list, future: Future):
+        self._running.pop(name, None)
+        try:
+            output = future.result()
+            self.journal.update(name, signature=signature, status="done", output=output)
+            print(f"✅ {name} -> {output}")
+        except Exception as e:
+            self.journal.update(name, signature=signature, status="error", error=str(e)[:200])
+            print(f"❌ {name}: {e}")
+
+    def run_forever(self):
+        """Κύριος βρόχος μέχρι Ctrl+C"""
+        print(f"👀 Παρακολούθηση: {self.watch_path} (κάθε {self.poll_interval}s, "
+              f"{self.max_workers} workers)")
+        try:
+            while True:
+                self.poll_once()
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("\n⚠️  Διακοπή παρακολούθησης...")
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Τερματίζει το pool (περιμένει τις τρέχουσες εργασίες)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Αυτόματη επεξεργασία νέων αρχείων")
+    parser.add_argument("--path", help="Φάκελος παρακολούθησης (default: BASE_PATH)")
+    parser.add_argument("--workers", type=int, default=2, help="Παράλληλες επεξεργασίες")
+    parser.add_argument("--interval", type=float, default=2.0, help="Δευτερόλεπτα μεταξύ σαρώσεων")
+    parser.add_argument("--stable-checks", type=int, default=2,
+                        help="Σαρώσεις με σταθερό μέγεθος πριν την επεξεργασία")
+    parser.add_argument("--date", help="Ημερομηνία ανάλυσης DD-MM (default: DEFAULT_DATE)")
+    args = parser.parse_args()
+
+    try:
+        watcher = FolderWatcher(
+            watch_path=args.path,
+            poll_interval=args.interval,
+            stable_checks=args.stable_checks,
+            max_workers=args.workers,
+            date=args.date,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    watcher.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,723 @@
+"""
+Module για εκτέλεση του pipeline σε ξεχωριστές διεργασίες (worker processes)
+
+Το GUI δεν τρέχει το pipeline στο δικό του process: στέλνει το φορτωμένο DataFrame στον
+worker μέσω shared memory (pickle protocol 5 με out-of-band buffers: τα arrays
+γράφονται κατευθείαν στο block και ο worker τα διαβάζει ως memoryviews χωρίς
+αντίγραφο), και ο worker στέλνει πίσω events
+προόδου σε ουρά. Έτσι το Tk loop μένει ελεύθερο, και ένα crash του pipeline δεν
+ρίχνει το παράθυρο.
+
+Οι workers είναι μόνιμοι: φορτώνουν τα modules μία φορά και κρατούν στη μνήμη το
+zero template, τους header maps και την cache προφόρτωσης (modules.prefetch)
+ανάμεσα στα jobs. Το WorkerPool διαχειρίζεται
+πολλούς workers με health checks, ανακύκλωση μετά από N jobs και ομαλό τερματισμό.
+
+Events (tuples) προς τον γονέα:
+    ("ready", None, timings)        ο worker φόρτωσε τα βαριά modules
+    ("received", job_id, None)      τα δεδομένα του job διαβάστηκαν
+    ("log", job_id, text)           μήνυμα προόδου
+    ("done", job_id, result)        dict με final_path, samples, qc_summary
+    ("error", job_id, text)         αποτυχία job (ή τερματισμός του worker)
+    ("pong", token, pid)            απάντηση σε health check
+    ("frame", token, df | None)     απάντηση σε request_prefetched
+    ("retired", None, jobs)         ο worker τερματίστηκε μετά από max_jobs
+
+Batch εκτέλεση:
+    python -m modules.worker [--workers 2] [--max-jobs 20] αρχείο1.xlsx αρχείο2.xlsx ...
+"""
+import argparse
+import atexit
+import gc
+import itertools
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import time
+import traceback
+import weakref
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    from .settings import AppSettings, get_settings
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+
+
+Event = Tuple[str, Optional[str], object]
+
+_STOP = None
+PING_TIMEOUT = 10.0
+# Μέγιστη αναμονή του GUI για DataFrame από την cache προφόρτωσης του worker
+# (λίγο πάνω από το prefetch.TAKE_WAIT, την αναμονή του worker για ανάγνωση σε εξέλιξη)
+TAKE_TIMEOUT = 40.0
+_BUFFER_ALIGN = 64
+
+# Οι workers δεν είναι daemon, ώστε να μπορούν να ανοίξουν τα render processes της
+# παράλληλης απόδοσης (RENDER_WORKERS)· σταματούν στην έξοδο του γονέα
+_LIVE_WORKERS: "weakref.WeakSet[PipelineWorker]" = weakref.WeakSet()
+
+
+def _stop_live_workers():
+    for worker in list(_LIVE_WORKERS):
+        worker.stop(timeout=1.0)
+
+
+atexit.register(_stop_live_workers)
+
+
+def frame_to_shared_memory(df: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, dict]:
+    """
+    Γράφει το DataFrame σε νέο block shared memory (pickle protocol 5, out-of-band)
+
+    Τα arrays των στηλών αντιγράφονται μία φορά κατευθείαν στο block· μόνο το μικρό
+    pickle της δομής (και οι στήλες κειμένου) ταξιδεύει με την ουρά.
+
+    Returns:
+        (SharedMemory, payload για το frame_from_shared_memory)
+    """
+    buffers = []
+    header = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    layout, offset = [], 0
+    for raw in raws:
+        layout.append((offset, raw.nbytes))
+        offset += -(-raw.nbytes // _BUFFER_ALIGN) * _BUFFER_ALIGN
+    shm = shared_memory.SharedMemory(create=True, size=max(1, offset))
+    for (start, size), raw in zip(layout, raws):
+        shm.buf[start:start + size] = raw
+    return shm, {"shm": shm.name, "frame": header, "buffers": layout}
+
+
+def frame_from_shared_memory(payload: dict, unlink: bool = True
+                             ) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+    """
+    DataFrame πάνω στα buffers της shared memory (χωρίς αντίγραφο)
+
+    Τα arrays δείχνουν μέσα στο block, οπότε αυτό μένει ανοιχτό όσο ζει το DataFrame·
+    κλείνει με close_shared_memory. Με unlink=True το όνομα αφαιρείται αμέσως και η
+    μνήμη ελευθερώνεται μόλις κλείσουν όλα τα handles.
+    """
+    shm = shared_memory.SharedMemory(name=payload["shm"])
+    if unlink:
+        shm.unlink()
+    try:
+        views = [shm.buf[start:start + size] for start, size in payload["buffers"]]
+        df = pickle.loads(payload["frame"], buffers=views)
+    except Exception:
+        views = None
+        close_shared_memory(shm)
+        raise
+    return df, shm
+
+
+def close_shared_memory(shm: shared_memory.SharedMemory) -> bool:
+    """Κλείνει το block αν δεν δείχνει πια κανένα array μέσα του (True αν έκλεισε)"""
+    for attempt in range(2):
+        try:
+            shm.close()
+            return True
+        except BufferError:
+            if attempt == 0:
+                gc.collect()
+    return False
+
+
+def _worker_main(jobs: "mp.Queue", events: "mp.Queue", warm: bool = True,
+                 max_jobs: int = None):
+    """Κύριος βρόχος του worker process"""
+    timings = []
+    if warm:
+        try:
+            from .startup import timed_imports
+        except ImportError:
+            from modules.startup import timed_imports
+        timings = timed_imports()
+    try:
+        from .pipeline import run_pipeline
+        from .data_loader import parse_protocol_number, read_input
+        from .prefetch import WorkbookPrefetcher
+    except ImportError:
+        from modules.pipeline import run_pipeline
+        from modules.data_loader import parse_protocol_number, read_input
+        from modules.prefetch import WorkbookPrefetcher
+    events.put(("ready", None, timings))
+
+    prefetcher = WorkbookPrefetcher()
+    completed = 0
+    mapped: List[shared_memory.SharedMemory] = []   # blocks που χρησιμοποιούνται ακόμη
+    while True:
+        job = jobs.get()
+        if job is _STOP:
+            break
+        if "ping" in job:
+            events.put(("pong", job["ping"], os.getpid()))
+            continue
+        if "prefetch" in job:
+            prefetcher.schedule(job["prefetch"], job["settings"])
+            continue
+        if "take" in job:
+            events.put(("frame", job["token"], prefetcher.take(job["take"])))
+            continue
+
+        job_id = job["job_id"]
+        # Το prefetch δεν ανταγωνίζεται την επεξεργασία: η ανάγνωση σε εξέλιξη δεν
+        # διακόπτεται, οπότε περιμένουμε να τελειώσει πριν ξεκινήσει το pipeline
+        if prefetcher.reading:
+            events.put(("log", job_id, "⏳ Αναμονή για την προφόρτωση που είναι σε εξέλιξη..."))
+        prefetcher.cancel(wait=True)
+        try:
+            if "path" in job:
+                excel_df = read_input(job["path"], job["settings"])
+            else:
+                excel_df, shm = frame_from_shared_memory(job)
+                mapped.append(shm)
+            events.put(("received", job_id, None))
+
+            result = run_pipeline(
+                excel_df,
+                settings=job["settings"],
+                log=lambda text, _id=job_id: events.put(("log", _id, text)),
+                **job["args"],
+            )
+            events.put(("done", job_id, {
+                "final_path": result["final_path"],
+                "samples": result["samples"],
+                "qc_summary": result.get("qc_summary"),
+                "memory": result.get("memory"),
+            }))
+        except Exception as e:
+            events.put(("error", job_id, f"{e}\n{traceback.format_exc(limit=5)}"))
+
+        # Τα arrays του job δείχνουν στη shared memory: πρώτα αφήνονται, μετά κλείνει
+        excel_df = result = None
+        mapped = [shm for shm in mapped if not close_shared_memory(shm)]
+        completed += 1
+        if max_jobs and completed >= max_jobs:
+            events.put(("retired", None, completed))
+            break
+
+
+class PipelineWorker:
+    """Ένας μόνιμος worker process με ουρές jobs/events"""
+
+    def __init__(self, warm: bool = True, max_jobs: int = None, name: str = "pipeline-worker"):
+        """
+        Args:
+            warm: Φόρτωση των βαριών modules μόλις ξεκινήσει ο worker
+            max_jobs: Ανακύκλωση του process μετά από τόσα jobs (None = ποτέ)
+            name: Όνομα process (για logs / task manager)
+        """
+        # spawn: ίδια συμπεριφορά σε Windows και Linux, χωρίς fork του Tk process
+        self._ctx = mp.get_context("spawn")
+        self.warm = warm
+        self.max_jobs = max_jobs
+        self.name = name
+        self.process = None
+        self._jobs = None
+        self._events = None
+        self._pending: Dict[str, Optional[shared_memory.SharedMemory]] = {}
+        self._ids = itertools.count(1)
+        self._ping: Optional[Tuple[str, float]] = None
+        # Events που έχουν ήδη επεξεργαστεί και περιμένουν το επόμενο poll_events
+        self._backlog: List[Event] = []
+        # Αιτήματα DataFrame από την cache προφόρτωσης: token -> προθεσμία, token -> απάντηση
+        self._takes: Dict[str, float] = {}
+        self._frames: Dict[str, Optional[pd.DataFrame]] = {}
+        self.ready = False
+        self.jobs_done = 0
+        self.restarts = 0
+
+    # ---------- ΚΥΚΛΟΣ ΖΩΗΣ ----------
+
+    def start(self):
+        """Ξεκινά τον worker (αν δεν τρέχει ήδη)"""
+        if self.is_alive():
+            return
+        if self.process is not None:
+            self.restarts += 1
+            if self.process.exitcode:
+                self.kill(f"Ο worker τερματίστηκε απροσδόκητα (exit code {self.process.exitcode})")
+        if self._jobs is None:
+            self._jobs = self._ctx.Queue()
+            self._events = self._ctx.Queue()
+        self.ready = False
+        self._ping = None
+        self.process = self._ctx.Process(
+            target=_worker_main, args=(self._jobs, self._events, self.warm, self.max_jobs),
+            name=self.name, daemon=False,
+        )
+        self.process.start()
+        _LIVE_WORKERS.add(self)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    def stop(self, timeout: float = 5.0):
+        """Τερματίζει τον worker (μετά το τρέχον job)"""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self._jobs.put(_STOP)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(1)
+                self._jobs = self._events = None
+        self._fail_pending("Ο worker σταμάτησε")
+        self.process = None
+
+    def kill(self, reason: str = "Ο worker τερματίστηκε"):
+        """
+        Βίαιος τερματισμός (π.χ. worker που δεν απαντά ή έπεσε)
+
+        Οι ουρές ξαναδημιουργούνται, γιατί ένα process που σκοτώθηκε μπορεί να
+        κρατά το lock τους· τα jobs σε εξέλιξη αναφέρονται ως error στο επόμενο poll.
+        """
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+        self._backlog.extend(self._fail_pending(reason))
+        self._takes.clear()
+        self._frames.clear()
+        self._jobs = None
+        self._events = None
+
+    # ---------- JOBS ----------
+
+    def _job_args(self, protocol_number, csv_first_4, dash_part, date, initial_time,
+                  drop_zero_nutrients) -> dict:
+        return {
+            "protocol_number": protocol_number,
+            "csv_first_4": csv_first_4,
+            "dash_part": dash_part,
+            "date": date,
+            "initial_time": initial_time,
+            "drop_zero_nutrients": drop_zero_nutrients,
+        }
+
+    def _new_job_id(self) -> str:
+        return f"{os.getpid()}-{id(self):x}-{next(self._ids)}"
+
+    def submit(self, excel_df: pd.DataFrame, protocol_number: str, csv_first_4: str,
+               dash_part: str, date: str, initial_time: str,
+               drop_zero_nutrients: bool = None, settings: AppSettings = None) -> str:
+        """
+        Στέλνει job στον worker (τα ορίσματα είναι ίδια με το run_pipeline)
+
+        Returns:
+            str: job_id για αντιστοίχιση των events
+        """
+        self.start()
+        job_id = self._new_job_id()
+        shm, payload = frame_to_shared_memory(excel_df)
+        self._pending[job_id] = shm
+        self._jobs.put({
+            "job_id": job_id,
+            **payload,
+            "settings": settings or get_settings(),
+            "args": self._job_args(protocol_number, csv_first_4, dash_part, date,
+                                   initial_time, drop_zero_nutrients),
+        })
+        return job_id
+
+    def submit_file(self, path: str, protocol_number: str, csv_first_4: str,
+                    dash_part: str, date: str, initial_time: str,
+                    drop_zero_nutrients: bool = None, settings: AppSettings = None) -> str:
+        """Όπως το submit, αλλά ο worker διαβάζει ο ίδιος το Excel (για batch)"""
+        self.start()
+        job_id = self._new_job_id()
+        self._pending[job_id] = None
+        self._jobs.put({
+            "job_id": job_id,
+            "path": path,
+            "settings": settings or get_settings(),
+            "args": self._job_args(protocol_number, csv_first_4, dash_part, date,
+                                   initial_time, drop_zero_nutrients),
+        })
+        return job_id
+
+    def prefetch(self, protocol: str, settings: AppSettings = None):
+        """Προφόρτωση (μέσα στον worker) των επόμενων πιθανών αρχείων μετά το protocol"""
+        if self.is_alive():
+            self._jobs.put({"prefetch": protocol, "settings": settings or get_settings()})
+
+    def request_prefetched(self, path: str, timeout: float = TAKE_TIMEOUT) -> Optional[str]:
+        """
+        Ζητά (χωρίς αναμονή) το DataFrame του path από την cache προφόρτωσης του worker
+
+        Η απάντηση διαβάζεται με prefetched_frame από το Tk loop (root.after). Αν ο
+        worker δεν είναι έτοιμος ή τρέχει job, δεν στέλνεται αίτημα.
+
+        Args:
+            path: Το αρχείο που φορτώνει ο χρήστης
+            timeout: Δευτερόλεπτα μετά τα οποία το αίτημα θεωρείται miss
+
+        Returns:
+            str: token για το prefetched_frame, ή None (διαβάστε το αρχείο απευθείας)
+        """
+        if not self.is_alive() or not self.ready or self.busy:
+            return None
+        token = f"take-{next(self._ids)}"
+        self._takes[token] = time.monotonic() + timeout
+        self._jobs.put({"take": path, "token": token})
+        return token
+
+    def prefetched_frame(self, token: str) -> Tuple[bool, Optional[pd.DataFrame]]:
+        """
+        Ελέγχει χωρίς να μπλοκάρει αν ήρθε η απάντηση σε request_prefetched
+
+        Τα events άλλων jobs που διαβάζονται στο μεταξύ μένουν για το επόμενο poll_events.
+
+        Returns:
+            (False, None) όσο περιμένουμε· (True, DataFrame ή None) όταν τελειώσει
+            (None: cache miss, timeout ή worker εκτός λειτουργίας)
+        """
+        while self._events is not None and token not in self._frames:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if self._handle(event):
+                self._backlog.append(event)
+        if token in self._frames:
+            return True, self._frames.pop(token)
+        deadline = self._takes.get(token)
+        if deadline is None or time.monotonic() > deadline or not self.is_alive():
+            self.abandon_prefetched(token)
+            return True, None
+        return False, None
+
+    def abandon_prefetched(self, token: str):
+        """Εγκαταλείπει αίτημα request_prefetched (η καθυστερημένη απάντηση απορρίπτεται)"""
+        self._takes.pop(token, None)
+        self._frames.pop(token, None)
+
+    def ping(self):
+        """Στέλνει health check (η απάντηση έρχεται ως event 'pong')"""
+        if self.is_alive() and self._ping is None:
+            token = f"ping-{next(self._ids)}"
+            self._ping = (token, time.monotonic())
+            self._jobs.put({"ping": token})
+
+    def ping_overdue(self, timeout: float = PING_TIMEOUT) -> bool:
+        """True αν ο worker δεν απάντησε σε ping μέσα σε timeout δευτερόλεπτα"""
+        return self._ping is not None and time.monotonic() - self._ping[1] > timeout
+
+    def poll_events(self, max_events: int = 100) -> List[Event]:
+        """
+        Επιστρέφει τα διαθέσιμα events χωρίς να μπλοκάρει (για root.after polling)
+        """
+        out: List[Event] = self._backlog[:max_events]
+        del self._backlog[:len(out)]
+        if self._events is None:
+            return out
+
+        while len(out) < max_events:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if self._handle(event):
+                out.append(event)
+
+        if not out and self._pending and not self.is_alive():
+            code = self.process.exitcode if self.process is not None else None
+            out.extend(self._fail_pending(
+                f"Ο worker τερματίστηκε απροσδόκητα (exit code {code})"
+            ))
+        return out
+
+    def _handle(self, event: Event) -> bool:
+        """Ενημερώνει την κατάσταση από ένα event (False: εσωτερικό, δεν προωθείται)"""
+        kind, job_id, _ = event
+        if kind == "ready":
+            self.ready = True
+        elif kind == "received":
+            self._release(job_id)
+            return False
+        elif kind == "pong":
+            self._ping = None
+            return False
+        elif kind == "frame":
+            # Απάντηση σε request_prefetched (αγνοείται αν το αίτημα εγκαταλείφθηκε)
+            if self._takes.pop(job_id, None) is not None:
+                self._frames[job_id] = event[2]
+            return False
+        elif kind == "retired":
+            # Καθαρή έξοδος: νέο process στις ίδιες ουρές, τα jobs σε αναμονή συνεχίζουν
+            self.process.join(5)
+            self.start()
+        elif kind in ("done", "error"):
+            self._release(job_id)
+            self._pending.pop(job_id, None)
+            self.jobs_done += 1
+        return True
+
+    def _release(self, job_id: str):
+        """Κλείνει το δικό μας handle στη shared memory του job"""
+        shm = self._pending.get(job_id)
+        if shm is not None:
+            shm.close()
+            self._pending[job_id] = None
+
+    def _fail_pending(self, message: str) -> List[Event]:
+        failed = []
+        for job_id, shm in list(self._pending.items()):
+            if shm is not None:
+                shm.close()
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+            failed.append(("error", job_id, message))
+        self._pending.clear()
+        return failed
+
+
+class WorkerPool:
+    """
+    Ομάδα μόνιμων workers με την ίδια διεπαφή με τον PipelineWorker
+    (submit / submit_file / poll_events / stop)
+
+    Κάθε worker παίρνει ένα job τη φορά· τα υπόλοιπα περιμένουν στο pool.
+    """
+
+    def __init__(self, max_workers: int = 2, max_jobs_per_worker: int = 20,
+                 warm: bool = True, health_interval: float = 30.0):
+        """
+        Args:
+            max_workers: Πλήθος worker processes
+            max_jobs_per_worker: Ανακύκλωση κάθε worker μετά από τόσα jobs
+                (όριο στην αύξηση μνήμης)
+            warm: Φόρτωση των βαριών modules στην εκκίνηση κάθε worker
+            health_interval: Δευτερόλεπτα μεταξύ health checks (στο poll_events)
+        """
+        self.workers = [
+            PipelineWorker(warm=warm, max_jobs=max_jobs_per_worker, name=f"pipeline-worker-{i + 1}")
+            for i in range(max(1, max_workers))
+        ]
+        self.health_interval = health_interval
+        self._backlog: Deque[Tuple[str, str, tuple, dict]] = deque()
+        self._owner: Dict[str, Tuple[PipelineWorker, str]] = {}   # pool id -> (worker, worker job id)
+        self._by_worker_id: Dict[str, str] = {}                   # worker job id -> pool id
+        self._ids = itertools.count(1)
+        self._last_health = time.monotonic()
+        self._accepting = True
+
+    # ---------- ΚΥΚΛΟΣ ΖΩΗΣ ----------
+
+    def start(self):
+        """Ξεκινά όλους τους workers (ζέσταμα πριν το πρώτο job)"""
+        for worker in self.workers:
+            worker.start()
+
+    @property
+    def ready(self) -> bool:
+        return any(w.ready for w in self.workers)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._owner) or bool(self._backlog)
+
+    def check_health(self) -> List[str]:
+        """
+        Health check: ξαναξεκινά workers που έπεσαν ή δεν απαντούν σε ping
+
+        Returns:
+            List[str]: Μηνύματα για όσους workers ξαναξεκίνησαν
+        """
+        messages = []
+        for worker in self.workers:
+            if worker.ping_overdue():
+                messages.append(f"⚠️ {worker.name}: δεν απαντά, επανεκκίνηση")
+                worker.kill("Ο worker δεν απαντούσε και επανεκκινήθηκε")
+                worker.start()
+            elif not worker.is_alive():
+                if worker.process is not None:
+                    messages.append(f"⚠️ {worker.name}: τερματίστηκε, επανεκκίνηση")
+                    worker.kill(f"Ο worker τερματίστηκε απροσδόκητα "
+                                f"(exit code {worker.process.exitcode})")
+                worker.start()
+            elif not worker.busy:
+                worker.ping()
+        self._last_health = time.monotonic()
+        return messages
+
+    def shutdown(self, drain: bool = True, timeout: float = 60.0) -> List[Event]:
+        """
+        Τερματισμός: με drain=True ολοκληρώνονται πρώτα τα jobs σε εξέλιξη και σε αναμονή
+
+        Returns:
+            List[Event]: Τα events που εμφανίστηκαν κατά το drain
+        """
+        self._accepting = False
+        events: List[Event] = []
+        if drain:
+            deadline = time.monotonic() + timeout
+            while self.busy and time.monotonic() < deadline:
+                events.extend(self.poll_events())
+                time.sleep(0.05)
+        else:
+            self._backlog.clear()
+        for worker in self.workers:
+            worker.stop()
+        events.extend(self.poll_events())
+        return events
+
+    stop = shutdown
+
+    # ---------- JOBS ----------
+
+    def submit(self, excel_df: pd.DataFrame, *args, **kwargs) -> str:
+        """Όπως PipelineWorker.submit"""
+        return self._enqueue("submit", (excel_df,) + args, kwargs)
+
+    def submit_file(self, path: str, *args, **kwargs) -> str:
+        """Όπως PipelineWorker.submit_file"""
+        return self._enqueue("submit_file", (path,) + args, kwargs)
+
+    def prefetch(self, protocol: str, settings: AppSettings = None):
+        """Προφόρτωση στον πρώτο worker (εκεί ζει και η cache)"""
+        self.workers[0].prefetch(protocol, settings)
+
+    def request_prefetched(self, path: str, timeout: float = TAKE_TIMEOUT) -> Optional[str]:
+        """Όπως PipelineWorker.request_prefetched (στον πρώτο worker)"""
+        return self.workers[0].request_prefetched(path, timeout)
+
+    def prefetched_frame(self, token: str) -> Tuple[bool, Optional[pd.DataFrame]]:
+        """Όπως PipelineWorker.prefetched_frame"""
+        return self.workers[0].prefetched_frame(token)
+
+    def abandon_prefetched(self, token: str):
+        """Όπως PipelineWorker.abandon_prefetched"""
+        self.workers[0].abandon_prefetched(token)
+
+    def _enqueue(self, method: str, args: tuple, kwargs: dict) -> str:
+        if not self._accepting:
+            raise RuntimeError("Το worker pool τερματίζεται· δεν δέχεται νέα jobs")
+        pool_id = f"pool-{next(self._ids)}"
+        self._backlog.append((pool_id, method, args, kwargs))
+        self._dispatch()
+        return pool_id
+
+    def _dispatch(self):
+        """Αναθέτει jobs από την αναμονή σε ελεύθερους workers"""
+        for worker in self.workers:
+            if not self._backlog:
+                return
+            if worker.busy:
+                continue
+            pool_id, method, args, kwargs = self._backlog.popleft()
+            worker_id = getattr(worker, method)(*args, **kwargs)
+            self._owner[pool_id] = (worker, worker_id)
+            self._by_worker_id[worker_id] = pool_id
+
+    def poll_events(self, max_events: int = 100) -> List[Event]:
+        """Συλλέγει events από όλους τους workers (job ids του pool)"""
+        if time.monotonic() - self._last_health > self.health_interval:
+            self.check_health()
+
+        out: List[Event] = []
+        for worker in self.workers:
+            for kind, job_id, payload in worker.poll_events(max_events):
+                pool_id = self._by_worker_id.get(job_id, job_id)
+                if kind in ("done", "error") and job_id in self._by_worker_id:
+                    del self._by_worker_id[job_id]
+                    self._owner.pop(pool_id, None)
+                out.append((kind, pool_id, payload))
+        self._dispatch()
+        return out
+
+    def run_files(self, jobs: List[dict], on_event=print) -> List[dict]:
+        """
+        Εκτελεί λίστα αρχείων και περιμένει να ολοκληρωθούν όλα
+
+        Args:
+            jobs: dicts με τα ορίσματα του submit_file (path, protocol_number, ...)
+            on_event: Callback για κάθε μήνυμα (done / error)
+
+        Returns:
+            List[dict]: Με τη σειρά των jobs: {'path', 'status', 'final_path' | 'error'}
+        """
+        ids = {self.submit_file(**job): i for i, job in enumerate(jobs)}
+        results: List[Optional[dict]] = [None] * len(jobs)
+        remaining = len(jobs)
+        while remaining:
+            for kind, job_id, payload in self.poll_events():
+                index = ids.get(job_id)
+                if index is None or kind not in ("done", "error"):
+                    continue
+                name = os.path.basename(jobs[index]["path"])
+                if kind == "done":
+                    results[index] = {"path": jobs[index]["path"], "status": "done",
+                                      "final_path": payload["final_path"]}
+                    on_event(f"✅ {name} -> {payload['final_path']}")
+                else:
+                    first_line = payload.splitlines()[0] if payload else "Άγνωστο σφάλμα"
+                    results[index] = {"path": jobs[index]["path"], "status": "error",
+                                      "error": first_line}
+                    on_event(f"❌ {name}: {first_line}")
+                remaining -= 1
+            time.sleep(0.05)
+        return results
+
+
+def main():
+    try:
+        from .data_loader import parse_protocol_number
+        from .pipeline import analysis_date_for
+    except ImportError:
+        from modules.data_loader import parse_protocol_number
+        from modules.pipeline import analysis_date_for
+
+    parser = argparse.ArgumentParser(description="Batch επεξεργασία αρχείων με μόνιμους workers")
+    parser.add_argument("files", nargs="+", help="Αρχεία Excel ή CSV/TSV (NNNN-NN.xls/.xlsx/.csv/.tsv)")
+    parser.add_argument("--workers", type=int, default=2, help="Πλήθος workers")
+    parser.add_argument("--max-jobs", type=int, default=20, help="Jobs ανά worker πριν την ανακύκλωση")
+    parser.add_argument("--time", help="Αρχική ώρα HH:MM (default: DEFAULT_TIME)")
+    parser.add_argument("--date", help="Ημερομηνία ανάλυσης DD-MM (default: DEFAULT_DATE)")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    jobs = []
+    for path in args.files:
+        name = os.path.basename(path)
+        protocol = os.path.splitext(name)[0].strip()
+        try:
+            csv_first_4, dash_part = parse_protocol_number(protocol)
+            date = analysis_date_for(csv_first_4, args.date, settings,
+                                     log=lambda text: print(f"{name}: {text}"))
+        except ValueError as e:
+            parser.error(f"{name}: {e}")
+        jobs.append({
+            "path": path,
+            "protocol_number": protocol,
+            "csv_first_4": csv_first_4,
+            "dash_part": dash_part,
+            "date": date,
+            "initial_time": args.time or settings.default_time,
+            "settings": settings,
+        })
+
+    pool = WorkerPool(max_workers=min(args.workers, len(jobs)), max_jobs_per_worker=args.max_jobs)
+    start = time.perf_counter()
+    try:
+        results = pool.run_files(jobs)
+    finally:
+        pool.shutdown()
+    failed = sum(1 for r in results if r["status"] != "done")
+    print(f"🏁 {len(results) - failed}/{len(results)} αρχεία σε {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
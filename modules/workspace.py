@@ -0,0 +1,155 @@
+"""
+Module για απομονωμένους φακέλους εργασίας ανά εκτέλεση (job workspaces)
+
+Κάθε εκτέλεση παίρνει δικό της φάκελο κάτω από το PARTS_PATH με μοναδικό ID και
+lockfile, ώστε τα parts και το zero.csv δύο ταυτόχρονων εκτελέσεων (δύο παράθυρα GUI,
+watcher, batch) να μη συγκρούονται. Ο φάκελος διαγράφεται πάντα στο τέλος, και το
+τελικό αρχείο γράφεται πρώτα σε προσωρινό αρχείο και μετά μετονομάζεται ατομικά.
+"""
+import contextlib
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+import uuid
+from dataclasses import replace
+from datetime import datetime
+from typing import Iterator, List
+
+try:
+    from .settings import AppSettings, get_settings
+except ImportError:
+    from modules.settings import AppSettings, get_settings
+
+
+LOCK_NAME = ".lock"
+JOB_PREFIX = "job-"
+# Workspaces με lock παλαιότερο από αυτό θεωρούνται εγκαταλελειμμένα (crash)
+STALE_AFTER_SECONDS = 12 * 3600
+
+
+def new_job_id(label: str = "") -> str:
+    """π.χ. '20260516-103000-1605-6-3f2a9c1b'"""
+    safe = "".join(c if c.isalnum() or c in "-_+" else "-" for c in label.strip())
+    parts = [datetime.now().strftime("%Y%m%d-%H%M%S")]
+    if safe:
+        parts.append(safe[:40])
+    parts.append(uuid.uuid4().hex[:8])
+    return "-".join(parts)
+
+
+class JobWorkspace:
+    """
+    Context manager για έναν φάκελο εργασίας
+
+    Παράδειγμα:
+        with JobWorkspace(settings, label="1605-6") as ws:
+            generate_output(..., settings=ws.settings)
+    """
+
+    def __init__(self, settings: AppSettings = None, label: str = "",
+                 root: str = None, keep: bool = False):
+        """
+        Args:
+            settings: Ρυθμίσεις εφαρμογής (default: get_settings())
+            label: Κείμενο για το όνομα του φακέλου (π.χ. το πρωτόκολλο)
+            root: Γονικός φάκελος (default: PARTS_PATH)
+            keep: Αν True, ο φάκελος δεν διαγράφεται (για debugging)
+        """
+        base = settings or get_settings()
+        self.root = str(root or base.parts_path)
+        self.job_id = new_job_id(label)
+        self.path = os.path.join(self.root, JOB_PREFIX + self.job_id)
+        self.keep = keep
+        # parts και zero.csv της εκτέλεσης μέσα στον φάκελο εργασίας
+        self.settings = replace(base, parts_path=self.path, app_path=self.path)
+
+    @property
+    def lock_path(self) -> str:
+        return os.path.join(self.path, LOCK_NAME)
+
+    def __enter__(self) -> "JobWorkspace":
+        os.makedirs(self.root, exist_ok=True)
+        cleanup_stale_workspaces(self.root)
+        os.makedirs(self.path)
+        # O_EXCL: αποτυγχάνει αν κάποιος άλλος πήρε ήδη τον ίδιο φάκελο
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "job_id": self.job_id,
+                "pid": os.getpid(),
+                "host": socket.gethostname(),
+                "started": datetime.now().isoformat(),
+            }, f)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+        return False
+
+    def cleanup(self):
+        """Διαγράφει τον φάκελο εργασίας (εκτός αν keep=True)"""
+        if self.keep:
+            print(f"ℹ️ Ο φάκελος εργασίας κρατήθηκε: {self.path}")
+            return
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def cleanup_stale_workspaces(root: str, max_age: float = STALE_AFTER_SECONDS) -> List[str]:
+    """
+    Διαγράφει workspaces που έμειναν από εκτελέσεις που κατέρρευσαν
+
+    Returns:
+        List[str]: Οι φάκελοι που διαγράφηκαν
+    """
+    removed = []
+    now = time.time()
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return removed
+
+    for entry in entries:
+        if not entry.name.startswith(JOB_PREFIX) or not entry.is_dir():
+            continue
+        lock = os.path.join(entry.path, LOCK_NAME)
+        try:
+            age = now - os.path.getmtime(lock if os.path.exists(lock) else entry.path)
+        except OSError:
+            continue
+        if age > max_age:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed.append(entry.path)
+    return removed
+
+
+@contextlib.contextmanager
+def atomic_output(path: str, encoding: str = "utf-8", binary: bool = False) -> Iterator:
+    """
+    Ανοίγει προσωρινό αρχείο δίπλα στο path και το μετονομάζει ατομικά στο τέλος.
+    Σε σφάλμα το προσωρινό διαγράφεται και το υπάρχον αρχείο μένει ανέπαφο.
+
+    Args:
+        path: Τελική διαδρομή
+        encoding: Κωδικοποίηση κειμένου
+        binary: Άνοιγμα σε binary mode (π.χ. για .xlsx)
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=folder
+    )
+    try:
+        if binary:
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding=encoding, newline='')
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
@@ -1,18 +1,20 @@
 import os
-import requests
-# Import config με fallback
+
 try:
-    from . import config
+    from .settings import get_settings
 except ImportError:
-    import config
+    from modules.settings import get_settings
 
 
-def ensure_zero_file():
+def ensure_zero_file(zero_path: str = None, remote_url: str = None):
     """
     Ελέγχει αν υπάρχει το zero.xlsx.
     Αν δεν υπάρχει → το κατεβάζει από Supabase.
     """
-    zero_path = config.ZERO_PATH
+    if zero_path is None or remote_url is None:
+        settings = get_settings()
+        zero_path = zero_path or settings.zero_path
+        remote_url = remote_url or settings.zero_remote_url
     zero_dir = os.path.dirname(zero_path)
 
     # Αν υπάρχει, τελειώσαμε
@@ -24,7 +26,10 @@ def ensure_zero_file():
 
     print("⬇️  Κατέβασμα zero.xlsx από Supabase...")
 
-    r = requests.get(config.ZERO_REMOTE_URL, timeout=10)
+    # Lazy import: το requests χρειάζεται μόνο όταν λείπει το αρχείο
+    import requests
+
+    r = requests.get(remote_url, timeout=10)
     r.raise_for_status()
 
     with open(zero_path, "wb") as f:
@@ -3,22 +3,52 @@ Module για τη διαχείριση zero calibration data
 """
 import os
 import pandas as pd
-from typing import List
+from typing import Dict, List, Tuple
 
-# Import config με fallback
 try:
-    from . import config
+    from .settings import AppSettings, get_settings
     from .zero_loader import ensure_zero_file
+    from .layout import BatchLayout
 except ImportError:
-    import config
+    from modules.settings import AppSettings, get_settings
     from modules.zero_loader import ensure_zero_file
+    from modules.layout import BatchLayout
+
+
+# Cache του zero template ανά (διαδρομή, mtime): σε μόνιμους workers το Excel
+# διαβάζεται μία φορά και όχι σε κάθε εκτέλεση
+_TEMPLATE_CACHE: Dict[str, Tuple[int, pd.DataFrame]] = {}
+
+
+def load_zero_template(zero_path: str) -> pd.DataFrame:
+    """
+    Διαβάζει (ή επιστρέφει από cache) το καθαρισμένο zero template
+
+    Returns:
+        pd.DataFrame: Αντίγραφο του template (ασφαλές για τροποποίηση)
+    """
+    mtime = os.stat(zero_path).st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(zero_path)
+    if cached is None or cached[0] != mtime:
+        template = pd.read_excel(zero_path).fillna("")
+
+        # Αφαίρεση τελευταίας στήλης αν χρειάζεται
+        heads = template.columns.tolist()
+        last = heads.pop()
+        template = template.rename(columns={last: ""})
+
+        template['Date'] = template['Date'].astype(str)
+        _TEMPLATE_CACHE[zero_path] = (mtime, template)
+        cached = _TEMPLATE_CACHE[zero_path]
+    return cached[1].copy()
 
 
 class ZeroDataManager:
     """Κλάση για τη διαχείριση zero calibration data"""
 
-    def __init__(self, zero_path: str = None):
-        self.zero_path = zero_path or config.ZERO_PATH
+    def __init__(self, zero_path: str = None, settings: AppSettings = None):
+        self.settings = settings or get_settings()
+        self.zero_path = zero_path or self.settings.zero_path
         self.zero_df = None
         self.zero_copies = []
 
@@ -35,18 +65,12 @@ class ZeroDataManager:
         if not os.path.exists(self.zero_path):
             print(f"Το αρχείο zero δεν βρέθηκε: {self.zero_path}")
             print("Αυτόματη λήψη....")
-            zero_path = ensure_zero_file()
+            ensure_zero_file(self.zero_path, self.settings.zero_remote_url)
 
-        # Φόρτωση και καθαρισμός
-        self.zero_df = pd.read_excel(self.zero_path).fillna("")
-
-        # Αφαίρεση τελευταίας στήλης αν χρειάζεται
-        heads = self.zero_df.columns.tolist()
-        last = heads.pop()
-        self.zero_df = self.zero_df.rename(columns={last: ""})
+        # Φόρτωση και καθαρισμός (cache ανά mtime)
+        self.zero_df = load_zero_template(self.zero_path)
 
         # Ενημέρωση ημερομηνίας
-        self.zero_df['Date'] = self.zero_df['Date'].astype(str)
         self.zero_df.loc[self.zero_df['Date'].str.strip() != '', 'Date'] = date
 
         print(f"✅ Φορτώθηκε zero DataFrame με {len(self.zero_df)} γραμμές")
@@ -89,14 +113,15 @@ class ZeroDataManager:
             print("ℹ️ Δεν χρειάζονται zero blocks (zero_count=0) -> skip update_zero_times")
             return []
 
-        times_per_block = config.ZERO_BLOCK_ROWS
+        times_per_block = self.settings.zero_block_rows
+        row_index = list(self.settings.zero_row_index)
 
         for i, zero_copy in enumerate(self.zero_copies):
             start_idx = i * times_per_block
             end_idx = start_idx + times_per_block
             current_times = zero_times[start_idx:end_idx]
 
-            zero_copy.loc[config.ZERO_ROW_INDEX, 'Time'] = current_times
+            zero_copy.loc[row_index, 'Time'] = current_times
 
         print(f"✅ Ενημερώθηκαν χρόνοι σε {len(self.zero_copies)} zero blocks")
         return self.zero_copies
@@ -115,9 +140,10 @@ class ZeroDataManager:
         Returns:
             dict: Πληροφορίες για zero blocks
         """
-        zero_count = total_samples // config.BATCH_SIZE
-        sample_remainder = total_samples % config.BATCH_SIZE
-        total_rows = zero_count * config.ZERO_BLOCK_ROWS + total_samples
+        layout = BatchLayout.from_settings(total_samples, self.settings)
+        zero_count = layout.zero_count
+        sample_remainder = layout.last_batch_samples
+        total_rows = layout.total_rows
 
         info = {
             'zero_count': zero_count,
@@ -126,7 +152,7 @@ class ZeroDataManager:
         }
 
         print(f"📊 Zero blocks: {zero_count}")
-        print(f"📊 Υπόλοιπα δείγματα: {sample_remainder}")
+        print(f"📊 Δείγματα στο τελευταίο batch: {sample_remainder}")
         print(f"📊 Σύνολο γραμμών: {total_rows}")
 
         return info
@@ -141,13 +167,20 @@ class ZeroDataManager:
         if self.zero_df is None:
             raise ValueError("Δεν υπάρχει zero DataFrame για αποθήκευση")
 
-        output_path = output_path or os.path.join(config.APP_PATH, "zero.csv")
-        self.zero_df.to_csv(output_path, index=False, lineterminator='')
+        try:
+            from .dialect import get_dialect
+        except ImportError:
+            from modules.dialect import get_dialect
+
+        output_path = output_path or os.path.join(self.settings.app_path, "zero.csv")
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            f.write(get_dialect(self.settings).render_zero(self.zero_df))
         print(f"✅ Αποθηκεύτηκε zero CSV: {output_path}")
 
 
 def prepare_zero_data(total_samples: int, date: str,
-                      zero_times: List[str]) -> List[pd.DataFrame]:
+                      zero_times: List[str],
+                      settings: AppSettings = None) -> List[pd.DataFrame]:
     """
     Wrapper function για πλήρη προετοιμασία zero data
     
@@ -155,11 +188,12 @@ def prepare_zero_data(total_samples: int, date: str,
         total_samples: Συνολικός αριθμός δειγμάτων
         date: Ημερομηνία ανάλυσης
         zero_times: Λίστα με χρόνους για zero blocks
+        settings: Ρυθμίσεις εφαρμογής (default: get_settings())
         
     Returns:
         List[pd.DataFrame]: Λίστα με ενημερωμένα zero DataFrames
     """
-    manager = ZeroDataManager()
+    manager = ZeroDataManager(settings=settings)
 
     # Υπολογισμός πόσα zero blocks χρειάζονται
     zero_info = manager.calculate_zero_count(total_samples)
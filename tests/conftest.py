@@ -0,0 +1,23 @@
+"""Κοινά fixtures για τα tests (εκτέλεση από τη ρίζα: python -m pytest -q)"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.settings import AppSettings
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Ρυθμίσεις του config.py (χωρίς settings.json), με εξόδους μόνο στο tmp_path"""
+    return AppSettings.from_dict({
+        "APP_PATH": str(tmp_path),
+        "OUTPUT_PATH": str(tmp_path / "output"),
+        "PARTS_PATH": str(tmp_path / "parts"),
+        "ARCHIVE_SAMPLES": False,
+        "MEMORY_PROFILE": False,
+    }, base=AppSettings.from_config())
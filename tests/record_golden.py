@@ -0,0 +1,88 @@
+"""
+Καταγραφή των golden αρχείων (tests/golden) από την αρχική (baseline) υλοποίηση
+
+Για κάθε περίπτωση του GOLDEN_CASES γράφει το workbook εισόδου (<όνομα>.xlsx) και
+τρέχει σε ξεχωριστό process τη ροή της baseline έκδοσης (process_data ->
+TimeHandler -> prepare_zero_data -> generate_output), με τις ίδιες παραμέτρους που
+χρησιμοποιεί το modules.differential. Το τελικό CSV αποθηκεύεται ως <όνομα>.csv.
+
+Δύο γνωστά σφάλματα της baseline διορθώθηκαν σκόπιμα και δεν πρέπει να «κλειδωθούν»:
+  - οι ώρες και τα zero blocks υπολογίζονταν με BATCH_SIZE δείγματα ανά batch, ενώ τα
+    part files κόβονταν ανά BATCH_SIZE - 1· εδώ η baseline τρέχει τον υπολογισμό των
+    ωρών / zero blocks με BATCH_SIZE - 1 (το ενιαίο BatchLayout), και τα υπόλοιπα
+    (μορφοποίηση, διάταξη, ονόματα) μένουν ακριβώς όπως ήταν,
+  - οι γραμμές με μηδενικά nutrients αφαιρούνταν μετά τον υπολογισμό των ωρών, οπότε
+    οι περιπτώσεις δεν έχουν τέτοιες γραμμές.
+
+Εκτέλεση (από τη ρίζα του repo):
+    git worktree add /tmp/baseline <baseline commit>
+    python tests/record_golden.py /tmp/baseline
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules.differential import (ANALYSIS_DATE, GOLDEN_CASES, GOLDEN_DIR, GOLDEN_PROTOCOL,
+                                  INITIAL_TIME, generate_workbook)
+
+
+_BASELINE_RUN = """
+import os, sys
+baseline, source, out = sys.argv[1:4]
+sys.path.insert(0, baseline)
+import config
+config.PARTS_PATH = os.path.join(out, "parts")
+config.FINAL_OUTPUT_PATH = os.path.join(out, "final.csv")
+config.ZERO_PATH = os.path.join(baseline, "zero", "zero.xlsx")
+config.APP_PATH = out
+config.OUTPUT_PATH = out
+import pandas as pd
+from modules.data_processor import process_data
+from modules.time_handler import TimeHandler, MetadataGenerator
+from modules.zero_manager import prepare_zero_data
+from modules.output_generator import generate_output
+protocol, date, initial_time = sys.argv[4:7]
+processed = process_data(pd.read_excel(source))
+batch_size = config.BATCH_SIZE
+config.BATCH_SIZE = batch_size - 1
+handler = TimeHandler(len(processed))
+sample_ids = handler.generate_sample_ids(protocol[:4], protocol[4:])
+sample_times, zero_times = handler.generate_sample_times(initial_time)
+metadata = MetadataGenerator.generate_metadata(len(processed), date)
+metadata.update(protocol_number=protocol, sample_ids=sample_ids,
+                sample_times=sample_times, zero_times=zero_times)
+zero_dfs = prepare_zero_data(len(processed), date, zero_times)
+config.BATCH_SIZE = batch_size
+print("GOLDEN:" + generate_output(processed, metadata, zero_dfs))
+"""
+
+
+def record(baseline: str, directory: str = GOLDEN_DIR):
+    os.makedirs(directory, exist_ok=True)
+    for name, rows, seed in GOLDEN_CASES:
+        source = os.path.join(directory, f"{name}.xlsx")
+        generate_workbook(rows, seed, zero_nutrients=False).to_excel(source, index=False)
+        with tempfile.TemporaryDirectory() as out:
+            run = subprocess.run(
+                [sys.executable, "-c", _BASELINE_RUN, baseline, source, out,
+                 GOLDEN_PROTOCOL, ANALYSIS_DATE, INITIAL_TIME],
+                capture_output=True, text=True, encoding="utf-8", cwd=out,
+            )
+            paths = [l[len("GOLDEN:"):] for l in run.stdout.splitlines() if l.startswith("GOLDEN:")]
+            if run.returncode or not paths:
+                raise SystemExit(f"❌ {name}: η baseline απέτυχε\n{run.stdout[-2000:]}\n{run.stderr[-2000:]}")
+            with open(paths[-1], "rb") as f:
+                data = f.read()
+        with open(os.path.join(directory, f"{name}.csv"), "wb") as f:
+            f.write(data)
+        print(f"✅ {name}: {rows} γραμμές, {len(data)} bytes")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        raise SystemExit(__doc__)
+    record(os.path.abspath(sys.argv[1]))
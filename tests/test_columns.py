@@ -0,0 +1,51 @@
+import pandas as pd
+
+from modules.columns import HeaderResolver, normalize_header, resolve_columns
+
+INSTRUMENT = ["a/a", "Unnamed: 1", "PH", "fat", "proteine", "lactose ", "freeze point", "syal"]
+
+
+def test_normalize_header():
+    assert normalize_header("  Freeze   Point ") == "freeze point"
+    assert normalize_header("PH") == "ph"
+
+
+def test_resolve_instrument_headers():
+    resolution = HeaderResolver().resolve(INSTRUMENT)
+    assert resolution.names == ("a/a", "pH", "Fat", "Protein", "Lactose", "FPD", "syal")
+    assert resolution.dropped == ("Unnamed: 1",)
+    assert resolution.source_for("FPD") == "freeze point"
+    assert resolution.source_for("Missing") is None
+
+
+def test_keeps_known_column_after_aa():
+    resolution = HeaderResolver().resolve(["a/a", "pH", "Fat"])
+    assert resolution.names == ("a/a", "pH", "Fat")
+    assert resolution.dropped == ()
+
+
+def test_drop_and_extra_renames():
+    resolver = HeaderResolver(extra_renames={"Butterfat": "Fat"}, drop=["Syal"],
+                              drop_after_aa=False)
+    resolution = resolver.resolve(["a/a", "Unnamed: 1", "BUTTERFAT", "syal"])
+    assert resolution.names == ("a/a", "Unnamed: 1", "Fat")
+    assert resolution.dropped == ("syal",)
+
+
+def test_duplicates_keep_first():
+    resolution = HeaderResolver().resolve(["Fat", "fat ", "pH"])
+    assert resolution.names == ("Fat", "pH")
+    assert resolution.duplicates == ("fat ",)
+
+
+def test_signature_cache():
+    resolver = HeaderResolver()
+    assert resolver.resolve(INSTRUMENT) is resolver.resolve(list(INSTRUMENT))
+
+
+def test_resolve_columns_applies_resolution(settings):
+    df = pd.DataFrame([[1, "x", 6.6, 3.5, 3.2, 4.8, -0.52, 0]], columns=INSTRUMENT)
+    out = resolve_columns(df, settings)
+    # το syal είναι στο COLS_TO_DELETE
+    assert list(out.columns) == ["a/a", "pH", "Fat", "Protein", "Lactose", "FPD"]
+    assert out["FPD"].tolist() == [-0.52]
@@ -0,0 +1,30 @@
+"""Golden έλεγχος: η τρέχουσα έξοδος πρέπει να είναι ίδια bytes με την baseline"""
+from dataclasses import replace
+
+import pytest
+
+from modules.data_loader import read_input
+from modules.differential import (GOLDEN_CASES, GOLDEN_PROTOCOL, generate_workbook,
+                                  golden_cases, run_differential)
+
+GOLDEN = golden_cases()
+
+
+def test_golden_files_present():
+    assert [name for name, _, _ in GOLDEN] == [name for name, _, _ in GOLDEN_CASES]
+
+
+@pytest.mark.parametrize("fixed_point", [True, False])
+@pytest.mark.parametrize("name, source, expected", GOLDEN, ids=[g[0] for g in GOLDEN])
+def test_matches_baseline(settings, name, source, expected, fixed_point):
+    settings = replace(settings, fixed_point_nutrients=fixed_point)
+    report = run_differential(read_input(source, settings), name, GOLDEN_PROTOCOL,
+                              settings, quiet=True, expected=expected)
+    assert report.ok, report.format()
+
+
+@pytest.mark.parametrize("rows", [1, 86, 87, 300])
+def test_fast_paths_agree(settings, rows):
+    report = run_differential(generate_workbook(rows, seed=rows), f"συνθετικό-{rows}",
+                              settings=settings, quiet=True)
+    assert report.ok, report.format()
@@ -0,0 +1,78 @@
+from dataclasses import replace
+
+import pytest
+
+from modules.layout import BatchLayout
+
+
+def layout(n):
+    return BatchLayout(num_samples=n, samples_per_batch=86,
+                       zero_block_rows=8, sample_increment=45, zero_increment=20)
+
+
+def test_from_settings_uses_batch_size_minus_header(settings):
+    plan = BatchLayout.from_settings(10, replace(settings, batch_size=87))
+    assert plan.samples_per_batch == 86
+    assert BatchLayout.from_settings(10, replace(settings, batch_size=1)).samples_per_batch == 1
+
+
+@pytest.mark.parametrize("n, batches, zeros, last", [
+    (0, 0, 0, 0), (1, 1, 0, 1), (86, 1, 0, 86), (87, 2, 1, 1), (172, 2, 1, 86), (300, 4, 3, 42),
+])
+def test_sizes(n, batches, zeros, last):
+    plan = layout(n)
+    assert (plan.num_batches, plan.zero_count, plan.last_batch_samples) == (batches, zeros, last)
+    assert plan.total_rows == n + zeros * 8
+
+
+def test_segments_cover_all_samples():
+    plan = layout(300)
+    segments = list(plan.iter_segments())
+    assert segments[0] == (0, 0, 86, 0)
+    assert segments[-1] == (3, 258, 300, None)
+    assert sum(stop - start for _, start, stop, _ in segments) == 300
+
+
+def test_row_at_matches_segments():
+    plan = layout(200)
+    rows = [plan.row_at(r) for r in range(plan.total_rows)]
+    assert rows[85] == ("sample", 85, -1)
+    assert rows[86] == ("zero", 0, 0)
+    assert rows[93] == ("zero", 0, 7)
+    assert rows[94] == ("sample", 86, -1)
+    assert [r[1] for r in rows if r[0] == "sample"] == list(range(200))
+    with pytest.raises(IndexError):
+        plan.row_at(plan.total_rows)
+
+
+def test_offsets_match_scalar_versions():
+    plan = layout(200)
+    assert plan.sample_offsets().tolist() == [plan.sample_offset(i) for i in range(200)]
+    assert plan.zero_offsets().tolist() == [
+        plan.zero_offset(k, j) for k in range(plan.zero_count) for j in range(8)
+    ]
+
+
+def test_times_are_interleaved_in_file_order():
+    plan = layout(87)
+    samples = plan.sample_times("08:00")
+    zeros = plan.zero_times("08:00")
+    assert samples[0] == "08:00"          # 45"
+    assert samples[85] == "09:04"         # 86 × 45" = 64:30
+    assert zeros[0] == "09:04"            # + 20"
+    assert zeros[-1] == "09:07"           # + 8 × 20" = 67:10
+    assert samples[86] == "09:07"         # + 45" = 67:55
+
+
+def test_times_wrap_at_midnight():
+    assert layout(2).sample_times("23:59") == ["23:59", "00:00"]
+
+
+@pytest.mark.parametrize("n, workers", [(1, 2), (300, 2), (300, 3), (3000, 4), (300, 8)])
+def test_segment_ranges_are_contiguous_and_ordered(n, workers):
+    from modules.output_generator import split_segment_ranges
+
+    bounds = [(start, stop) for _, start, stop, _ in layout(n).iter_segments()]
+    groups = split_segment_ranges(bounds, workers)
+    assert 1 <= len(groups) <= workers
+    assert [b for group in groups for b in group] == bounds
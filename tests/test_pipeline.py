@@ -0,0 +1,44 @@
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from modules.pipeline import analysis_date_for
+
+
+def resolve(csv_first_4, date=None, settings=None):
+    lines = []
+    return analysis_date_for(csv_first_4, date, settings, log=lines.append), lines
+
+
+def test_explicit_date_wins(settings):
+    date, lines = resolve("1605", " 03-04 ", replace(settings, default_date="protocol"))
+    assert date == "03-04"
+    assert lines == ["📅 Ημερομηνία ανάλυσης 03-04 (ρητή)"]
+
+
+def test_requires_date_or_default(settings):
+    with pytest.raises(ValueError, match="DEFAULT_DATE"):
+        resolve("1605", settings=replace(settings, default_date=""))
+
+
+@pytest.mark.parametrize("default, expected", [
+    ("20-06", "20-06"),
+    ("protocol", "16-05"),
+    ("today", datetime.now().strftime("%d-%m")),
+])
+def test_default_date_sources(settings, default, expected):
+    date, lines = resolve("1605", settings=replace(settings, default_date=default))
+    assert date == expected
+    assert "DEFAULT_DATE" in lines[0]
+
+
+@pytest.mark.parametrize("csv_first_4", ["1399", "3202", "0000"])
+def test_rejects_protocol_digits_that_are_not_a_date(settings, csv_first_4):
+    with pytest.raises(ValueError, match="Μη έγκυρη ημερομηνία"):
+        resolve(csv_first_4, settings=replace(settings, default_date="protocol"))
+
+
+def test_rejects_invalid_explicit_date(settings):
+    with pytest.raises(ValueError, match="31-02"):
+        resolve("1605", "31-02", settings)
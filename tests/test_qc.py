@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from modules.formatting import FIXED_POINT_ATTR
+from modules.qc import DEFAULT_RULES, QCRule, evaluate_qc, qc_remarks, qc_summary
+
+
+def frame(**columns):
+    return pd.DataFrame(columns)
+
+
+def test_rule_mask_ignores_nan():
+    rule = QCRule("PH", "pH", 0, 3, 6)
+    assert rule.mask(np.array([2.9, 3.0, 6.0, 6.1, np.nan])).tolist() == [True, False, False, True, False]
+    assert rule.describe() == "3 ≤ pH ≤ 6"
+    assert QCRule("FPD", "FPD", 4, None, 0).describe() == "FPD ≤ 0"
+
+
+def test_evaluate_sets_one_bit_per_rule():
+    df = frame(Fat=[3.5, 11.0, -1.0], Protein=[3.2, 3.2, 7.0], Lactose=[4.8, 4.8, 4.8],
+               pH=[6.6, 6.0, 2.0], FPD=[-0.52, 0.1, -0.5])
+    flags = evaluate_qc(df)
+    assert flags.name == "QC" and flags.dtype == np.uint8
+    fat, protein, _, ph, fpd = (r.flag for r in DEFAULT_RULES)
+    assert flags.tolist() == [ph, fat | fpd, fat | protein | ph]
+
+
+def test_missing_columns_and_text_values():
+    flags = evaluate_qc(frame(Fat=["abc", "12", None]))
+    assert flags.tolist() == [0, DEFAULT_RULES[0].flag, 0]
+
+
+def test_fixed_point_columns_are_scaled():
+    df = frame(Fat=pd.array([35, 105], dtype="Int32"))
+    df.attrs[FIXED_POINT_ATTR] = {"Fat": 1}
+    assert evaluate_qc(df).tolist() == [0, DEFAULT_RULES[0].flag]
+
+
+def test_summary_and_remarks():
+    df = frame(Fat=[11.0, 3.5, 11.0], pH=[2.0, 4.0, 4.0])
+    flags = evaluate_qc(df)
+    summary = qc_summary(flags)
+    assert list(summary.columns) == ["Κανόνας", "Όριο", "Γραμμές"]
+    assert dict(zip(summary["Κανόνας"], summary["Γραμμές"])) == {
+        "FAT": 2, "PROTEIN": 0, "LACTOSE": 0, "PH": 1, "FPD": 0,
+    }
+    assert qc_remarks(flags) == ["QC:FAT,PH", "", "QC:FAT"]
+    assert qc_remarks(flags, existing=["old", "old", ""]) == ["old QC:FAT,PH", "old", "QC:FAT"]
@@ -0,0 +1,70 @@
+import json
+import os
+from dataclasses import replace
+
+import pytest
+
+from modules.settings import AppSettings, SettingsStore
+
+
+def test_from_config_validates():
+    AppSettings.from_config().validate()
+
+
+def test_from_dict_coerces_case_insensitive_keys():
+    base = AppSettings.from_config()
+    settings = AppSettings.from_dict({"batch_size": "50", "OUTPUT_XLSX": "yes",
+                                      "Drop_Zero_Nutrients": "off", "UNKNOWN": 1}, base=base)
+    assert settings.batch_size == 50
+    assert settings.output_xlsx is True
+    assert settings.drop_zero_nutrients is False
+    assert replace(settings, batch_size=base.batch_size, output_xlsx=base.output_xlsx,
+                   drop_zero_nutrients=base.drop_zero_nutrients) == base
+
+
+def test_round_trip():
+    base = AppSettings.from_config()
+    data = json.loads(json.dumps(base.to_dict()))
+    assert all(key.isupper() for key in data)
+    assert AppSettings.from_dict(data, base=base) == base
+
+
+@pytest.mark.parametrize("values, message", [
+    ({"BATCH_SIZE": 0}, "BATCH_SIZE"),
+    ({"DEFAULT_TIME": "25:00"}, "DEFAULT_TIME"),
+    ({"ZERO_BLOCK_ROWS": 3}, "ZERO_ROW_INDEX"),
+    ({"OUTPUT_DIALECT": "nope"}, "OUTPUT_DIALECT"),
+    ({"BASE_PATH": " "}, "BASE_PATH"),
+    ({"DEFAULT_DATE": "32-01"}, "DEFAULT_DATE"),
+])
+def test_validate_rejects(values, message):
+    with pytest.raises(ValueError, match=message):
+        AppSettings.from_dict(values, base=AppSettings.from_config())
+
+
+def test_store_saves_only_changes_and_reloads_on_mtime(tmp_path):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path)
+    assert store.load() == AppSettings.from_config()
+
+    saved = store.save({"BATCH_SIZE": 40})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"BATCH_SIZE": 40}
+    assert store.load() is saved
+    assert SettingsStore(path).load().batch_size == 40
+
+    path.write_text(json.dumps({"BATCH_SIZE": 30}), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert store.load().batch_size == 30
+
+
+def test_store_invalid_file_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert SettingsStore(path).load() == AppSettings.from_config()
+
+
+def test_store_rejects_invalid_values(tmp_path):
+    store = SettingsStore(tmp_path / "settings.json")
+    with pytest.raises(ValueError):
+        store.save({"BATCH_SIZE": -1})
+    assert not (tmp_path / "settings.json").exists()